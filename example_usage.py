@@ -9,8 +9,8 @@ import asyncio
 import json
 from pathlib import Path
 
+import orjson
 from rich.console import Console
-from rich.table import Table
 
 from src.collectors.collector_manager import CollectorManager
 from src.graph.builder import GraphBuilder
@@ -50,15 +50,21 @@ async def main():
         console.print(f"Total resources discovered: {summary['total_resources']}")
         console.print(f"Regions scanned: {summary['total_regions']}\n")
 
-        # Show resources by type
-        table = Table(title="Resources by Type")
-        table.add_column("Resource Type", style="cyan")
-        table.add_column("Count", style="green", justify="right")
+        # Show resources by type; tables are only worth laying out for a
+        # terminal, so redirected output gets a single JSON line instead
+        if console.is_terminal:
+            from rich.table import Table
 
-        for resource_type, count in summary["resources_by_type"].items():
-            table.add_row(resource_type, str(count))
+            table = Table(title="Resources by Type")
+            table.add_column("Resource Type", style="cyan")
+            table.add_column("Count", style="green", justify="right")
 
-        console.print(table)
+            for resource_type, count in summary["resources_by_type"].items():
+                table.add_row(resource_type, str(count))
+
+            console.print(table)
+        else:
+            print(orjson.dumps(summary["resources_by_type"]).decode())
 
         # Step 2: Build topology graph
         console.print("\n[bold]Step 2: Building network topology graph...[/bold]")
@@ -74,9 +80,8 @@ async def main():
 
         # Export graph to JSON
         output_file = Path("topology_graph.json")
-        with open(output_file, "w") as f:
-            graph_data = builder.export_to_dict(network_graph)
-            json.dump(graph_data, f, indent=2, default=str)
+        with open(output_file, "wb") as f:
+            builder.write_json(network_graph, f)
 
         console.print(f"[green]Topology saved to {output_file}[/green]")
 
@@ -139,17 +144,26 @@ async def main():
 
         # Display anomalies by severity
         if report["total_anomalies"] > 0:
-            table = Table(title="Anomalies by Severity")
-            table.add_column("Severity", style="cyan")
-            table.add_column("Count", style="yellow", justify="right")
-
-            for severity, count in report["by_severity"].items():
-                if count > 0:
-                    style = "red" if severity == "critical" or severity == "high" else "yellow"
-                    table.add_row(f"[{style}]{severity}[/{style}]", str(count))
-
-            console.print("\n")
-            console.print(table)
+            if console.is_terminal:
+                from rich.table import Table
+
+                table = Table(title="Anomalies by Severity")
+                table.add_column("Severity", style="cyan")
+                table.add_column("Count", style="yellow", justify="right")
+
+                for severity, count in report["by_severity"].items():
+                    if count > 0:
+                        style = "red" if severity == "critical" or severity == "high" else "yellow"
+                        table.add_row(f"[{style}]{severity}[/{style}]", str(count))
+
+                console.print("\n")
+                console.print(table)
+            else:
+                print(
+                    orjson.dumps(
+                        {s: c for s, c in report["by_severity"].items() if c > 0}
+                    ).decode()
+                )
 
             # Display sample anomalies
             console.print("\n[bold]Sample Anomalies:[/bold]")
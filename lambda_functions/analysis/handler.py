@@ -9,7 +9,11 @@ import asyncio
 import json
 import os
 import sys
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+import orjson
+import zstandard
 
 # Add src to path
 sys.path.insert(0, "/opt/python")
@@ -19,7 +23,8 @@ from src.ai_analysis.anomaly_detector import AnomalyDetector
 from src.collectors.collector_manager import CollectorManager
 from src.core.logging import setup_logging, get_logger, set_request_id
 from src.graph.analyzer import GraphAnalyzer
-from src.graph.builder import GraphBuilder
+from src.graph.builder import GraphBuilder, NetworkGraph
+from src.observability.metrics import flush_metrics
 from src.storage.dynamodb_repository import DynamoDBRepository
 from src.storage.s3_repository import S3Repository
 
@@ -27,6 +32,69 @@ from src.storage.s3_repository import S3Repository
 setup_logging()
 logger = get_logger(__name__)
 
+# Initialize repositories and graph builder once per container so warm
+# invocations reuse their boto3 sessions and clients
+dynamodb_repo = DynamoDBRepository()
+s3_repo = S3Repository()
+builder = GraphBuilder()
+
+# Analysis reports are stored zstd-compressed (ContentEncoding: zstd)
+zstd_compressor = zstandard.ZstdCompressor(level=3)
+
+# Reuse one event loop across warm invocations instead of creating and
+# closing a new loop with asyncio.run() each time
+event_loop = asyncio.new_event_loop()
+asyncio.set_event_loop(event_loop)
+
+
+def _discover_and_build(regions: List[str]) -> NetworkGraph:
+    """
+    Run discovery for the given regions and build the topology graph.
+
+    Runs on a worker thread with its own event loop, so it can be used
+    when the calling thread already has a running event loop. The caller
+    blocks until it finishes, so the module's graph builder is reused.
+
+    Args:
+        regions: AWS regions to discover
+
+    Returns:
+        NetworkGraph built from the discovered resources
+    """
+    manager = CollectorManager(regions=regions)
+    results = asyncio.run(manager.collect_all())
+    return builder.build_graph(results)
+
+
+def _run_discovery(regions: List[str]) -> NetworkGraph:
+    """
+    Discover resources and build the topology graph.
+
+    Uses the module event loop on the normal Lambda path. When invoked
+    from code that already has a running event loop (which would make
+    run_until_complete fail), discovery runs on a single worker thread
+    instead; a worker process would need /dev/shm, which Lambda lacks,
+    and would pickle the whole graph back to the caller.
+
+    Args:
+        regions: AWS regions to discover
+
+    Returns:
+        NetworkGraph built from the discovered resources
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        manager = CollectorManager(regions=regions)
+        results = event_loop.run_until_complete(
+            manager.collect_all(close_clients=False)
+        )
+        return builder.build_graph(results)
+
+    logger.info("Event loop already running, running discovery in a worker thread")
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(_discover_and_build, regions).result()
+
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
@@ -55,29 +123,19 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         # Option 1: Load from storage
         if vpc_id:
             logger.info(f"Loading topology for {region}/{vpc_id}")
-            dynamodb_repo = DynamoDBRepository()
             topology_record = dynamodb_repo.get_latest_topology(region, vpc_id)
 
             if not topology_record:
                 raise ValueError(f"No topology found for {region}/{vpc_id}")
 
-            topology_data = topology_record["topology_data"]
-
-            # Rebuild graph from stored data
-            # Note: In production, implement graph deserialization
-            manager = CollectorManager(regions=[region])
-            results = asyncio.run(manager.collect_all())
+            # Rebuild graph from stored data instead of re-running discovery
+            network_graph = builder.from_dict(topology_record["topology_data"])
 
         # Option 2: Run fresh discovery
         else:
             logger.info("Running fresh discovery for analysis")
             regions = event.get("regions", [region])
-            manager = CollectorManager(regions=regions)
-            results = asyncio.run(manager.collect_all())
-
-        # Build graph
-        builder = GraphBuilder()
-        network_graph = builder.build_graph(results)
+            network_graph = _run_discovery(regions)
 
         # Analyze topology
         analyzer = GraphAnalyzer(network_graph)
@@ -92,7 +150,6 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         report = detector.generate_report(anomalies)
 
         # Store analysis results in S3
-        s3_repo = S3Repository()
         analysis_data = {
             "analysis": analysis,
             "anomaly_report": report,
@@ -107,8 +164,18 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         s3_repo.client.put_object(
             Bucket=s3_repo.bucket_name,
             Key=key,
-            Body=json.dumps(analysis_data, indent=2, default=str),
+            Body=zstd_compressor.compress(
+                orjson.dumps(analysis_data, default=str, option=orjson.OPT_NON_STR_KEYS)
+            ),
             ContentType="application/json",
+            ContentEncoding="zstd",
+        )
+
+        # Point latest.json at this analysis so readers skip listing the prefix
+        s3_repo.client.copy_object(
+            Bucket=s3_repo.bucket_name,
+            Key=f"{key.rsplit('/', 1)[0]}/latest.json",
+            CopySource={"Bucket": s3_repo.bucket_name, "Key": key},
         )
 
         logger.info(
@@ -147,6 +214,10 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             ),
         }
 
+    finally:
+        # Publish this invocation's metrics before the container is frozen
+        flush_metrics()
+
 
 # For local testing
 if __name__ == "__main__":
@@ -7,25 +7,54 @@ This function provides a REST API for querying topology data.
 import json
 import os
 import sys
+from functools import lru_cache
 from typing import Any, Dict
 
+import orjson
+from cachetools import TTLCache
+
 # Add src to path
 sys.path.insert(0, "/opt/python")
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../"))
 
 from src.core.logging import setup_logging, get_logger, set_request_id
-from src.storage.dynamodb_repository import DynamoDBRepository
-from src.storage.s3_repository import S3Repository
-from src.storage.cache_repository import CacheRepository
 
 # Initialize logging
 setup_logging()
 logger = get_logger(__name__)
 
-# Initialize repositories
-dynamodb_repo = DynamoDBRepository()
-s3_repo = S3Repository()
-cache_repo = CacheRepository()
+
+# Repositories are imported and created on first use so routes that don't
+# touch storage (/health, 404s) never pay for importing boto3
+
+
+@lru_cache(maxsize=None)
+def _dynamodb_repo():
+    """Get the shared DynamoDB repository."""
+    from src.storage.dynamodb_repository import DynamoDBRepository
+
+    return DynamoDBRepository()
+
+
+@lru_cache(maxsize=None)
+def _s3_repo():
+    """Get the shared S3 repository."""
+    from src.storage.s3_repository import S3Repository
+
+    return S3Repository()
+
+
+@lru_cache(maxsize=None)
+def _cache_repo():
+    """Get the shared cache repository."""
+    from src.storage.cache_repository import CacheRepository
+
+    return CacheRepository()
+
+
+# Process-local cache of latest topologies keyed by (region, vpc_id); warm
+# containers answer repeated requests without a Redis or DynamoDB round-trip
+local_topology_cache: TTLCache = TTLCache(maxsize=256, ttl=30)
 
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -79,6 +108,13 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             500, {"error": f"Internal server error: {str(e)}", "request_id": request_id}
         )
 
+    finally:
+        # Publish this invocation's metrics before the container is frozen;
+        # metrics are only loaded once a repository has been used
+        metrics = sys.modules.get("src.observability.metrics")
+        if metrics is not None:
+            metrics.flush_metrics()
+
 
 def handle_topology_request(
     path_params: Dict[str, str],
@@ -96,7 +132,21 @@ def handle_topology_request(
     # Check if history is requested
     if "history" in query_params or path_params.get("action") == "history":
         limit = int(query_params.get("limit", 10))
-        history = dynamodb_repo.get_topology_history(region, vpc_id, limit)
+        # Fetch only the counts; topology_data itself can be very large.
+        # Records written before node_count/edge_count were stored at the
+        # top level only have the nested copies.
+        history = _dynamodb_repo().get_topology_history(
+            region,
+            vpc_id,
+            limit,
+            projection=[
+                "SK",
+                "node_count",
+                "edge_count",
+                "topology_data.node_count",
+                "topology_data.edge_count",
+            ],
+        )
 
         return create_response(
             200,
@@ -106,8 +156,14 @@ def handle_topology_request(
                 "history": [
                     {
                         "timestamp": item["SK"],
-                        "node_count": item["topology_data"].get("node_count", 0),
-                        "edge_count": item["topology_data"].get("edge_count", 0),
+                        "node_count": item.get(
+                            "node_count",
+                            item.get("topology_data", {}).get("node_count", 0),
+                        ),
+                        "edge_count": item.get(
+                            "edge_count",
+                            item.get("topology_data", {}).get("edge_count", 0),
+                        ),
                     }
                     for item in history
                 ],
@@ -116,8 +172,12 @@ def handle_topology_request(
         )
 
     # Get latest topology
-    # Try cache first
-    cached = cache_repo.get_cached_topology(region, vpc_id)
+    # Try the process-local cache, then the shared cache
+    cached = local_topology_cache.get((region, vpc_id))
+    if cached is None:
+        cached = _cache_repo().get_cached_topology(region, vpc_id)
+        if cached:
+            local_topology_cache[(region, vpc_id)] = cached
     if cached:
         logger.info("Returning cached topology")
         return create_response(
@@ -125,13 +185,14 @@ def handle_topology_request(
         )
 
     # Load from DynamoDB
-    topology = dynamodb_repo.get_latest_topology(region, vpc_id)
+    topology = _dynamodb_repo().get_latest_topology(region, vpc_id)
 
     if not topology:
         return create_response(404, {"error": "Topology not found"})
 
     # Cache the result
-    cache_repo.cache_topology(region, vpc_id, topology["topology_data"])
+    local_topology_cache[(region, vpc_id)] = topology["topology_data"]
+    _cache_repo().cache_topology(region, vpc_id, topology["topology_data"])
 
     return create_response(
         200,
@@ -158,27 +219,18 @@ def handle_analysis_request(
     if not region or not vpc_id:
         return create_response(400, {"error": "Missing region or vpc_id"})
 
-    # List analyses for this VPC
-    objects = s3_repo.list_topologies(region, vpc_id)
-
-    # Filter for analysis files
-    analysis_files = [obj for obj in objects if "analyses/" in obj["key"]]
+    # Read the latest analysis pointer for this VPC
+    latest = _s3_repo().get_latest_analysis(region, vpc_id)
 
-    if not analysis_files:
+    if not latest:
         return create_response(404, {"error": "No analyses found"})
 
-    # Get the latest
-    latest = max(analysis_files, key=lambda x: x["last_modified"])
-
-    # Download the analysis
-    analysis_data = s3_repo.download_topology(latest["key"])
-
     return create_response(
         200,
         {
             "region": region,
             "vpc_id": vpc_id,
-            "analysis": analysis_data,
+            "analysis": latest["data"],
             "timestamp": latest["last_modified"].isoformat(),
             "request_id": request_id,
         },
@@ -195,7 +247,9 @@ def create_response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
             "Access-Control-Allow-Headers": "Content-Type",
             "Access-Control-Allow-Methods": "GET,POST,OPTIONS",
         },
-        "body": json.dumps(body, default=str),
+        "body": orjson.dumps(
+            body, default=str, option=orjson.OPT_NON_STR_KEYS
+        ).decode(),
     }
 
 
@@ -9,16 +9,18 @@ import asyncio
 import json
 import os
 import sys
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 # Add src to path
 sys.path.insert(0, "/opt/python")  # Lambda layer
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../"))
 
+from src.collectors.base import CollectorResult
 from src.collectors.collector_manager import CollectorManager
 from src.core.config import get_settings
 from src.core.logging import setup_logging, get_logger, set_request_id
 from src.graph.builder import GraphBuilder
+from src.observability.metrics import flush_metrics
 from src.storage.dynamodb_repository import DynamoDBRepository
 from src.storage.s3_repository import S3Repository
 
@@ -26,6 +28,17 @@ from src.storage.s3_repository import S3Repository
 setup_logging()
 logger = get_logger(__name__)
 
+# Initialize repositories and graph builder once per container so warm
+# invocations reuse their boto3 sessions and clients
+dynamodb_repo = DynamoDBRepository()
+s3_repo = S3Repository()
+builder = GraphBuilder()
+
+# Reuse one event loop across warm invocations instead of creating and
+# closing a new loop with asyncio.run() each time
+event_loop = asyncio.new_event_loop()
+asyncio.set_event_loop(event_loop)
+
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
@@ -53,45 +66,46 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         if "regions" in event:
             regions = event["regions"]
 
-        # Run discovery
+        # Discover every region in one run on the container's event loop;
+        # the collectors of all regions run concurrently, and the loop's
+        # async clients stay open for the next warm invocation
         manager = CollectorManager(regions=regions)
-        results = asyncio.run(manager.collect_all())
+        results: Dict[str, List[CollectorResult]] = event_loop.run_until_complete(
+            manager.collect_all(close_clients=False)
+        )
 
         # Build graph
-        builder = GraphBuilder()
         network_graph = builder.build_graph(results)
 
         # Get summary
-        summary = manager.get_summary(results)
-
-        # Store results
-        dynamodb_repo = DynamoDBRepository()
-        s3_repo = S3Repository()
+        summary = CollectorManager.get_summary(results)
 
         # Export graph
         graph_data = builder.export_to_dict(network_graph)
 
-        # Store in DynamoDB and S3
-        for region, region_results in results.items():
-            for result in region_results:
-                if result.success and result.resource_type.value == "vpc":
-                    for vpc in result.resources:
-                        vpc_id = vpc["id"]
-
-                        # Save to DynamoDB
-                        dynamodb_repo.save_topology(
-                            region=region,
-                            vpc_id=vpc_id,
-                            topology_data=graph_data,
-                            metadata=summary,
-                        )
-
-                        # Save to S3
-                        s3_repo.upload_topology(
-                            region=region,
-                            vpc_id=vpc_id,
-                            topology_data=graph_data,
-                        )
+        # Collect every discovered VPC; they all share the same graph export
+        vpcs = [
+            (region, vpc["id"])
+            for region, region_results in results.items()
+            for result in region_results
+            if result.success and result.resource_type.value == "vpc"
+            for vpc in result.resources
+        ]
+
+        if vpcs:
+            # Archive the topology in S3 once for the whole run
+            s3_key = s3_repo.upload_full_topology(
+                run_id=request_id,
+                topology_data=graph_data,
+            )
+
+            # Save a per-VPC record in DynamoDB using batched writes
+            dynamodb_repo.save_topologies(
+                vpcs=vpcs,
+                topology_data=graph_data,
+                metadata=summary,
+                s3_key=s3_key,
+            )
 
         logger.info(
             "Discovery completed successfully",
@@ -125,6 +139,10 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             ),
         }
 
+    finally:
+        # Publish this invocation's metrics before the container is frozen
+        flush_metrics()
+
 
 # For local testing
 if __name__ == "__main__":
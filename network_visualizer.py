@@ -1,39 +1,116 @@
 import argparse
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+
 import boto3
 import networkx as nx
-import matplotlib.pyplot as plt
+
+from src.core.constants import MAX_DISCOVERY_REGION_WORKERS
+
+# Largest page the EC2 Describe* APIs accept; fewer round-trips per listing
+PAGINATION_CONFIG = {"PageSize": 1000}
+
+def _paginate(ec2, operation, key):
+    for page in ec2.get_paginator(operation).paginate(PaginationConfig=PAGINATION_CONFIG):
+        yield from page[key]
+
+def _iter_instances(ec2):
+    return chain.from_iterable(
+        r["Instances"] for r in _paginate(ec2, "describe_instances", "Reservations")
+    )
+
+def _fetch_vpcs(ec2):
+    return list(_paginate(ec2, "describe_vpcs", "Vpcs"))
+
+def _fetch_subnets_by_vpc(ec2):
+    subnets_by_vpc = defaultdict(list)
+    for subnet in _paginate(ec2, "describe_subnets", "Subnets"):
+        subnets_by_vpc[subnet["VpcId"]].append(subnet["SubnetId"])
+    return subnets_by_vpc
+
+def _fetch_instances_by_subnet(ec2):
+    instances_by_subnet = defaultdict(list)
+    for instance in _iter_instances(ec2):
+        subnet_id = instance.get("SubnetId")
+        if subnet_id:
+            instances_by_subnet[subnet_id].append(instance["InstanceId"])
+    return instances_by_subnet
+
+def _draw(G, out_file):
+    # Graphviz lays out and rasterizes in C; fall back to matplotlib when
+    # pygraphviz isn't installed
+    try:
+        from networkx.drawing.nx_agraph import to_agraph
+
+        A = to_agraph(G)
+    except ImportError:
+        import matplotlib.pyplot as plt
+
+        nx.draw(G, with_labels=True, node_color="lightblue", font_weight="bold")
+        plt.savefig(out_file)
+        return
+
+    A.graph_attr.update(overlap="false")
+    A.node_attr.update(style="filled", fillcolor="lightblue", fontname="Helvetica-Bold")
+    # Graphviz would render the "label" attribute in place of the node ID
+    for node in A.nodes():
+        kind = node.attr.get("label")
+        node.attr["label"] = f"{node}\\n{kind}" if kind else str(node)
+    A.draw(out_file, prog="sfdp" if G.number_of_nodes() > 100 else "dot")
+
+def _collect_region(ec2):
+    # The three listings are independent, and boto3 clients are safe to
+    # share across threads
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        vpcs_future = pool.submit(_fetch_vpcs, ec2)
+        subnets_future = pool.submit(_fetch_subnets_by_vpc, ec2)
+        instances_future = pool.submit(_fetch_instances_by_subnet, ec2)
+
+        return vpcs_future.result(), subnets_future.result(), instances_future.result()
 
 def visualize_network(region, profile, out_file):
-    session = boto3.Session(profile_name=profile, region_name=region)
-    ec2 = session.client("ec2")
+    regions = [r.strip() for r in region.split(",") if r.strip()]
+    if not regions:
+        raise ValueError(f"No AWS region given in --region {region!r}")
+    session = boto3.Session(profile_name=profile, region_name=regions[0])
+    # Sessions aren't thread-safe, so create every client up front
+    clients = [session.client("ec2", region_name=r) for r in regions]
     G = nx.DiGraph()
 
-    # Collect VPCs, Subnets, Instances
-    vpcs = ec2.describe_vpcs()["Vpcs"]
-    for vpc in vpcs:
-        vpc_id = vpc["VpcId"]
-        G.add_node(vpc_id, label="VPC")
-
-        subnets = ec2.describe_subnets(Filters=[{"Name": "vpc-id", "Values": [vpc_id]}])["Subnets"]
-        for subnet in subnets:
-            subnet_id = subnet["SubnetId"]
-            G.add_edge(vpc_id, subnet_id, label="contains")
-
-            instances = ec2.describe_instances(Filters=[{"Name": "subnet-id", "Values": [subnet_id]}])
-            for reservation in instances["Reservations"]:
-                for instance in reservation["Instances"]:
-                    instance_id = instance["InstanceId"]
-                    G.add_edge(subnet_id, instance_id, label="hosts")
-
-    nx.draw(G, with_labels=True, node_color="lightblue", font_weight="bold")
-    plt.savefig(out_file)
+    # Collect VPCs, Subnets, Instances with one thread per region, capped
+    # so a long region list doesn't spawn an unbounded number of threads
+    max_workers = max(1, min(len(clients), MAX_DISCOVERY_REGION_WORKERS))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        region_results = list(pool.map(_collect_region, clients))
+
+    # Build the graph from the bucketed results (no further API calls)
+    for vpcs, subnets_by_vpc, instances_by_subnet in region_results:
+        vpc_ids = [vpc["VpcId"] for vpc in vpcs]
+        G.add_nodes_from(vpc_ids, label="VPC")
+        G.add_edges_from(
+            (vpc_id, subnet_id, {"label": "contains"})
+            for vpc_id in vpc_ids
+            for subnet_id in subnets_by_vpc.get(vpc_id, [])
+        )
+        G.add_edges_from(
+            (subnet_id, instance_id, {"label": "hosts"})
+            for vpc_id in vpc_ids
+            for subnet_id in subnets_by_vpc.get(vpc_id, [])
+            for instance_id in instances_by_subnet.get(subnet_id, [])
+        )
+
+    _draw(G, out_file)
     print(f"✅ Network map saved as {out_file}")
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="AWS Network Visualizer CLI")
-    parser.add_argument("--region", required=True, help="AWS region, e.g., us-west-2")
+    parser.add_argument("--region", required=True, help="AWS region(s), comma-separated, e.g., us-west-2,us-east-1")
     parser.add_argument("--profile", default="auto-tagger-dev", help="AWS CLI profile to use")
     parser.add_argument("--out", default="network_map.png", help="Output image file name")
     args = parser.parse_args()
 
-    visualize_network(region=args.region, profile=args.profile, out_file=args.out)
+    try:
+        visualize_network(region=args.region, profile=args.profile, out_file=args.out)
+    except ValueError as e:
+        parser.error(str(e))
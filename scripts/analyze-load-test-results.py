@@ -4,110 +4,142 @@ Analyze load test results and check against SLAs
 """
 
 import sys
-import json
 import csv
+import operator
 from pathlib import Path
+from types import MappingProxyType
+
+import orjson
+
+# SLA direction -> comparison that means the SLA is violated
+VIOLATES = {"<": operator.ge, ">": operator.le}
+
+
+def write_lines(lines):
+    """Write lines to stdout with a single write call"""
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 class LoadTestAnalyzer:
     """Analyzes load test results and checks SLA compliance"""
 
+    # Shared, read-only SLA thresholds
+    SLAS = MappingProxyType({
+        "error_rate": 1.0,  # < 1%
+        "avg_response_time": 500,  # < 500ms
+        "p95_response_time": 1000,  # < 1000ms
+        "p99_response_time": 2000,  # < 2000ms
+        "throughput": 20,  # > 20 req/s
+    })
+
     def __init__(self, results_dir):
         self.results_dir = Path(results_dir)
-        self.slas = {
-            "error_rate": 1.0,  # < 1%
-            "avg_response_time": 500,  # < 500ms
-            "p95_response_time": 1000,  # < 1000ms
-            "p99_response_time": 2000,  # < 2000ms
-            "throughput": 20,  # > 20 req/s
-        }
 
     def analyze_locust_results(self):
         """Analyze Locust CSV results"""
-        print("\n=== Locust Results Analysis ===")
+        lines = ["\n=== Locust Results Analysis ==="]
+        passed = self._analyze_locust_results(lines)
+        write_lines(lines)
+        return passed
 
+    def _analyze_locust_results(self, lines):
+        """Add the Locust analysis to lines and return the SLA result"""
         stats_file = self.results_dir / "locust_stats.csv"
         if not stats_file.exists():
-            print("  No Locust stats file found")
+            lines.append("  No Locust stats file found")
             return None
 
-        with open(stats_file) as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row["Type"] == "Aggregated":
-                    error_rate = float(row["Failure Count"]) / float(row["Request Count"]) * 100 if float(row["Request Count"]) > 0 else 0
-                    avg_response = float(row["Average Response Time"])
-                    p95_response = float(row["95%"])
-                    throughput = float(row["Requests/s"])
-
-                    print(f"  Error Rate: {error_rate:.2f}% (SLA: < {self.slas['error_rate']}%)")
-                    print(f"  Avg Response Time: {avg_response:.2f}ms (SLA: < {self.slas['avg_response_time']}ms)")
-                    print(f"  P95 Response Time: {p95_response:.2f}ms (SLA: < {self.slas['p95_response_time']}ms)")
-                    print(f"  Throughput: {throughput:.2f} req/s (SLA: > {self.slas['throughput']} req/s)")
-
-                    violations = []
-                    if error_rate >= self.slas["error_rate"]:
-                        violations.append("Error Rate")
-                    if avg_response >= self.slas["avg_response_time"]:
-                        violations.append("Avg Response Time")
-                    if p95_response >= self.slas["p95_response_time"]:
-                        violations.append("P95 Response Time")
-                    if throughput <= self.slas["throughput"]:
-                        violations.append("Throughput")
-
-                    if violations:
-                        print(f"\n  ❌ SLA Violations: {', '.join(violations)}")
-                        return False
-                    else:
-                        print("\n  ✅ All SLAs met")
-                        return True
-
-        return None
+        # Large read buffer and plain csv.reader (no per-row dict); lines
+        # that can't be the Aggregated row are skipped without CSV parsing,
+        # and reading stops as soon as it is found
+        with open(stats_file, "r", newline="", buffering=1 << 20) as f:
+            col = {name: i for i, name in enumerate(next(csv.reader(f), []))}
+            if "Type" not in col:
+                return None
+            type_idx = col["Type"]
+            for line in f:
+                if "Aggregated" not in line:
+                    continue
+                row = next(csv.reader([line]))
+                if row[type_idx] == "Aggregated":
+                    break
+            else:
+                return None
+
+        request_count = float(row[col["Request Count"]])
+        failure_count = float(row[col["Failure Count"]])
+        error_rate = failure_count / request_count * 100 if request_count > 0 else 0
+        avg_response = float(row[col["Average Response Time"]])
+        p95_response = float(row[col["95%"]])
+        throughput = float(row[col["Requests/s"]])
+
+        return self.check_slas(lines, [
+            ("Error Rate", error_rate, "%", "<", "error_rate"),
+            ("Avg Response Time", avg_response, "ms", "<", "avg_response_time"),
+            ("P95 Response Time", p95_response, "ms", "<", "p95_response_time"),
+            ("Throughput", throughput, " req/s", ">", "throughput"),
+        ])
 
     def analyze_artillery_results(self):
         """Analyze Artillery JSON results"""
-        print("\n=== Artillery Results Analysis ===")
+        lines = ["\n=== Artillery Results Analysis ==="]
+        passed = self._analyze_artillery_results(lines)
+        write_lines(lines)
+        return passed
 
+    def _analyze_artillery_results(self, lines):
+        """Add the Artillery analysis to lines and return the SLA result"""
         results_file = self.results_dir / "artillery-results.json"
         if not results_file.exists():
-            print("  No Artillery results file found")
+            lines.append("  No Artillery results file found")
             return None
 
-        with open(results_file) as f:
-            data = json.load(f)
+        # Read the whole file as bytes, then a single orjson parse
+        data = orjson.loads(results_file.read_bytes())
 
         aggregate = data.get("aggregate", {})
         latency = aggregate.get("latency", {})
         counters = aggregate.get("counters", {})
 
-        total_requests = counters.get("http.requests", 0)
-        failed_requests = counters.get("http.request_failed", 0)
+        total_requests, failed_requests = (
+            counters.get(k, 0) for k in ("http.requests", "http.request_failed")
+        )
         error_rate = (failed_requests / total_requests * 100) if total_requests > 0 else 0
 
-        median = latency.get("median", 0)
-        p95 = latency.get("p95", 0)
-        p99 = latency.get("p99", 0)
+        median, p95, p99 = (latency.get(k, 0) for k in ("median", "p95", "p99"))
+
+        lines.append(f"  Total Requests: {total_requests}")
+        lines.append(f"  Failed Requests: {failed_requests}")
+        return self.check_slas(lines, [
+            ("Error Rate", error_rate, "%", "<", "error_rate"),
+            ("Median Response Time", median, "ms", None, None),
+            ("P95 Response Time", p95, "ms", "<", "p95_response_time"),
+            ("P99 Response Time", p99, "ms", "<", "p99_response_time"),
+        ])
 
-        print(f"  Total Requests: {total_requests}")
-        print(f"  Failed Requests: {failed_requests}")
-        print(f"  Error Rate: {error_rate:.2f}% (SLA: < {self.slas['error_rate']}%)")
-        print(f"  Median Response Time: {median:.2f}ms")
-        print(f"  P95 Response Time: {p95:.2f}ms (SLA: < {self.slas['p95_response_time']}ms)")
-        print(f"  P99 Response Time: {p99:.2f}ms (SLA: < {self.slas['p99_response_time']}ms)")
+    def check_slas(self, lines, checks):
+        """Add each metric to lines and report whether all SLAs are met
 
+        checks is a list of (label, value, unit, direction, sla_key) tuples;
+        direction is "<" or ">" (the SLA bound), or None for metrics that
+        are only printed.
+        """
         violations = []
-        if error_rate >= self.slas["error_rate"]:
-            violations.append("Error Rate")
-        if p95 >= self.slas["p95_response_time"]:
-            violations.append("P95 Response Time")
-        if p99 >= self.slas["p99_response_time"]:
-            violations.append("P99 Response Time")
+        for label, value, unit, direction, sla_key in checks:
+            if direction is None:
+                lines.append(f"  {label}: {value:.2f}{unit}")
+                continue
+
+            sla = self.SLAS[sla_key]
+            lines.append(f"  {label}: {value:.2f}{unit} (SLA: {direction} {sla}{unit})")
+            if VIOLATES[direction](value, sla):
+                violations.append(label)
 
         if violations:
-            print(f"\n  ❌ SLA Violations: {', '.join(violations)}")
+            lines.append(f"\n  ❌ SLA Violations: {', '.join(violations)}")
             return False
         else:
-            print("\n  ✅ All SLAs met")
+            lines.append("\n  ✅ All SLAs met")
             return True
 
     def generate_summary(self):
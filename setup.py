@@ -40,6 +40,8 @@ setup(
         "mangum>=0.17.0,<1.0.0",
         "redis>=5.0.1,<6.0.0",
         "orjson>=3.9.10,<4.0.0",
+        "cachetools>=5.3.0,<6.0.0",
+        "zstandard>=0.22.0,<1.0.0",
         "click>=8.1.7,<9.0.0",
         "rich>=13.7.0,<14.0.0",
         "tqdm>=4.66.1,<5.0.0",
@@ -2,14 +2,23 @@
 AWS Network Visualizer - Production-grade network topology discovery and analysis.
 """
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "Your Organization"
 __email__ = "your-email@example.com"
 
-from src.collectors.collector_manager import CollectorManager
-from src.graph.builder import GraphBuilder, NetworkGraph
-from src.graph.analyzer import GraphAnalyzer
-from src.ai_analysis.anomaly_detector import AnomalyDetector, Anomaly
+# Public names are imported on first access (PEP 562) so that importing the
+# package, or any one submodule, doesn't pull in boto3, NetworkX and the
+# Bedrock client up front
+_LAZY_IMPORTS = {
+    "CollectorManager": "src.collectors.collector_manager",
+    "GraphBuilder": "src.graph.builder",
+    "NetworkGraph": "src.graph.builder",
+    "GraphAnalyzer": "src.graph.analyzer",
+    "AnomalyDetector": "src.ai_analysis.anomaly_detector",
+    "Anomaly": "src.ai_analysis.anomaly_detector",
+}
 
 __all__ = [
     "CollectorManager",
@@ -19,3 +28,17 @@ __all__ = [
     "AnomalyDetector",
     "Anomaly",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,7 +5,7 @@ This module provides intelligent analysis of network topologies using
 Amazon Bedrock with Claude for anomaly detection and recommendations.
 """
 
-from src.ai_analysis.bedrock_client import BedrockClient
+from src.ai_analysis.bedrock_client import BedrockClient, get_bedrock_client
 from src.ai_analysis.anomaly_detector import AnomalyDetector, Anomaly
 
-__all__ = ["BedrockClient", "AnomalyDetector", "Anomaly"]
+__all__ = ["BedrockClient", "get_bedrock_client", "AnomalyDetector", "Anomaly"]
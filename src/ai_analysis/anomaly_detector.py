@@ -6,10 +6,13 @@ deterministic rules and AI-powered analysis.
 """
 
 import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
-from src.ai_analysis.bedrock_client import BedrockClient
+from src.ai_analysis.bedrock_client import get_bedrock_client
+from src.core import constants
 from src.core.constants import AnomalyType, SeverityLevel
 from src.core.logging import get_logger
 from src.graph.analyzer import GraphAnalyzer
@@ -19,10 +22,13 @@ from src.observability.metrics import get_metrics_publisher
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Anomaly:
     """
     Represents a detected anomaly in the network.
+
+    Slotted and immutable: reports can hold thousands of anomalies, and
+    nothing modifies one after detection.
     """
 
     anomaly_type: str
@@ -40,6 +46,9 @@ class AnomalyDetector:
     Detects anomalies in AWS network topology using multiple methods.
     """
 
+    # Severities counted in reports
+    VALID_SEVERITIES = frozenset(level.value for level in SeverityLevel)
+
     def __init__(
         self,
         network_graph: NetworkGraph,
@@ -61,7 +70,7 @@ class AnomalyDetector:
 
         if enable_ai:
             try:
-                self.bedrock_client = BedrockClient()
+                self.bedrock_client = get_bedrock_client()
             except Exception as e:
                 logger.warning(
                     f"Failed to initialize Bedrock client, AI detection disabled: {e}"
@@ -88,26 +97,43 @@ class AnomalyDetector:
 
         anomalies = []
 
-        # Rule-based detection
-        anomalies.extend(self.detect_security_group_issues())
-        anomalies.extend(self.detect_orphaned_resources())
-        anomalies.extend(self.detect_network_segmentation_issues())
+        # Shared by the rule-based detectors and the AI payload, so each
+        # analysis is computed once per run
+        security_analysis = self.graph_analyzer.analyze_security_posture()
+        vpc_analysis = self.graph_analyzer.analyze_vpcs()
 
-        # AI-powered detection
-        if self.enable_ai:
-            try:
-                ai_anomalies = self.detect_with_ai()
-                anomalies.extend(ai_anomalies)
-            except Exception as e:
-                logger.error(f"AI-powered detection failed: {e}", exc_info=True)
+        # The detectors are independent, so run them concurrently; the
+        # Bedrock round-trip overlaps with the rule-based graph checks.
+        # Results are collected in submission order to keep reports stable.
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            # Rule-based detection
+            rule_futures = [
+                pool.submit(self._detect_security_group_issues, security_analysis),
+                pool.submit(self.detect_orphaned_resources),
+                pool.submit(self._detect_network_segmentation_issues, vpc_analysis),
+            ]
+
+            # AI-powered detection
+            ai_future = None
+            if self.enable_ai and self.bedrock_client is not None:
+                ai_future = pool.submit(
+                    self._detect_with_ai, vpc_analysis, security_analysis
+                )
+
+            for future in rule_futures:
+                anomalies.extend(future.result())
+
+            if ai_future is not None:
+                try:
+                    anomalies.extend(ai_future.result())
+                except Exception as e:
+                    logger.error(f"AI-powered detection failed: {e}", exc_info=True)
 
         # Record metrics
         duration = time.time() - start_time
-        for anomaly in anomalies:
-            self.metrics.record_anomaly(
-                anomaly_type=anomaly.anomaly_type,
-                severity=anomaly.severity,
-            )
+        self.metrics.record_anomaly_batch(
+            Counter((a.anomaly_type, a.severity) for a in anomalies)
+        )
 
         logger.info(
             f"Detected {len(anomalies)} anomalies in {duration:.2f}s",
@@ -123,12 +149,27 @@ class AnomalyDetector:
         """
         Detect security group misconfigurations.
 
+        Returns:
+            List of security-related anomalies
+        """
+        return self._detect_security_group_issues(
+            self.graph_analyzer.analyze_security_posture()
+        )
+
+    def _detect_security_group_issues(
+        self, security_analysis: Dict[str, Any]
+    ) -> List[Anomaly]:
+        """
+        Detect security group misconfigurations from a security analysis.
+
+        Args:
+            security_analysis: Result of GraphAnalyzer.analyze_security_posture
+
         Returns:
             List of security-related anomalies
         """
         anomalies = []
 
-        security_analysis = self.graph_analyzer.analyze_security_posture()
         issues = security_analysis.get("issues", [])
 
         for issue in issues:
@@ -187,9 +228,23 @@ class AnomalyDetector:
         Returns:
             List of segmentation anomalies
         """
-        anomalies = []
+        return self._detect_network_segmentation_issues(
+            self.graph_analyzer.analyze_vpcs()
+        )
 
-        vpc_analysis = self.graph_analyzer.analyze_vpcs()
+    def _detect_network_segmentation_issues(
+        self, vpc_analysis: Dict[str, Dict[str, Any]]
+    ) -> List[Anomaly]:
+        """
+        Detect network segmentation problems from a VPC analysis.
+
+        Args:
+            vpc_analysis: Result of GraphAnalyzer.analyze_vpcs
+
+        Returns:
+            List of segmentation anomalies
+        """
+        anomalies = []
 
         for vpc_id, vpc_data in vpc_analysis.items():
             # Check if VPC has no subnets
@@ -235,23 +290,54 @@ class AnomalyDetector:
         Returns:
             List of AI-detected anomalies
         """
-        if not self.enable_ai or not self.bedrock_client:
+        # Checked before any analyzer work so the disabled path is free
+        if not self.enable_ai or self.bedrock_client is None:
+            return []
+
+        return self._detect_with_ai()
+
+    def _detect_with_ai(
+        self,
+        vpc_analysis: Optional[Dict[str, Dict[str, Any]]] = None,
+        security_analysis: Optional[Dict[str, Any]] = None,
+    ) -> List[Anomaly]:
+        """
+        Build the topology payload and send it to Bedrock.
+
+        Args:
+            vpc_analysis: Precomputed GraphAnalyzer.analyze_vpcs result
+            security_analysis: Precomputed analyze_security_posture result
+
+        Returns:
+            List of AI-detected anomalies
+        """
+        # The rule-based checks already cover trivial topologies
+        if self.network_graph.node_count < constants.MIN_AI_ANALYSIS_NODES:
+            logger.debug(
+                f"Skipping AI detection for {self.network_graph.node_count}-node graph",
+                extra={"node_count": self.network_graph.node_count},
+            )
             return []
 
         logger.info("Starting AI-powered anomaly detection")
 
         try:
             # Prepare topology data for analysis
+            if vpc_analysis is None:
+                vpc_analysis = self.graph_analyzer.analyze_vpcs()
+            if security_analysis is None:
+                security_analysis = self.graph_analyzer.analyze_security_posture()
+
             topology_data = {
                 "graph_summary": self.graph_analyzer.get_basic_metrics(),
-                "vpcs": self.graph_analyzer.analyze_vpcs(),
-                "security_posture": self.graph_analyzer.analyze_security_posture(),
+                "vpcs": vpc_analysis,
+                "security_posture": security_analysis,
                 "connectivity": self.graph_analyzer.analyze_connectivity(),
             }
 
             # Invoke Bedrock for analysis
-            analysis_result = self.bedrock_client.analyze_network_topology(
-                topology_data=topology_data,
+            analysis_result = self.bedrock_client.analyze_network_topology_raw(
+                payload=self.bedrock_client.serialize_topology(topology_data),
                 analysis_type="comprehensive",
             )
 
@@ -306,44 +392,30 @@ class AnomalyDetector:
         Returns:
             Report dictionary
         """
-        # Group by severity
-        by_severity = {
-            SeverityLevel.CRITICAL.value: [],
-            SeverityLevel.HIGH.value: [],
-            SeverityLevel.MEDIUM.value: [],
-            SeverityLevel.LOW.value: [],
-            SeverityLevel.INFO.value: [],
-        }
-
-        for anomaly in anomalies:
-            severity = anomaly.severity
-            if severity in by_severity:
-                by_severity[severity].append(anomaly)
-
-        # Group by type
-        by_type = {}
-        for anomaly in anomalies:
-            anomaly_type = anomaly.anomaly_type
-            if anomaly_type not in by_type:
-                by_type[anomaly_type] = []
-            by_type[anomaly_type].append(anomaly)
+        # Counts only; every known severity is reported, even when zero
+        by_severity = dict.fromkeys((level.value for level in SeverityLevel), 0)
+        by_type: Dict[str, int] = defaultdict(int)
+        # Pre-sized so the list never has to grow
+        anomaly_dicts: List[Optional[Dict[str, Any]]] = [None] * len(anomalies)
+
+        # Count by severity and type while serializing, in a single pass
+        for i, a in enumerate(anomalies):
+            if a.severity in self.VALID_SEVERITIES:
+                by_severity[a.severity] += 1
+            by_type[a.anomaly_type] += 1
+            anomaly_dicts[i] = {
+                "type": a.anomaly_type,
+                "severity": a.severity,
+                "title": a.title,
+                "description": a.description,
+                "affected_resources": a.affected_resources,
+                "remediation": a.remediation,
+                "confidence_score": a.confidence_score,
+            }
 
         return {
             "total_anomalies": len(anomalies),
-            "by_severity": {
-                severity: len(items) for severity, items in by_severity.items()
-            },
-            "by_type": {atype: len(items) for atype, items in by_type.items()},
-            "anomalies": [
-                {
-                    "type": a.anomaly_type,
-                    "severity": a.severity,
-                    "title": a.title,
-                    "description": a.description,
-                    "affected_resources": a.affected_resources,
-                    "remediation": a.remediation,
-                    "confidence_score": a.confidence_score,
-                }
-                for a in anomalies
-            ],
+            "by_severity": by_severity,
+            "by_type": dict(by_type),
+            "anomalies": anomaly_dicts,
         }
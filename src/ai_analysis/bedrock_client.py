@@ -5,21 +5,204 @@ This module provides a client for interacting with Amazon Bedrock
 to perform intelligent analysis of AWS network topologies.
 """
 
-import json
+import asyncio
+import contextvars
+import copy
+import hashlib
+import logging
+import os
+import re
+import threading
 import time
-from typing import Any, Dict, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, Dict, Generator, Optional
 
 import boto3
+import orjson
+from cachetools import TTLCache
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from src.core.config import get_settings
+from src.core.constants import (
+    BEDROCK_PROMPT_CACHE_MODELS,
+    BEDROCK_RESPONSE_CACHE_SIZE,
+    BEDROCK_RESPONSE_CACHE_TTL,
+    MIN_AI_ANALYSIS_NODES,
+)
 from src.core.exceptions import AIAnalysisException
 from src.core.logging import get_logger
 from src.observability.metrics import get_metrics_publisher, MetricsTimer
 from src.observability.tracing import trace_function
+from src.utils.async_clients import get_async_client, get_async_session
+from src.utils.retry import async_retry_with_backoff, retry_with_backoff
 
 logger = get_logger(__name__)
 
+# Exact-match cache of parsed analyses keyed by a hash of the model, prompts
+# and topology payload; topologies change slowly, so repeated analyses of
+# the same topology skip the Bedrock round-trip
+_response_cache: TTLCache = TTLCache(
+    maxsize=BEDROCK_RESPONSE_CACHE_SIZE, ttl=BEDROCK_RESPONSE_CACHE_TTL
+)
+_response_cache_lock = threading.Lock()
+# Analyses currently being requested, by cache key (guarded by the same lock)
+_inflight: Dict[str, Future] = {}
+
+# Markdown code fence around the model's JSON output, found in one scan
+_JSON_FENCE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+
+
+# Shared by the sync and async bedrock-runtime clients. Invocations are
+# retried in one layer only (retry_with_backoff / async_retry_with_backoff),
+# so botocore makes a single attempt per call; adaptive mode still paces
+# requests with its client-side token bucket after throttling
+RUNTIME_CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    retries={"mode": "adaptive", "max_attempts": 1},
+    tcp_keepalive=True,
+)
+
+
+# Analysis prompts are module constants so every call sends byte-identical
+# (and therefore prompt-cacheable) text
+ANALYSIS_SYSTEM_PROMPT = """You are an AWS network security and architecture expert.
+Analyze the provided AWS network topology and identify security issues, misconfigurations,
+cost optimization opportunities, and compliance violations.
+
+For each finding, provide:
+1. Issue type (security_misconfiguration, compliance_violation, cost_optimization, etc.)
+2. Severity (critical, high, medium, low)
+3. Description of the issue
+4. Affected resources
+5. Recommended remediation
+6. Confidence score (0.0 to 1.0)
+
+Return your analysis in JSON format with a list of findings."""
+
+# Precedes the serialized topology in the user message
+TOPOLOGY_PROMPT_PREFIX = "AWS network topology:\n\n"
+
+# Focused analyses; "all" asks for every one of them in a single call
+ANALYSIS_FOCUS = {
+    "security": "Security group misconfigurations (especially 0.0.0.0/0 rules), "
+    "network segmentation issues, and missing encryption or logging",
+    "cost": "Orphaned or idle resources and cost optimization opportunities",
+    "compliance": "Compliance violations and routing anomalies",
+}
+
+
+@lru_cache(maxsize=None)
+def _analysis_instructions(analysis_type: str) -> str:
+    """
+    Build the analysis instructions for an analysis type.
+
+    Cached, so each type's instructions are built once and stay
+    byte-identical across calls.
+
+    Args:
+        analysis_type: "comprehensive", "all", or a key of ANALYSIS_FOCUS
+
+    Returns:
+        Instructions placed before the topology in the prompt
+    """
+    if analysis_type in ANALYSIS_FOCUS:
+        return f"""Analyze the AWS network topology that follows.
+
+Focus on: {ANALYSIS_FOCUS[analysis_type]}.
+
+Return the findings in JSON format."""
+
+    if analysis_type == "all":
+        questions = "\n".join(
+            f"{i}. {name}: {focus}"
+            for i, (name, focus) in enumerate(ANALYSIS_FOCUS.items(), 1)
+        )
+        names = ", ".join(ANALYSIS_FOCUS)
+        return f"""Analyze the AWS network topology that follows and answer each question:
+{questions}
+
+Return one JSON object whose keys are the question names ({names}),
+each holding the list of findings for that question."""
+
+    return """Analyze the AWS network topology that follows.
+
+Provide a comprehensive analysis focusing on:
+1. Security group misconfigurations (especially 0.0.0.0/0 rules)
+2. Network segmentation issues
+3. Routing anomalies
+4. Missing encryption or logging
+5. Orphaned or idle resources
+6. Cost optimization opportunities
+
+Return the findings in JSON format."""
+
+
+def topology_node_count(topology_data: Dict[str, Any]) -> Optional[int]:
+    """
+    Find the node count of a topology payload, if it records one.
+
+    Understands graph exports (``nodes``/``node_count``), discovery output
+    (``graph``) and the anomaly detector's payload (``graph_summary``).
+
+    Args:
+        topology_data: Network topology data
+
+    Returns:
+        Number of nodes, or None if the payload does not say
+    """
+    for summary in (
+        topology_data,
+        topology_data.get("graph"),
+        topology_data.get("graph_summary"),
+    ):
+        if isinstance(summary, dict):
+            for key in ("node_count", "total_nodes"):
+                if key in summary:
+                    return summary[key]
+
+    nodes = topology_data.get("nodes")
+    return len(nodes) if isinstance(nodes, list) else None
+
+
+@lru_cache(maxsize=8)
+def _get_runtime_client(profile: Optional[str], region: str):
+    """
+    Get a shared bedrock-runtime client for a profile and region.
+
+    Every BedrockClient for the same profile/region reuses one client, so
+    credentials are resolved once and pooled keep-alive connections are
+    shared instead of each instance opening its own.
+
+    Args:
+        profile: AWS CLI profile name
+        region: Bedrock region
+
+    Returns:
+        Boto3 bedrock-runtime client
+    """
+    session = boto3.Session(profile_name=profile, region_name=region)
+    return session.client("bedrock-runtime", config=RUNTIME_CLIENT_CONFIG)
+
+
+def supports_prompt_caching(model_id: str) -> bool:
+    """
+    Check whether a Bedrock model accepts prompt cache checkpoints.
+
+    Inference-profile prefixes such as "us." or "global." are removed
+    before comparing against BEDROCK_PROMPT_CACHE_MODELS.
+
+    Args:
+        model_id: Bedrock model or inference profile ID
+
+    Returns:
+        True if cache_control blocks can be sent to the model
+    """
+    if not model_id.startswith("anthropic."):
+        model_id = model_id.split(".", 1)[-1]
+    return model_id.startswith(BEDROCK_PROMPT_CACHE_MODELS)
+
 
 class BedrockClient:
     """
@@ -31,56 +214,74 @@ class BedrockClient:
         self.settings = get_settings()
         self.metrics = get_metrics_publisher()
 
+        # Read once; these are used on every invocation
+        self.model_id = self.settings.bedrock_model_id
+        self.region = self.settings.get_bedrock_region()
+        self.max_tokens = self.settings.ai_analysis_max_tokens
+        self.temperature = self.settings.ai_analysis_temperature
+
+        # Runs the blocking client for async callers (see ainvoke_model_threaded)
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.settings.bedrock_sync_workers
+            or min(32, (os.cpu_count() or 4) + 4),
+            thread_name_prefix="bedrock",
+        )
+
         try:
-            session = boto3.Session(
-                profile_name=self.settings.aws_profile,
-                region_name=self.settings.get_bedrock_region(),
-            )
-            self.client = session.client("bedrock-runtime")
+            self.client = _get_runtime_client(self.settings.aws_profile, self.region)
             logger.info(
-                f"Initialized Bedrock client with model {self.settings.bedrock_model_id}",
+                f"Initialized Bedrock client with model {self.model_id}",
                 extra={
-                    "model_id": self.settings.bedrock_model_id,
-                    "region": self.settings.get_bedrock_region(),
+                    "model_id": self.model_id,
+                    "region": self.region,
                 },
             )
         except Exception as e:
             logger.error(f"Failed to initialize Bedrock client: {e}")
             raise AIAnalysisException(
                 f"Failed to initialize Bedrock client: {e}",
-                model_id=self.settings.bedrock_model_id,
+                model_id=self.model_id,
             )
 
-    @trace_function(name="bedrock_invoke", capture_args=False)
-    def invoke_model(
+    def _build_request_body(
         self,
         prompt: str,
-        max_tokens: Optional[int] = None,
-        temperature: Optional[float] = None,
-        system_prompt: Optional[str] = None,
+        max_tokens: Optional[int],
+        temperature: Optional[float],
+        system_prompt: Optional[str],
+        cached_prefix: Optional[str],
     ) -> Dict[str, Any]:
         """
-        Invoke Bedrock model with a prompt.
+        Build the Anthropic Messages request body for a prompt.
+
+        When the model supports prompt caching, the system prompt and
+        cached_prefix are marked as cache checkpoints so repeated calls
+        reuse them instead of re-processing them.
 
         Args:
             prompt: User prompt for the model
-            max_tokens: Maximum tokens to generate
-            temperature: Temperature for generation (0.0 to 1.0)
+            max_tokens: Maximum tokens to generate (defaults to config value)
+            temperature: Temperature for generation (defaults to config value)
             system_prompt: Optional system prompt
+            cached_prefix: Optional stable text sent before the prompt
 
         Returns:
-            Dictionary with model response and metadata
-
-        Raises:
-            AIAnalysisException: If model invocation fails
+            Request body dictionary
         """
-        start_time = time.time()
-
         # Use config values if not provided
         if max_tokens is None:
-            max_tokens = self.settings.ai_analysis_max_tokens
+            max_tokens = self.max_tokens
         if temperature is None:
-            temperature = self.settings.ai_analysis_temperature
+            temperature = self.temperature
+
+        cache_prompt = supports_prompt_caching(self.model_id)
+
+        content: Any = prompt
+        if cached_prefix:
+            prefix_block: Dict[str, Any] = {"type": "text", "text": cached_prefix}
+            if cache_prompt:
+                prefix_block["cache_control"] = {"type": "ephemeral"}
+            content = [prefix_block, {"type": "text", "text": prompt}]
 
         # Build request payload for Claude 3.5
         request_body = {
@@ -90,97 +291,388 @@ class BedrockClient:
             "messages": [
                 {
                     "role": "user",
-                    "content": prompt,
+                    "content": content,
                 }
             ],
         }
 
         if system_prompt:
-            request_body["system"] = system_prompt
-
-        try:
-            with MetricsTimer(
-                self.metrics,
-                "ai_analysis_duration",
-                {"Model": self.settings.bedrock_model_id},
-            ):
-                # Invoke model
-                response = self.client.invoke_model(
-                    modelId=self.settings.bedrock_model_id,
-                    contentType="application/json",
-                    accept="application/json",
-                    body=json.dumps(request_body),
-                )
-
-                # Parse response
-                response_body = json.loads(response["body"].read())
-
-                # Extract token usage
-                usage = response_body.get("usage", {})
-                input_tokens = usage.get("input_tokens", 0)
-                output_tokens = usage.get("output_tokens", 0)
-
-                # Record token usage metrics
-                self.metrics.record_bedrock_usage(
-                    model_id=self.settings.bedrock_model_id,
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens,
-                )
+            if cache_prompt:
+                request_body["system"] = [
+                    {
+                        "type": "text",
+                        "text": system_prompt,
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ]
+            else:
+                request_body["system"] = system_prompt
+
+        return request_body
+
+    def _handle_response(
+        self,
+        response_body: Dict[str, Any],
+        start_time: float,
+    ) -> Dict[str, Any]:
+        """
+        Record usage metrics for a model response and extract its text.
 
-                # Extract content
-                content = response_body.get("content", [])
-                text_content = ""
-                if content and len(content) > 0:
-                    text_content = content[0].get("text", "")
-
-                duration = time.time() - start_time
-
-                logger.info(
-                    f"Bedrock invocation successful: {input_tokens} input tokens, {output_tokens} output tokens",
-                    extra={
-                        "model_id": self.settings.bedrock_model_id,
-                        "input_tokens": input_tokens,
-                        "output_tokens": output_tokens,
-                        "duration": duration,
-                    },
-                )
+        Args:
+            response_body: Decoded response body
+            start_time: Time the invocation started
 
-                return {
-                    "text": text_content,
+        Returns:
+            Dictionary with model response and metadata
+        """
+        # Extract token usage
+        usage = response_body.get("usage", {})
+        input_tokens = usage.get("input_tokens", 0)
+        output_tokens = usage.get("output_tokens", 0)
+        cache_read_tokens = usage.get("cache_read_input_tokens", 0)
+        cache_write_tokens = usage.get("cache_creation_input_tokens", 0)
+
+        # Record token usage metrics
+        self.metrics.record_bedrock_usage(
+            model_id=self.model_id,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cache_read_tokens=cache_read_tokens,
+            cache_write_tokens=cache_write_tokens,
+        )
+
+        # Extract content
+        content = response_body.get("content", [])
+        text_content = ""
+        if content and len(content) > 0:
+            text_content = content[0].get("text", "")
+
+        duration = time.time() - start_time
+
+        # Skip building the message and extra fields when INFO is filtered
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Bedrock invocation successful: {input_tokens} input tokens, {output_tokens} output tokens",
+                extra={
+                    "model_id": self.model_id,
                     "input_tokens": input_tokens,
                     "output_tokens": output_tokens,
-                    "model_id": self.settings.bedrock_model_id,
+                    "cache_read_tokens": cache_read_tokens,
+                    "cache_write_tokens": cache_write_tokens,
                     "duration": duration,
-                }
+                },
+            )
+
+        return {
+            "text": text_content,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "cache_read_tokens": cache_read_tokens,
+            "cache_write_tokens": cache_write_tokens,
+            "model_id": self.model_id,
+            "duration": duration,
+        }
 
-        except ClientError as e:
+    def _invocation_error(self, e: Exception) -> AIAnalysisException:
+        """
+        Log a failed invocation and convert it to an AIAnalysisException.
+
+        Args:
+            e: Exception raised while invoking the model
+
+        Returns:
+            AIAnalysisException to raise
+        """
+        if isinstance(e, ClientError):
             error_code = e.response.get("Error", {}).get("Code", "Unknown")
             logger.error(
                 f"Bedrock invocation failed: {error_code} - {e}",
                 extra={
-                    "model_id": self.settings.bedrock_model_id,
+                    "model_id": self.model_id,
                     "error_code": error_code,
                 },
             )
 
-            raise AIAnalysisException(
+            return AIAnalysisException(
                 f"Bedrock invocation failed: {e}",
-                model_id=self.settings.bedrock_model_id,
+                model_id=self.model_id,
                 details={"error_code": error_code},
             )
 
+        logger.error(
+            f"Unexpected error invoking Bedrock: {e}",
+            extra={"model_id": self.model_id},
+            exc_info=True,
+        )
+
+        return AIAnalysisException(
+            f"Unexpected error invoking Bedrock: {e}",
+            model_id=self.model_id,
+        )
+
+    @trace_function(name="bedrock_invoke", capture_args=False)
+    def invoke_model(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        system_prompt: Optional[str] = None,
+        cached_prefix: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Invoke Bedrock model with a prompt.
+
+        The response is streamed (see invoke_model_stream) and collected.
+
+        Args:
+            prompt: User prompt for the model
+            max_tokens: Maximum tokens to generate
+            temperature: Temperature for generation (0.0 to 1.0)
+            system_prompt: Optional system prompt
+            cached_prefix: Optional stable text sent before the prompt
+
+        Returns:
+            Dictionary with model response and metadata
+
+        Raises:
+            AIAnalysisException: If model invocation fails
+        """
+        stream = self.invoke_model_stream(
+            prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system_prompt=system_prompt,
+            cached_prefix=cached_prefix,
+        )
+
+        # Drain the stream; its return value is the response dictionary
+        while True:
+            try:
+                next(stream)
+            except StopIteration as done:
+                return done.value
+
+    def invoke_model_stream(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        system_prompt: Optional[str] = None,
+        cached_prefix: Optional[str] = None,
+    ) -> Generator[str, None, Dict[str, Any]]:
+        """
+        Invoke Bedrock model with a prompt, streaming the generated text.
+
+        Text deltas are yielded as soon as Bedrock sends them. Token usage
+        is recorded once the stream ends, and the generator returns the
+        same dictionary invoke_model does.
+
+        Args:
+            prompt: User prompt for the model
+            max_tokens: Maximum tokens to generate
+            temperature: Temperature for generation (0.0 to 1.0)
+            system_prompt: Optional system prompt
+            cached_prefix: Optional stable text sent before the prompt
+
+        Yields:
+            Generated text deltas
+
+        Returns:
+            Dictionary with model response and metadata
+
+        Raises:
+            AIAnalysisException: If model invocation fails
+        """
+        start_time = time.time()
+        request_body = self._build_request_body(
+            prompt, max_tokens, temperature, system_prompt, cached_prefix
+        )
+
+        text_parts = []
+        usage: Dict[str, Any] = {}
+
+        try:
+            with MetricsTimer(
+                self.metrics,
+                "ai_analysis_duration",
+                {"Model": self.model_id},
+            ):
+                response = self._open_stream(orjson.dumps(request_body))
+
+                for event in response["body"]:
+                    chunk = event.get("chunk")
+                    if not chunk:
+                        continue
+
+                    message = orjson.loads(chunk["bytes"])
+                    message_type = message.get("type")
+
+                    if message_type == "content_block_delta":
+                        text = message.get("delta", {}).get("text", "")
+                        if text:
+                            text_parts.append(text)
+                            yield text
+                    elif message_type == "message_start":
+                        # Input and prompt cache token counts
+                        usage.update(message.get("message", {}).get("usage", {}))
+                    elif message_type == "message_delta":
+                        # Final output token count
+                        usage.update(message.get("usage", {}))
+
         except Exception as e:
-            logger.error(
-                f"Unexpected error invoking Bedrock: {e}",
-                extra={"model_id": self.settings.bedrock_model_id},
-                exc_info=True,
-            )
+            raise self._invocation_error(e)
 
-            raise AIAnalysisException(
-                f"Unexpected error invoking Bedrock: {e}",
-                model_id=self.settings.bedrock_model_id,
+        return self._handle_response(
+            {"content": [{"text": "".join(text_parts)}], "usage": usage},
+            start_time,
+        )
+
+    @retry_with_backoff()
+    def _open_stream(self, body: bytes) -> Dict[str, Any]:
+        """
+        Start a streaming invocation, retrying throttling and transient errors.
+
+        Only the request that opens the stream is retried; once text has
+        been yielded to the caller it cannot be replayed.
+
+        Args:
+            body: JSON-encoded request body
+
+        Returns:
+            invoke_model_with_response_stream response
+        """
+        return self.client.invoke_model_with_response_stream(
+            modelId=self.model_id,
+            contentType="application/json",
+            accept="application/json",
+            body=body,
+        )
+
+    async def ainvoke_model(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        system_prompt: Optional[str] = None,
+        cached_prefix: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Invoke Bedrock model with a prompt without blocking the event loop.
+
+        Uses an aioboto3 bedrock-runtime client so concurrent analyses
+        overlap their round-trips. The session and the client are shared
+        (one client per event loop, see src.utils.async_clients), so calls
+        reuse pooled connections; await close_async_clients() before the
+        loop closes. If aioboto3 is not installed, this falls back to
+        ainvoke_model_threaded.
+
+        Args:
+            prompt: User prompt for the model
+            max_tokens: Maximum tokens to generate
+            temperature: Temperature for generation (0.0 to 1.0)
+            system_prompt: Optional system prompt
+            cached_prefix: Optional stable text sent before the prompt
+
+        Returns:
+            Dictionary with model response and metadata
+
+        Raises:
+            AIAnalysisException: If model invocation fails
+        """
+        session = get_async_session(self.settings.aws_profile, self.region)
+        if session is None:
+            return await self.ainvoke_model_threaded(
+                prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                system_prompt=system_prompt,
+                cached_prefix=cached_prefix,
             )
 
+        start_time = time.time()
+        request_body = self._build_request_body(
+            prompt, max_tokens, temperature, system_prompt, cached_prefix
+        )
+
+        try:
+            with MetricsTimer(
+                self.metrics,
+                "ai_analysis_duration",
+                {"Model": self.model_id},
+            ):
+                client = await get_async_client(
+                    session, "bedrock-runtime", RUNTIME_CLIENT_CONFIG
+                )
+                response_body = await self._ainvoke(client, orjson.dumps(request_body))
+
+                return self._handle_response(response_body, start_time)
+
+        except Exception as e:
+            raise self._invocation_error(e)
+
+    async def ainvoke_model_threaded(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        system_prompt: Optional[str] = None,
+        cached_prefix: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run the synchronous invoke_model on the client's thread pool.
+
+        The event loop stays free while the call waits on Bedrock, and the
+        pool bounds how many blocking calls run at once. Context variables
+        are copied into the worker thread, as asyncio.to_thread does.
+
+        Args:
+            prompt: User prompt for the model
+            max_tokens: Maximum tokens to generate
+            temperature: Temperature for generation (0.0 to 1.0)
+            system_prompt: Optional system prompt
+            cached_prefix: Optional stable text sent before the prompt
+
+        Returns:
+            Dictionary with model response and metadata
+
+        Raises:
+            AIAnalysisException: If model invocation fails
+        """
+        call = partial(
+            contextvars.copy_context().run,
+            self.invoke_model,
+            prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system_prompt=system_prompt,
+            cached_prefix=cached_prefix,
+        )
+        return await asyncio.get_running_loop().run_in_executor(self._pool, call)
+
+    def close(self) -> None:
+        """Release the client's worker threads without waiting on them."""
+        self._pool.shutdown(wait=False)
+
+    @async_retry_with_backoff()
+    async def _ainvoke(self, client: Any, body: bytes) -> Dict[str, Any]:
+        """
+        Invoke the model on an async client, retrying transient errors.
+
+        Args:
+            client: aioboto3 bedrock-runtime client
+            body: JSON-encoded request body
+
+        Returns:
+            Decoded response body
+        """
+        response = await client.invoke_model(
+            modelId=self.model_id,
+            contentType="application/json",
+            accept="application/json",
+            body=body,
+        )
+        return orjson.loads(await response["body"].read())
+
     def analyze_network_topology(
         self,
         topology_data: Dict[str, Any],
@@ -189,9 +681,15 @@ class BedrockClient:
         """
         Analyze network topology using Bedrock.
 
+        analysis_type "all" runs every ANALYSIS_FOCUS analysis in a single
+        request; the result then also holds "findings_by_type".
+
+        Topologies with fewer than MIN_AI_ANALYSIS_NODES nodes return no
+        findings without invoking the model ("short_circuit" is set).
+
         Args:
             topology_data: Network topology data to analyze
-            analysis_type: Type of analysis to perform
+            analysis_type: "comprehensive", "all", or a key of ANALYSIS_FOCUS
 
         Returns:
             Analysis results
@@ -199,39 +697,145 @@ class BedrockClient:
         Raises:
             AIAnalysisException: If analysis fails
         """
-        system_prompt = """You are an AWS network security and architecture expert.
-Analyze the provided AWS network topology and identify security issues, misconfigurations,
-cost optimization opportunities, and compliance violations.
+        # Trivial topologies are answered without calling the model
+        node_count = topology_node_count(topology_data)
+        if node_count is not None and node_count < MIN_AI_ANALYSIS_NODES:
+            logger.debug(
+                f"Skipping Bedrock analysis of {node_count}-node topology",
+                extra={"node_count": node_count, "analysis_type": analysis_type},
+            )
+            return {
+                "findings": [],
+                "analysis_type": analysis_type,
+                "model_response": None,
+                "short_circuit": True,
+            }
+
+        return self.analyze_network_topology_raw(
+            self.serialize_topology(topology_data),
+            analysis_type=analysis_type,
+        )
+
+    @staticmethod
+    def serialize_topology(topology_data: Dict[str, Any]) -> bytes:
+        """
+        Serialize topology data for the analysis prompt.
 
-For each finding, provide:
-1. Issue type (security_misconfiguration, compliance_violation, cost_optimization, etc.)
-2. Severity (critical, high, medium, low)
-3. Description of the issue
-4. Affected resources
-5. Recommended remediation
-6. Confidence score (0.0 to 1.0)
+        The JSON is compact: indentation carries no meaning for the model
+        but is billed as input tokens.
 
-Return your analysis in JSON format with a list of findings."""
+        Args:
+            topology_data: Network topology data to analyze
 
-        prompt = f"""Analyze the following AWS network topology:
+        Returns:
+            JSON-encoded topology data
+        """
+        # Sorted keys make equal topologies serialize to identical bytes
+        return orjson.dumps(
+            topology_data,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS,
+        )
+
+    def analyze_network_topology_raw(
+        self,
+        payload: bytes,
+        analysis_type: str = "comprehensive",
+    ) -> Dict[str, Any]:
+        """
+        Analyze already-serialized network topology using Bedrock.
 
-{json.dumps(topology_data, indent=2)}
+        Results are shared through the response cache, so every caller
+        gets its own copy and may modify it freely.
 
-Provide a comprehensive analysis focusing on:
-1. Security group misconfigurations (especially 0.0.0.0/0 rules)
-2. Network segmentation issues
-3. Routing anomalies
-4. Missing encryption or logging
-5. Orphaned or idle resources
-6. Cost optimization opportunities
+        Args:
+            payload: JSON-encoded topology data (see serialize_topology)
+            analysis_type: Type of analysis to perform
 
-Return the findings in JSON format."""
+        Returns:
+            Analysis results
+
+        Raises:
+            AIAnalysisException: If analysis fails
+        """
+
+        # Stable instructions go first so they can be cached; the topology,
+        # which changes between calls, follows them
+        instructions = _analysis_instructions(analysis_type)
+
+        prompt = TOPOLOGY_PROMPT_PREFIX + payload.decode()
+
+        cache_key = hashlib.blake2b(
+            "\0".join(
+                (self.model_id, analysis_type, ANALYSIS_SYSTEM_PROMPT, instructions)
+            ).encode()
+            + b"\0"
+            + payload
+        ).hexdigest()
+
+        # Concurrent callers with the same key share one in-flight request
+        with _response_cache_lock:
+            cached = _response_cache.get(cache_key)
+            pending = _inflight.get(cache_key) if cached is None else None
+            leader = cached is None and pending is None
+            if leader:
+                pending = _inflight[cache_key] = Future()
+
+        if cached is not None:
+            logger.info(
+                "Using cached Bedrock analysis",
+                extra={"analysis_type": analysis_type},
+            )
+            return copy.deepcopy(cached)
+
+        if not leader:
+            logger.info(
+                "Waiting for in-flight Bedrock analysis",
+                extra={"analysis_type": analysis_type},
+            )
+            return copy.deepcopy(pending.result())
 
+        try:
+            result = self._run_analysis(cache_key, prompt, instructions, analysis_type)
+        except Exception as e:
+            pending.set_exception(e)
+            raise
+        else:
+            pending.set_result(result)
+            return copy.deepcopy(result)
+        finally:
+            with _response_cache_lock:
+                del _inflight[cache_key]
+
+    def _run_analysis(
+        self,
+        cache_key: str,
+        prompt: str,
+        instructions: str,
+        analysis_type: str,
+    ) -> Dict[str, Any]:
+        """
+        Invoke the model for a topology analysis and parse its findings.
+
+        Args:
+            cache_key: Response cache key for the analysis
+            prompt: Topology prompt
+            instructions: Cacheable analysis instructions
+            analysis_type: Type of analysis to perform
+
+        Returns:
+            Analysis results
+
+        Raises:
+            AIAnalysisException: If analysis fails
+        """
         try:
             response = self.invoke_model(
                 prompt=prompt,
-                system_prompt=system_prompt,
-                max_tokens=4096,
+                system_prompt=ANALYSIS_SYSTEM_PROMPT,
+                cached_prefix=instructions,
+                # Batched analyses answer several questions in one response
+                max_tokens=8192 if analysis_type == "all" else 4096,
                 temperature=0.0,
             )
 
@@ -239,26 +843,35 @@ Return the findings in JSON format."""
             text = response["text"]
             try:
                 # Extract JSON from response (may be wrapped in markdown)
-                if "```json" in text:
-                    json_start = text.find("```json") + 7
-                    json_end = text.find("```", json_start)
-                    json_text = text[json_start:json_end].strip()
-                elif "```" in text:
-                    json_start = text.find("```") + 3
-                    json_end = text.find("```", json_start)
-                    json_text = text[json_start:json_end].strip()
-                else:
-                    json_text = text
-
-                findings = json.loads(json_text)
+                match = _JSON_FENCE.search(text)
+                json_text = match.group(1) if match else text.strip()
 
-                return {
+                findings = orjson.loads(json_text)
+
+                result = {
                     "findings": findings,
                     "analysis_type": analysis_type,
                     "model_response": response,
                 }
 
-            except json.JSONDecodeError as e:
+                # Split a batched response back into per-analysis findings
+                if analysis_type == "all" and isinstance(findings, dict):
+                    result["findings_by_type"] = {
+                        name: findings.get(name, []) for name in ANALYSIS_FOCUS
+                    }
+                    result["findings"] = [
+                        finding
+                        for name_findings in result["findings_by_type"].values()
+                        for finding in name_findings
+                    ]
+
+                # Only successfully parsed analyses are cached
+                with _response_cache_lock:
+                    _response_cache[cache_key] = result
+
+                return result
+
+            except orjson.JSONDecodeError as e:
                 logger.warning(
                     f"Failed to parse JSON from Bedrock response: {e}",
                     extra={"response_text": text[:500]},
@@ -279,3 +892,20 @@ Return the findings in JSON format."""
                 f"Failed to analyze network topology: {e}",
                 analysis_type=analysis_type,
             )
+
+
+@lru_cache()
+def get_bedrock_client() -> BedrockClient:
+    """
+    Get the shared Bedrock client instance.
+
+    Cached like get_metrics_publisher, so every detector in the process
+    reuses one client instead of constructing its own.
+
+    Returns:
+        BedrockClient instance
+
+    Raises:
+        AIAnalysisException: If the client cannot be initialized
+    """
+    return BedrockClient()
@@ -5,28 +5,37 @@ This module provides a comprehensive CLI for network topology discovery,
 analysis, visualization, and anomaly detection.
 """
 
-import asyncio
-import json
 import sys
 from pathlib import Path
 from typing import Optional
 
 import click
+import orjson
 from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from src.ai_analysis.anomaly_detector import AnomalyDetector
-from src.collectors.collector_manager import CollectorManager
 from src.core.config import get_settings
 from src.core.logging import setup_logging, get_logger
-from src.graph.analyzer import GraphAnalyzer
-from src.graph.builder import GraphBuilder
 
-console = Console()
+# Automatic highlighting only helps interactive terminals; piped or CI
+# output is printed as-is
+console = Console(highlight=sys.stdout.isatty())
 logger = None
 
 
+def dump_json(data) -> bytes:
+    """Serialize command output as indented JSON in a single pass."""
+    return orjson.dumps(
+        data,
+        default=str,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+    )
+
+
+def load_json(path) -> dict:
+    """Parse a JSON file with orjson, straight from its bytes."""
+    return orjson.loads(Path(path).read_bytes())
+
+
 def init_logger(debug: bool = False):
     """Initialize logger."""
     global logger
@@ -39,8 +48,13 @@ def init_logger(debug: bool = False):
 @click.option("--debug", is_flag=True, help="Enable debug logging")
 @click.option("--profile", help="AWS CLI profile to use")
 @click.option("--region", help="AWS region (can specify multiple with commas)")
+@click.option(
+    "--collector-concurrency",
+    type=click.IntRange(1, 100),
+    help="Maximum concurrent resource collectors (defaults to config value)",
+)
 @click.pass_context
-def cli(ctx, debug, profile, region):
+def cli(ctx, debug, profile, region, collector_concurrency):
     """
     AWS Network Visualizer - Production-Grade Network Topology Discovery.
 
@@ -52,6 +66,7 @@ def cli(ctx, debug, profile, region):
     ctx.obj["debug"] = debug
     ctx.obj["profile"] = profile
     ctx.obj["regions"] = region.split(",") if region else None
+    ctx.obj["collector_concurrency"] = collector_concurrency
 
 
 @cli.command()
@@ -80,10 +95,19 @@ def discover(ctx, output, format):
     console.print("[bold blue]Starting AWS Network Discovery...[/bold blue]")
 
     try:
+        import asyncio
+
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        from rich.table import Table
+
+        from src.collectors.collector_manager import CollectorManager
+        from src.graph.builder import GraphBuilder
+
         # Create collector manager
         manager = CollectorManager(
             regions=ctx.obj.get("regions"),
             profile=ctx.obj.get("profile"),
+            max_concurrent=ctx.obj.get("collector_concurrency"),
         )
 
         # Run discovery
@@ -91,6 +115,7 @@ def discover(ctx, output, format):
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console,
+            disable=not console.is_terminal,
         ) as progress:
             task = progress.add_task("Discovering resources...", total=None)
 
@@ -136,10 +161,9 @@ def discover(ctx, output, format):
         }
 
         output_path = Path(output)
-        with open(output_path, "w") as f:
-            if format == "json":
-                json.dump(topology_data, f, indent=2, default=str)
-            # Add YAML support if needed
+        if format == "json":
+            output_path.write_bytes(dump_json(topology_data))
+        # Add YAML support if needed
 
         console.print(f"[green]Topology saved to {output}[/green]")
 
@@ -177,24 +201,19 @@ def analyze(ctx, topology_file, output, enable_ai):
     console.print("[bold blue]Analyzing network topology...[/bold blue]")
 
     try:
-        # Load topology data
-        with open(topology_file, "r") as f:
-            topology_data = json.load(f)
+        from rich.table import Table
 
-        # Rebuild graph from data
-        console.print("Rebuilding graph...")
-        # Note: In production, you'd implement graph deserialization
-        # For now, we'll run discovery again
+        from src.ai_analysis.anomaly_detector import AnomalyDetector
+        from src.graph.analyzer import GraphAnalyzer
+        from src.graph.builder import GraphBuilder
 
-        manager = CollectorManager(
-            regions=ctx.obj.get("regions"),
-            profile=ctx.obj.get("profile"),
-        )
-
-        results = asyncio.run(manager.collect_all())
+        # Load topology data
+        topology_data = load_json(topology_file)
 
+        # Rebuild graph from the exported topology (no rediscovery)
+        console.print("Rebuilding graph...")
         builder = GraphBuilder()
-        network_graph = builder.build_graph(results)
+        network_graph = builder.from_dict(topology_data["graph"])
 
         # Analyze graph
         console.print("[bold blue]Running analysis...[/bold blue]")
@@ -239,12 +258,11 @@ def analyze(ctx, topology_file, output, enable_ai):
 
         # Save results
         output_path = Path(output)
-        with open(output_path, "w") as f:
-            combined_results = {
-                "analysis": analysis_results,
-                "anomaly_report": report,
-            }
-            json.dump(combined_results, f, indent=2, default=str)
+        combined_results = {
+            "analysis": analysis_results,
+            "anomaly_report": report,
+        }
+        output_path.write_bytes(dump_json(combined_results))
 
         console.print(f"\n[green]Analysis saved to {output}[/green]")
 
@@ -297,26 +315,16 @@ def visualize(ctx, topology_file, output, format, layout, width, height):
     console.print("[bold blue]Generating visualization...[/bold blue]")
 
     try:
+        from src.graph.builder import GraphBuilder
         from src.visualizers.matplotlib_visualizer import MatplotlibVisualizer
         from src.visualizers.d3_visualizer import D3Visualizer
 
         # Load topology
-        with open(topology_file, "r") as f:
-            topology_data = json.load(f)
+        topology_data = load_json(topology_file)
 
-        # Rebuild graph
+        # Rebuild graph from the exported topology (no rediscovery)
         console.print("Rebuilding graph from topology data...")
-
-        # For now, we need to run discovery again
-        # In production, you'd deserialize the graph
-        manager = CollectorManager(
-            regions=ctx.obj.get("regions"),
-            profile=ctx.obj.get("profile"),
-        )
-
-        results = asyncio.run(manager.collect_all())
-        builder = GraphBuilder()
-        network_graph = builder.build_graph(results)
+        network_graph = GraphBuilder().from_dict(topology_data["graph"])
 
         # Generate visualization
         console.print(f"Rendering {format.upper()} visualization...")
@@ -357,6 +365,8 @@ def visualize(ctx, topology_file, output, format, layout, width, height):
 @click.pass_context
 def info(ctx):
     """Display configuration and system information."""
+    from rich.table import Table
+
     settings = get_settings()
 
     console.print("[bold blue]AWS Network Visualizer Configuration[/bold blue]\n")
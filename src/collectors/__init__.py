@@ -5,12 +5,19 @@ This module provides a modular system for collecting AWS network resources
 with built-in retry logic, rate limiting, and observability.
 """
 
+import importlib
+
 from src.collectors.base import BaseCollector, CollectorResult
-from src.collectors.vpc_collector import VPCCollector
-from src.collectors.subnet_collector import SubnetCollector
-from src.collectors.ec2_collector import EC2Collector
 from src.collectors.collector_manager import CollectorManager
 
+# Collector classes are imported on first access, like the manager's
+# registry, so importing the package does not load every collector
+_LAZY_COLLECTORS = {
+    "VPCCollector": "src.collectors.vpc_collector",
+    "SubnetCollector": "src.collectors.subnet_collector",
+    "EC2Collector": "src.collectors.ec2_collector",
+}
+
 __all__ = [
     "BaseCollector",
     "CollectorResult",
@@ -19,3 +26,10 @@ __all__ = [
     "EC2Collector",
     "CollectorManager",
 ]
+
+
+def __getattr__(name):
+    """Import collector classes on first access."""
+    if name in _LAZY_COLLECTORS:
+        return getattr(importlib.import_module(_LAZY_COLLECTORS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,27 +5,146 @@ This module provides the base collector class that all resource collectors
 inherit from, including retry logic, metrics, tracing, and error handling.
 """
 
+import asyncio
+import inspect
+import logging
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from src.core.config import get_settings
-from src.core.constants import ResourceType
+from src.core.constants import AWS_CLIENT_MAX_POOL_CONNECTIONS, ResourceType
 from src.core.exceptions import CollectorException
 from src.core.logging import get_logger
 from src.observability.metrics import get_metrics_publisher, MetricsTimer
+from src.observability.profiling import profile
 from src.observability.tracing import trace_async_function, get_tracer
-from src.utils.retry import async_retry_with_backoff
-from src.utils.rate_limiter import AsyncRateLimiter
+from src.utils.async_clients import get_async_client, get_async_session
+from src.utils.rate_limiter import AsyncRateLimiter, get_service_rate_limiter
 
 logger = get_logger(__name__)
 
+# What collect_resources may produce: a list, or an async iterator of resources
+ResourceStream = Union[Iterable[Dict[str, Any]], AsyncIterator[Dict[str, Any]]]
 
-@dataclass
+
+@lru_cache(maxsize=None)
+def _get_session(profile: Optional[str], region: str) -> boto3.Session:
+    """
+    Get a shared boto3 session for a profile and region.
+
+    Collectors are created per (region, resource type); sharing sessions
+    means credentials are resolved once per profile and region.
+
+    Args:
+        profile: AWS CLI profile name
+        region: AWS region
+
+    Returns:
+        Boto3 session
+    """
+    return boto3.Session(profile_name=profile, region_name=region)
+
+
+@lru_cache(maxsize=None)
+def _get_client_config(
+    connect_timeout: int,
+    read_timeout: int,
+    max_attempts: int,
+    max_pool_connections: int,
+) -> Config:
+    """
+    Get the shared botocore config for collector clients.
+
+    One Config instance is built per setting combination and passed to
+    every client. Keepalive and a connection pool at least as large as
+    the collector concurrency let concurrent calls and successive pages
+    reuse connections instead of repeating the TLS handshake.
+
+    Args:
+        connect_timeout: Connection timeout in seconds
+        read_timeout: Read timeout in seconds
+        max_attempts: Attempts per request, including the first
+        max_pool_connections: Connection pool size per client
+
+    Returns:
+        Botocore client config
+    """
+    return Config(
+        connect_timeout=connect_timeout,
+        read_timeout=read_timeout,
+        retries={"mode": "adaptive", "max_attempts": max_attempts},
+        tcp_keepalive=True,
+        max_pool_connections=max_pool_connections,
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_client(
+    profile: Optional[str],
+    region: str,
+    service: str,
+    config: Config,
+):
+    """
+    Get a shared AWS service client.
+
+    Boto3 clients are thread-safe, so one client per profile, region and
+    service serves every collector; the service model is loaded once. The
+    service's shared rate limiter observes every request attempt the
+    client makes, retries included.
+
+    Args:
+        profile: AWS CLI profile name
+        region: AWS region
+        service: Service name (e.g., 'ec2')
+        config: Client config from _get_client_config
+
+    Returns:
+        Boto3 client
+    """
+    client = _get_session(profile, region).client(service, config=config)
+    get_service_rate_limiter(region, service).observe_client(client)
+    return client
+
+
+@lru_cache(maxsize=256)
+def _get_paginator(client, method_name: str):
+    """
+    Get a shared paginator for a client operation.
+
+    get_paginator builds a new Paginator (and looks up its pagination
+    config) on every call. Paginators are stateless between paginate()
+    calls, so one per shared client and operation is reused.
+
+    Args:
+        client: Boto3 client (from _get_client)
+        method_name: API method name (e.g., 'describe_vpcs')
+
+    Returns:
+        Botocore paginator
+    """
+    return client.get_paginator(method_name)
+
+
+@dataclass(slots=True)
 class CollectorResult:
     """
     Result from a resource collection operation.
@@ -64,6 +183,7 @@ class BaseCollector(ABC):
         region: str,
         profile: Optional[str] = None,
         rate_limit: Optional[float] = None,
+        include_raw: Optional[bool] = None,
     ):
         """
         Initialize the base collector.
@@ -72,16 +192,22 @@ class BaseCollector(ABC):
             region: AWS region to collect from
             profile: AWS CLI profile name
             rate_limit: Rate limit in requests per second
+            include_raw: Keep the raw API response under "raw" in each
+                resource (defaults to the include_raw_resources setting)
         """
         self.region = region
         self.settings = get_settings()
         self.metrics = get_metrics_publisher()
         self.tracer = get_tracer()
 
-        # Create AWS session
-        self.session = boto3.Session(
-            profile_name=profile or self.settings.aws_profile,
-            region_name=region,
+        # Shared AWS session for this profile and region
+        self.profile = profile or self.settings.aws_profile
+        self.session = _get_session(self.profile, region)
+
+        # Raw API responses are only kept on request; they roughly double
+        # the memory held per resource and nothing downstream reads them
+        self.include_raw = (
+            self.settings.include_raw_resources if include_raw is None else include_raw
         )
 
         # Set up rate limiter if specified
@@ -89,6 +215,10 @@ class BaseCollector(ABC):
         if rate_limit:
             self.rate_limiter = AsyncRateLimiter(rate=rate_limit)
 
+        # Per-request limiter shared by every collector calling this
+        # service in this region; it backs off when AWS throttles
+        self.api_rate_limiter = get_service_rate_limiter(region, self.service_name)
+
         logger.info(
             f"Initialized {self.__class__.__name__} for region {region}",
             extra={"region": region, "collector": self.__class__.__name__},
@@ -120,29 +250,66 @@ class BaseCollector(ABC):
         """
         Get AWS service client.
 
+        Clients are shared between collectors (see _get_client).
+
         Args:
             service: Service name (defaults to self.service_name)
 
         Returns:
             Boto3 client
         """
-        return self.session.client(
+        return _get_client(
+            self.profile,
+            self.region,
             service or self.service_name,
-            config=boto3.session.Config(
-                connect_timeout=self.settings.api_call_timeout,
-                read_timeout=self.settings.api_call_timeout,
+            self._client_config(),
+        )
+
+    def _client_config(self) -> Config:
+        """
+        Get the shared client config for the current settings.
+
+        Returns:
+            Botocore client config
+        """
+        return _get_client_config(
+            self.settings.api_connect_timeout,
+            self.settings.api_call_timeout,
+            self.settings.max_retry_attempts + 1,
+            max(
+                AWS_CLIENT_MAX_POOL_CONNECTIONS, self.settings.max_concurrent_collectors
             ),
         )
 
+    def _tags_and_name(
+        self, tags: Optional[List[Dict[str, str]]]
+    ) -> Tuple[Dict[str, str], str]:
+        """
+        Extract tags into a dictionary and find the Name tag in one pass.
+
+        EC2 Describe* responses always include both Key and Value (an
+        empty tag value is ""), so both are read by subscript.
+
+        Args:
+            tags: List of AWS tag dictionaries (may be None)
+
+        Returns:
+            Tuple of (tag key-value pairs, Name tag value or empty string)
+        """
+        tag_dict = {tag["Key"]: tag["Value"] for tag in tags or ()}
+        return tag_dict, tag_dict.get("Name", "")
+
     @abstractmethod
-    async def collect_resources(self) -> List[Dict[str, Any]]:
+    async def collect_resources(self) -> ResourceStream:
         """
         Collect AWS resources.
 
-        This method must be implemented by subclasses.
+        This method must be implemented by subclasses. It may be a
+        coroutine returning a list, or an async generator yielding
+        resources one at a time so collect() can stream them to a sink.
 
         Returns:
-            List of resource dictionaries
+            List (or async iterator) of resource dictionaries
 
         Raises:
             CollectorException: If collection fails
@@ -150,28 +317,42 @@ class BaseCollector(ABC):
         pass
 
     @trace_async_function(capture_args=False, capture_result=False)
-    async def collect(self) -> CollectorResult:
+    async def collect(
+        self,
+        sink: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
+    ) -> CollectorResult:
         """
         Collect resources with full observability.
 
+        Args:
+            sink: Optional coroutine function called with each resource.
+                Resources passed to a sink are counted but not kept on
+                the result, so a streaming collector never holds its full
+                resource list in memory.
+
         Returns:
             CollectorResult with resources and metadata
 
         Raises:
             CollectorException: If collection fails after retries
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
+        resource_type = self.resource_type
+        rt_value = resource_type.value
+        region = self.region
+        metrics = self.metrics
+
         result = CollectorResult(
-            resource_type=self.resource_type,
-            region=self.region,
+            resource_type=resource_type,
+            region=region,
         )
 
         try:
             logger.info(
-                f"Starting collection of {self.resource_type.value} in {self.region}",
+                f"Starting collection of {rt_value} in {region}",
                 extra={
-                    "resource_type": self.resource_type.value,
-                    "region": self.region,
+                    "resource_type": rt_value,
+                    "region": region,
                 },
             )
 
@@ -181,47 +362,53 @@ class BaseCollector(ABC):
 
             # Collect resources with metrics timing
             with MetricsTimer(
-                self.metrics,
-                f"{self.resource_type.value}_collection_duration",
-                {"Region": self.region},
+                metrics,
+                f"{rt_value}_collection_duration",
+                {"Region": region},
             ):
-                resources = await self.collect_resources()
+                resources = self.collect_resources()
+                if inspect.isawaitable(resources):
+                    resources = await resources
+
+                if sink is None and isinstance(resources, list):
+                    result.resources = resources
+                    result.count = len(resources)
+                else:
+                    result.count = await self._drain_resources(resources, sink, result)
 
-            result.resources = resources
-            result.count = len(resources)
             result.success = True
 
             logger.info(
-                f"Collected {result.count} {self.resource_type.value} resources in {self.region}",
+                f"Collected {result.count} {rt_value} resources in {region}",
                 extra={
-                    "resource_type": self.resource_type.value,
-                    "region": self.region,
+                    "resource_type": rt_value,
+                    "region": region,
                     "count": result.count,
                 },
             )
 
             # Record metrics
-            self.metrics.record_resource_count(
-                resource_type=self.resource_type.value,
+            metrics.record_resource_count(
+                resource_type=rt_value,
                 count=result.count,
-                region=self.region,
+                region=region,
             )
 
         except CollectorException as e:
             result.success = False
             result.error = str(e)
             logger.error(
-                f"Collection failed for {self.resource_type.value} in {self.region}: {e}",
+                f"Collection failed for {rt_value} in {region}: {e}",
                 extra={
-                    "resource_type": self.resource_type.value,
-                    "region": self.region,
+                    "resource_type": rt_value,
+                    "region": region,
                     "error": str(e),
                 },
                 exc_info=True,
             )
 
             # Record error metrics
-            self.metrics.record_error(
+            metrics.record_error(
                 error_type=type(e).__name__,
                 component=self.__class__.__name__,
             )
@@ -232,121 +419,292 @@ class BaseCollector(ABC):
             result.success = False
             result.error = str(e)
             logger.error(
-                f"Unexpected error collecting {self.resource_type.value} in {self.region}: {e}",
+                f"Unexpected error collecting {rt_value} in {region}: {e}",
                 extra={
-                    "resource_type": self.resource_type.value,
-                    "region": self.region,
+                    "resource_type": rt_value,
+                    "region": region,
                     "error": str(e),
                 },
                 exc_info=True,
             )
 
             # Record error metrics
-            self.metrics.record_error(
+            metrics.record_error(
                 error_type="UnexpectedError",
                 component=self.__class__.__name__,
             )
 
             raise CollectorException(
-                f"Failed to collect {self.resource_type.value}: {e}",
-                resource_type=self.resource_type.value,
-            )
+                f"Failed to collect {rt_value}: {e}",
+                resource_type=rt_value,
+            ) from e
 
         finally:
-            result.duration_seconds = time.time() - start_time
+            result.duration_seconds = time.perf_counter() - start_time
             result.metadata["collector_class"] = self.__class__.__name__
             result.metadata["collection_time"] = time.time()
 
         return result
 
-    @async_retry_with_backoff()
-    async def _paginated_call(
+    @staticmethod
+    async def _drain_resources(
+        resources: ResourceStream,
+        sink: Optional[Callable[[Dict[str, Any]], Awaitable[None]]],
+        result: CollectorResult,
+    ) -> int:
+        """
+        Pass resources to a sink, or onto the result if there is none.
+
+        Args:
+            resources: List or async iterator of resources
+            sink: Optional coroutine function called with each resource
+            result: Result to accumulate resources on when sink is None
+
+        Returns:
+            Number of resources collected
+        """
+        count = 0
+
+        if not hasattr(resources, "__aiter__"):
+            for resource in resources:
+                count += 1
+                if sink is None:
+                    result.resources.append(resource)
+                else:
+                    await sink(resource)
+            return count
+
+        async for resource in resources:
+            count += 1
+            if sink is None:
+                result.resources.append(resource)
+            else:
+                await sink(resource)
+        return count
+
+    def _api_call_failed(
+        self,
+        api_name: str,
+        start_time: float,
+        error: ClientError,
+    ) -> CollectorException:
+        """
+        Record and log a failed API call.
+
+        Args:
+            api_name: API name (e.g., 'ec2:describe_vpcs')
+            start_time: perf_counter() value when the call started
+            error: The client error
+
+        Returns:
+            CollectorException to raise
+        """
+        duration = time.perf_counter() - start_time
+
+        # Record failed API call
+        self.metrics.record_api_call(
+            api_name=api_name,
+            success=False,
+            duration_seconds=duration,
+            region=self.region,
+        )
+
+        error_code = error.response.get("Error", {}).get("Code", "Unknown")
+
+        logger.error(
+            f"{api_name} failed: {error_code} - {error}",
+            extra={
+                "api_name": api_name,
+                "region": self.region,
+                "error_code": error_code,
+                "duration": duration,
+            },
+        )
+
+        return CollectorException.from_client_error(
+            error, api_name=api_name, resource_type=self.resource_type.value
+        )
+
+    async def _iter_pages(
         self,
         client,
         method_name: str,
-        result_key: str,
         **kwargs,
-    ) -> List[Dict[str, Any]]:
+    ) -> AsyncIterator[Dict[str, Any]]:
         """
-        Make a paginated AWS API call with retry logic.
+        Yield the pages of a paginated AWS API call, one request at a time.
+
+        The service's shared rate limiter is acquired before every page
+        request, whichever client fetches it. With use_async_aws_clients
+        enabled and aioboto3 installed, pages come from the loop's aioboto3
+        client for the same service; otherwise each boto3 page request
+        runs in a worker thread so other collectors keep making progress.
 
         Args:
             client: Boto3 client
             method_name: API method name (e.g., 'describe_vpcs')
-            result_key: Key in response containing results (e.g., 'Vpcs')
             **kwargs: Additional arguments to pass to the API call
 
-        Returns:
-            List of resources from all pages
+        Yields:
+            Raw page responses, in order
+        """
+        async_session = (
+            get_async_session(self.profile, self.region)
+            if self.settings.use_async_aws_clients
+            else None
+        )
+
+        if async_session is not None:
+            async_client = await get_async_client(
+                async_session,
+                client.meta.service_model.service_name,
+                self._client_config(),
+            )
+            self.api_rate_limiter.observe_client(async_client)
+            page_iter = async_client.get_paginator(method_name).paginate(**kwargs)
+            async_pages = page_iter.__aiter__()
+            while True:
+                await self.api_rate_limiter.acquire()
+                try:
+                    page = await async_pages.__anext__()
+                except StopAsyncIteration:
+                    return
+                yield page
+
+        pages = iter(_get_paginator(client, method_name).paginate(**kwargs))
+        while True:
+            await self.api_rate_limiter.acquire()
+            page = await asyncio.to_thread(next, pages, None)
+            if page is None:
+                return
+            yield page
+
+    async def _paginated_iter(
+        self,
+        client,
+        method_name: str,
+        result_key: str,
+        **kwargs,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield resources from a paginated AWS API call one page at a time.
+
+        Unlike _paginated_call, only the current page is held in memory.
+
+        Args:
+            client: Boto3 client
+            method_name: API method name (e.g., 'describe_security_groups')
+            result_key: Key in response containing results
+            **kwargs: Additional arguments to pass to the API call
+
+        Yields:
+            Resources from each page, in order
 
         Raises:
             CollectorException: If API call fails
         """
         api_name = f"{self.service_name}:{method_name}"
-        start_time = time.time()
+        start_time = time.perf_counter()
+        count = 0
+        page_count = 0
 
         try:
-            method = getattr(client, method_name)
-            paginator = client.get_paginator(method_name)
-
-            all_resources = []
-            page_count = 0
-
-            for page in paginator.paginate(**kwargs):
-                resources = page.get(result_key, [])
-                all_resources.extend(resources)
+            async for page in self._iter_pages(client, method_name, **kwargs):
                 page_count += 1
+                for resource in page.get(result_key, ()):
+                    count += 1
+                    yield resource
 
-            duration = time.time() - start_time
+        except ClientError as e:
+            raise self._api_call_failed(api_name, start_time, e) from e
 
-            # Record successful API call
-            self.metrics.record_api_call(
-                api_name=api_name,
-                success=True,
-                duration_seconds=duration,
-                region=self.region,
-            )
+        duration = time.perf_counter() - start_time
+
+        # Record successful API call
+        self.metrics.record_api_call(
+            api_name=api_name,
+            success=True,
+            duration_seconds=duration,
+            region=self.region,
+        )
 
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                f"{api_name} succeeded: {len(all_resources)} resources across {page_count} pages",
+                f"{api_name} succeeded: {count} resources across {page_count} pages",
                 extra={
                     "api_name": api_name,
                     "region": self.region,
-                    "count": len(all_resources),
+                    "count": count,
                     "pages": page_count,
                     "duration": duration,
                 },
             )
 
-            return all_resources
+    @profile
+    async def _paginated_call(
+        self,
+        client,
+        method_name: str,
+        result_key: str,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """
+        Make a paginated AWS API call with retry logic.
 
-        except ClientError as e:
-            duration = time.time() - start_time
+        Throttling and transient errors are retried per page request by
+        the client's adaptive retry mode, so a late failure never re-fetches
+        pages that were already read. Pages are fetched as in _iter_pages
+        and dropped once their results are copied out.
 
-            # Record failed API call
+        Args:
+            client: Boto3 client
+            method_name: API method name (e.g., 'describe_vpcs')
+            result_key: Key in response containing results (e.g., 'Vpcs')
+            **kwargs: Additional arguments to pass to the API call
+
+        Returns:
+            List of resources from all pages
+
+        Raises:
+            CollectorException: If API call fails
+        """
+        api_name = f"{self.service_name}:{method_name}"
+        start_time = time.perf_counter()
+        all_resources: List[Dict[str, Any]] = []
+        page_count = 0
+
+        try:
+            async for page in self._iter_pages(client, method_name, **kwargs):
+                all_resources.extend(page.get(result_key, ()))
+                page_count += 1
+
+            duration = time.perf_counter() - start_time
+
+            # Record successful API call
             self.metrics.record_api_call(
                 api_name=api_name,
-                success=False,
+                success=True,
                 duration_seconds=duration,
                 region=self.region,
             )
 
-            error_code = e.response.get("Error", {}).get("Code", "Unknown")
-            logger.error(
-                f"{api_name} failed: {error_code} - {e}",
-                extra={
-                    "api_name": api_name,
-                    "region": self.region,
-                    "error_code": error_code,
-                    "duration": duration,
-                },
-            )
+            # Skip building the message and extra fields when DEBUG is filtered
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"{api_name} succeeded: {len(all_resources)} resources across {page_count} pages",
+                    extra={
+                        "api_name": api_name,
+                        "region": self.region,
+                        "count": len(all_resources),
+                        "pages": page_count,
+                        "duration": duration,
+                    },
+                )
 
-            raise CollectorException(
-                f"AWS API call failed: {e}",
-                resource_type=self.resource_type.value,
-                details={"api_name": api_name, "error_code": error_code},
-            )
+            return all_resources
+
+        except ClientError as e:
+            raise self._api_call_failed(api_name, start_time, e) from e
 
     async def _simple_call(
         self,
@@ -369,13 +727,14 @@ class BaseCollector(ABC):
             CollectorException: If API call fails
         """
         api_name = f"{self.service_name}:{method_name}"
-        start_time = time.time()
+        await self.api_rate_limiter.acquire()
+        start_time = time.perf_counter()
 
         try:
             method = getattr(client, method_name)
-            response = method(**kwargs)
+            response = await asyncio.to_thread(method, **kwargs)
 
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
 
             # Record successful API call
             self.metrics.record_api_call(
@@ -388,17 +747,4 @@ class BaseCollector(ABC):
             return response
 
         except ClientError as e:
-            duration = time.time() - start_time
-
-            # Record failed API call
-            self.metrics.record_api_call(
-                api_name=api_name,
-                success=False,
-                duration_seconds=duration,
-                region=self.region,
-            )
-
-            raise CollectorException(
-                f"AWS API call failed: {e}",
-                resource_type=self.resource_type.value,
-            )
+            raise self._api_call_failed(api_name, start_time, e) from e
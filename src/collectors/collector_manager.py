@@ -6,37 +6,118 @@ with parallel execution and comprehensive error handling.
 """
 
 import asyncio
-from typing import Dict, List, Optional, Type
+import importlib
+import logging
+from collections import defaultdict
+from functools import cached_property, lru_cache
+from typing import AsyncIterator, Dict, FrozenSet, List, Optional, Tuple, Type
+
+import boto3
 
 from src.collectors.base import BaseCollector, CollectorResult
-from src.collectors.vpc_collector import VPCCollector
-from src.collectors.subnet_collector import SubnetCollector
-from src.collectors.ec2_collector import EC2Collector
-from src.collectors.igw_collector import InternetGatewayCollector
-from src.collectors.security_group_collector import SecurityGroupCollector
 from src.core.config import get_settings
 from src.core.constants import ResourceType
 from src.core.logging import get_logger
 from src.observability.metrics import get_metrics_publisher, MetricsTimer
+from src.observability.profiling import profile, profile_block
 from src.observability.tracing import get_tracer
+from src.utils.async_clients import close_async_clients
 
 logger = get_logger(__name__)
 
+# Collector class for each resource type, as "module:ClassName"
+COLLECTOR_PATHS: Dict[ResourceType, str] = {
+    ResourceType.VPC: "src.collectors.vpc_collector:VPCCollector",
+    ResourceType.SUBNET: "src.collectors.subnet_collector:SubnetCollector",
+    ResourceType.EC2_INSTANCE: "src.collectors.ec2_collector:EC2Collector",
+    ResourceType.INTERNET_GATEWAY: "src.collectors.igw_collector:InternetGatewayCollector",
+    ResourceType.SECURITY_GROUP: "src.collectors.security_group_collector:SecurityGroupCollector",
+    # Add more collectors as they're implemented
+}
+
+
+@lru_cache(maxsize=None)
+def resolve_collector_class(resource_type: ResourceType) -> Optional[Type[BaseCollector]]:
+    """
+    Import and return the collector class for a resource type.
+
+    Collector modules are imported on first use, so only the collectors
+    for resource types actually collected are loaded.
+
+    Args:
+        resource_type: Resource type to collect
+
+    Returns:
+        Collector class, or None if no collector is registered
+    """
+    path = COLLECTOR_PATHS.get(resource_type)
+    if path is None:
+        return None
+
+    module_name, class_name = path.split(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+@lru_cache(maxsize=None)
+def _service_regions(service: str) -> FrozenSet[str]:
+    """
+    Get the regions botocore's endpoint data lists for a service.
+
+    Read from the endpoint data bundled with botocore, across every
+    partition; no API call is made.
+
+    Args:
+        service: Service name (e.g., 'directconnect')
+
+    Returns:
+        Region names where the service has an endpoint
+    """
+    session = boto3.session.Session()
+    return frozenset(
+        region
+        for partition in session.get_available_partitions()
+        for region in session.get_available_regions(service, partition_name=partition)
+    )
+
+
+def is_service_available(region: str, service: str) -> bool:
+    """
+    Check whether a service is available in a region.
+
+    Global services list no regions, and a region missing from EC2's list
+    is newer than the installed botocore; both are treated as available so
+    collection is only skipped when the endpoint data says so.
+
+    Args:
+        region: AWS region
+        service: Service name (e.g., 'directconnect')
+
+    Returns:
+        False only if the service is known to be unavailable in the region
+    """
+    regions = _service_regions(service)
+    if not regions or region not in _service_regions("ec2"):
+        return True
+    return region in regions
+
 
 class CollectorManager:
     """
     Manages and orchestrates multiple resource collectors.
     """
 
-    # Map of resource types to collector classes
-    COLLECTOR_CLASSES: Dict[ResourceType, Type[BaseCollector]] = {
-        ResourceType.VPC: VPCCollector,
-        ResourceType.SUBNET: SubnetCollector,
-        ResourceType.EC2_INSTANCE: EC2Collector,
-        ResourceType.INTERNET_GATEWAY: InternetGatewayCollector,
-        ResourceType.SECURITY_GROUP: SecurityGroupCollector,
-        # Add more collectors as they're implemented
-    }
+    # Map of resource types to collector classes ("module:ClassName");
+    # modules are imported on first use (see resolve_collector_class)
+    COLLECTOR_PATHS: Dict[ResourceType, str] = COLLECTOR_PATHS
+
+    # Settings flag enabling each resource type
+    _FLAG_MAP: Tuple[Tuple[str, ResourceType], ...] = (
+        ("collect_vpcs", ResourceType.VPC),
+        ("collect_subnets", ResourceType.SUBNET),
+        ("collect_ec2_instances", ResourceType.EC2_INSTANCE),
+        ("collect_internet_gateways", ResourceType.INTERNET_GATEWAY),
+        ("collect_security_groups", ResourceType.SECURITY_GROUP),
+    )
 
     def __init__(
         self,
@@ -60,6 +141,10 @@ class CollectorManager:
         self.metrics = get_metrics_publisher()
         self.tracer = get_tracer()
 
+        # Collector instances by (region, resource type), reused across
+        # collect_all / collect_region calls
+        self._collectors: Dict[Tuple[str, ResourceType], BaseCollector] = {}
+
         logger.info(
             f"Initialized CollectorManager for {len(self.regions)} regions",
             extra={
@@ -68,6 +153,22 @@ class CollectorManager:
             },
         )
 
+    @cached_property
+    def enabled_resource_types(self) -> List[ResourceType]:
+        """
+        Resource types enabled in configuration.
+
+        Computed once per manager from the collect_* settings flags.
+
+        Returns:
+            List of enabled ResourceType values
+        """
+        return [
+            resource_type
+            for flag, resource_type in self._FLAG_MAP
+            if getattr(self.settings, flag)
+        ]
+
     def get_enabled_resource_types(self) -> List[ResourceType]:
         """
         Get list of resource types enabled in configuration.
@@ -75,31 +176,21 @@ class CollectorManager:
         Returns:
             List of enabled ResourceType values
         """
-        enabled = []
-
-        if self.settings.collect_vpcs:
-            enabled.append(ResourceType.VPC)
-        if self.settings.collect_subnets:
-            enabled.append(ResourceType.SUBNET)
-        if self.settings.collect_ec2_instances:
-            enabled.append(ResourceType.EC2_INSTANCE)
-        if self.settings.collect_internet_gateways:
-            enabled.append(ResourceType.INTERNET_GATEWAY)
-        if self.settings.collect_security_groups:
-            enabled.append(ResourceType.SECURITY_GROUP)
-        # Add more resource types as collectors are implemented
-
-        return enabled
+        return self.enabled_resource_types
 
     async def collect_all(
         self,
         resource_types: Optional[List[ResourceType]] = None,
+        close_clients: bool = True,
     ) -> Dict[str, List[CollectorResult]]:
         """
         Collect all enabled resources across all regions.
 
         Args:
             resource_types: Optional list of specific resource types to collect
+            close_clients: Close the async clients opened on the event loop
+                when done. Pass False when the loop outlives the run (e.g. a
+                Lambda container's loop) so later runs reuse them.
 
         Returns:
             Dictionary mapping regions to list of CollectorResults
@@ -108,7 +199,7 @@ class CollectorManager:
             CollectorException: If critical collection errors occur
         """
         if resource_types is None:
-            resource_types = self.get_enabled_resource_types()
+            resource_types = self.enabled_resource_types
 
         logger.info(
             f"Starting collection of {len(resource_types)} resource types across {len(self.regions)} regions",
@@ -118,36 +209,51 @@ class CollectorManager:
             },
         )
 
-        with MetricsTimer(self.metrics, "total_discovery_duration"):
-            with self.tracer.begin_subsegment("collect_all_resources"):
-                # Create collector tasks for all regions and resource types
-                tasks = []
-                for region in self.regions:
-                    for resource_type in resource_types:
-                        if resource_type in self.COLLECTOR_CLASSES:
-                            tasks.append(
-                                self._collect_resource_type(region, resource_type)
+        try:
+            with profile_block("collect_all"), MetricsTimer(
+                self.metrics, "total_discovery_duration"
+            ):
+                with self.tracer.begin_subsegment("collect_all_resources"):
+                    # Create collector tasks for all regions and resource types
+                    tasks = []
+                    for region in self.regions:
+                        for resource_type in resource_types:
+                            if resource_type in self.COLLECTOR_PATHS:
+                                tasks.append(
+                                    self._collect_resource_type(region, resource_type)
+                                )
+
+                    # Aggregate results as they complete, so each one is
+                    # filed by region without waiting for the slowest task
+                    results_by_region: Dict[str, List[CollectorResult]] = {}
+                    successful_count = 0
+                    failed_count = 0
+
+                    async for result in self._iter_with_limit(tasks, self.max_concurrent):
+                        if not isinstance(result, CollectorResult):
+                            continue
+
+                        results_by_region.setdefault(result.region, []).append(result)
+
+                        if result.success:
+                            successful_count += 1
+                        else:
+                            failed_count += 1
+
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(
+                                f"Collected {result.resource_type.value} in {result.region} "
+                                f"({successful_count + failed_count}/{len(tasks)})",
+                                extra={
+                                    "region": result.region,
+                                    "resource_type": result.resource_type.value,
+                                    "count": result.count,
+                                },
                             )
-
-                # Execute tasks with concurrency limit
-                results = await self._execute_with_limit(tasks, self.max_concurrent)
-
-        # Organize results by region
-        results_by_region: Dict[str, List[CollectorResult]] = {}
-        successful_count = 0
-        failed_count = 0
-
-        for result in results:
-            if result:
-                region = result.region
-                if region not in results_by_region:
-                    results_by_region[region] = []
-                results_by_region[region].append(result)
-
-                if result.success:
-                    successful_count += 1
-                else:
-                    failed_count += 1
+        finally:
+            # Release the async clients this run opened on its event loop
+            if close_clients:
+                await close_async_clients()
 
         logger.info(
             f"Collection completed: {successful_count} successful, {failed_count} failed",
@@ -176,7 +282,7 @@ class CollectorManager:
             List of CollectorResults
         """
         if resource_types is None:
-            resource_types = self.get_enabled_resource_types()
+            resource_types = self.enabled_resource_types
 
         logger.info(
             f"Collecting {len(resource_types)} resource types in {region}",
@@ -186,14 +292,18 @@ class CollectorManager:
         tasks = [
             self._collect_resource_type(region, resource_type)
             for resource_type in resource_types
-            if resource_type in self.COLLECTOR_CLASSES
+            if resource_type in self.COLLECTOR_PATHS
         ]
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            results = await self._execute_with_limit(tasks, self.max_concurrent)
+        finally:
+            await close_async_clients()
 
         # Filter out exceptions and None values
         return [r for r in results if isinstance(r, CollectorResult)]
 
+    @profile
     async def _collect_resource_type(
         self,
         region: str,
@@ -209,7 +319,7 @@ class CollectorManager:
         Returns:
             CollectorResult or None if failed
         """
-        collector_class = self.COLLECTOR_CLASSES.get(resource_type)
+        collector_class = resolve_collector_class(resource_type)
         if not collector_class:
             logger.warning(
                 f"No collector class found for {resource_type.value}",
@@ -218,7 +328,23 @@ class CollectorManager:
             return None
 
         try:
-            collector = collector_class(region=region, profile=self.profile)
+            collector = self._collectors.get((region, resource_type))
+            if collector is None:
+                collector = collector_class(region=region, profile=self.profile)
+                self._collectors[(region, resource_type)] = collector
+
+            service = collector.service_name
+            if not is_service_available(region, service):
+                logger.info(
+                    f"Skipping {resource_type.value} in {region}: {service} is not available there",
+                    extra={
+                        "region": region,
+                        "resource_type": resource_type.value,
+                        "service": service,
+                    },
+                )
+                return None
+
             result = await collector.collect()
             return result
 
@@ -251,21 +377,75 @@ class CollectorManager:
             max_concurrent: Maximum concurrent tasks
 
         Returns:
-            List of results
+            List of results in task order; exceptions are returned in
+            place of results, as with gather(return_exceptions=True)
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
+        results: List = [None] * len(tasks)
+        pending = iter(enumerate(tasks))
+
+        # A fixed set of workers drains the shared iterator, so there is one
+        # wrapper coroutine per concurrency slot rather than one per task
+        async def worker():
+            for index, task in pending:
+                try:
+                    results[index] = await task
+                except Exception as e:
+                    results[index] = e
+
+        await asyncio.gather(
+            *(worker() for _ in range(min(max_concurrent, len(tasks))))
+        )
+        return results
 
-        async def bounded_task(task):
-            async with semaphore:
-                return await task
+    async def _iter_with_limit(
+        self,
+        tasks: List,
+        max_concurrent: int,
+    ) -> AsyncIterator:
+        """
+        Execute tasks with concurrency limit, yielding results as they complete.
 
-        bounded_tasks = [bounded_task(task) for task in tasks]
-        return await asyncio.gather(*bounded_tasks, return_exceptions=True)
+        Args:
+            tasks: List of coroutines to execute
+            max_concurrent: Maximum concurrent tasks
+
+        Yields:
+            Results in completion order; exceptions are yielded in place
+            of results
+        """
+        completed: asyncio.Queue = asyncio.Queue()
+        pending = iter(tasks)
+
+        async def worker():
+            for task in pending:
+                try:
+                    completed.put_nowait(await task)
+                except Exception as e:
+                    completed.put_nowait(e)
+
+        workers = [
+            asyncio.ensure_future(worker())
+            for _ in range(min(max_concurrent, len(tasks)))
+        ]
 
-    def get_summary(self, results: Dict[str, List[CollectorResult]]) -> Dict:
+        try:
+            for _ in range(len(tasks)):
+                yield await completed.get()
+        finally:
+            # Stop early if the consumer does, without leaving coroutines
+            # that were never awaited
+            for worker_task in workers:
+                worker_task.cancel()
+            for task in pending:
+                task.close()
+
+    @staticmethod
+    def get_summary(results: Dict[str, List[CollectorResult]]) -> Dict:
         """
         Generate a summary of collection results.
 
+        Uses no manager state, so it can be called on the class.
+
         Args:
             results: Dictionary of results by region
 
@@ -273,7 +453,7 @@ class CollectorManager:
             Summary dictionary
         """
         total_resources = 0
-        resources_by_type = {}
+        resources_by_type: Dict[str, int] = defaultdict(int)
         resources_by_region = {}
 
         for region, region_results in results.items():
@@ -284,16 +464,13 @@ class CollectorManager:
                 region_count += result.count
 
                 # Count by type
-                rt = result.resource_type.value
-                if rt not in resources_by_type:
-                    resources_by_type[rt] = 0
-                resources_by_type[rt] += result.count
+                resources_by_type[result.resource_type.value] += result.count
 
             resources_by_region[region] = region_count
 
         return {
             "total_resources": total_resources,
             "total_regions": len(results),
-            "resources_by_type": resources_by_type,
+            "resources_by_type": dict(resources_by_type),
             "resources_by_region": resources_by_region,
         }
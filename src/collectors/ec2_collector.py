@@ -2,6 +2,7 @@
 EC2 instance collector.
 """
 
+from itertools import chain
 from typing import Any, Dict, List, Optional
 
 from src.collectors.base import BaseCollector
@@ -23,6 +24,7 @@ class EC2Collector(BaseCollector):
         rate_limit: Optional[float] = None,
         vpc_id: Optional[str] = None,
         subnet_id: Optional[str] = None,
+        include_raw: Optional[bool] = None,
     ):
         """
         Initialize EC2 collector.
@@ -33,8 +35,9 @@ class EC2Collector(BaseCollector):
             rate_limit: Rate limit in requests/second
             vpc_id: Optional VPC ID to filter instances
             subnet_id: Optional Subnet ID to filter instances
+            include_raw: Keep the raw API response on each resource
         """
-        super().__init__(region, profile, rate_limit)
+        super().__init__(region, profile, rate_limit, include_raw)
         self.vpc_id = vpc_id
         self.subnet_id = subnet_id
 
@@ -79,43 +82,56 @@ class EC2Collector(BaseCollector):
             **kwargs,
         )
 
-        # Extract instances from reservations and normalize
-        normalized_instances = []
-        for reservation in reservations:
-            for instance in reservation.get("Instances", []):
-                normalized_instance = {
-                    "id": instance["InstanceId"],
-                    "instance_type": instance.get("InstanceType"),
-                    "state": instance.get("State", {}).get("Name"),
-                    "vpc_id": instance.get("VpcId"),
-                    "subnet_id": instance.get("SubnetId"),
-                    "private_ip": instance.get("PrivateIpAddress"),
-                    "public_ip": instance.get("PublicIpAddress"),
-                    "availability_zone": instance.get("Placement", {}).get(
-                        "AvailabilityZone"
-                    ),
-                    "security_groups": [
-                        {
-                            "id": sg.get("GroupId"),
-                            "name": sg.get("GroupName"),
-                        }
-                        for sg in instance.get("SecurityGroups", [])
-                    ],
-                    "network_interfaces": self._extract_network_interfaces(
-                        instance.get("NetworkInterfaces", [])
-                    ),
-                    "tags": self._extract_tags(instance.get("Tags", [])),
-                    "name": self._get_name_from_tags(instance.get("Tags", [])),
-                    "launch_time": instance.get("LaunchTime"),
-                    "platform": instance.get("Platform"),
-                    "architecture": instance.get("Architecture"),
-                    "region": self.region,
-                    "resource_type": self.resource_type.value,
-                    "raw": instance,
-                }
-                normalized_instances.append(normalized_instance)
+        # Flatten instances out of reservations and normalize
+        instances = chain.from_iterable(
+            reservation.get("Instances", ()) for reservation in reservations
+        )
+        return [self._normalize_instance(instance) for instance in instances]
 
-        return normalized_instances
+    def _normalize_instance(self, instance: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Normalize an EC2 instance.
+
+        Args:
+            instance: Instance dictionary from DescribeInstances
+
+        Returns:
+            Normalized instance dictionary
+        """
+        state = instance.get("State") or {}
+        placement = instance.get("Placement") or {}
+        tags, name = self._tags_and_name(instance.get("Tags"))
+
+        normalized = {
+            "id": instance["InstanceId"],
+            "instance_type": instance.get("InstanceType"),
+            "state": state.get("Name"),
+            "vpc_id": instance.get("VpcId"),
+            "subnet_id": instance.get("SubnetId"),
+            "private_ip": instance.get("PrivateIpAddress"),
+            "public_ip": instance.get("PublicIpAddress"),
+            "availability_zone": placement.get("AvailabilityZone"),
+            "security_groups": [
+                {
+                    "id": sg.get("GroupId"),
+                    "name": sg.get("GroupName"),
+                }
+                for sg in instance.get("SecurityGroups", ())
+            ],
+            "network_interfaces": self._extract_network_interfaces(
+                instance.get("NetworkInterfaces", ())
+            ),
+            "tags": tags,
+            "name": name,
+            "launch_time": instance.get("LaunchTime"),
+            "platform": instance.get("Platform"),
+            "architecture": instance.get("Architecture"),
+            "region": self.region,
+            "resource_type": self.resource_type.value,
+        }
+        if self.include_raw:
+            normalized["raw"] = instance
+        return normalized
 
     def _extract_network_interfaces(
         self, interfaces: List[Dict[str, Any]]
@@ -145,18 +161,3 @@ class EC2Collector(BaseCollector):
                 }
             )
         return result
-
-    def _extract_tags(self, tags: List[Dict[str, str]]) -> Dict[str, str]:
-        """Extract tags into a dictionary."""
-        if not tags:
-            return {}
-        return {tag["Key"]: tag["Value"] for tag in tags}
-
-    def _get_name_from_tags(self, tags: List[Dict[str, str]]) -> str:
-        """Get the Name tag value."""
-        if not tags:
-            return ""
-        for tag in tags:
-            if tag.get("Key") == "Name":
-                return tag.get("Value", "")
-        return ""
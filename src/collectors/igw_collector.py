@@ -22,6 +22,7 @@ class InternetGatewayCollector(BaseCollector):
         profile: Optional[str] = None,
         rate_limit: Optional[float] = None,
         vpc_id: Optional[str] = None,
+        include_raw: Optional[bool] = None,
     ):
         """
         Initialize Internet Gateway collector.
@@ -31,8 +32,9 @@ class InternetGatewayCollector(BaseCollector):
             profile: AWS profile
             rate_limit: Rate limit in requests/second
             vpc_id: Optional VPC ID to filter internet gateways
+            include_raw: Keep the raw API response on each resource
         """
-        super().__init__(region, profile, rate_limit)
+        super().__init__(region, profile, rate_limit, include_raw)
         self.vpc_id = vpc_id
 
     @property
@@ -78,6 +80,7 @@ class InternetGatewayCollector(BaseCollector):
         normalized_igws = []
         for igw in igws:
             attachments = igw.get("Attachments", [])
+            tags, name = self._tags_and_name(igw.get("Tags"))
             normalized_igw = {
                 "id": igw["InternetGatewayId"],
                 "attachments": [
@@ -88,27 +91,13 @@ class InternetGatewayCollector(BaseCollector):
                     for att in attachments
                 ],
                 "attached_vpc_ids": [att.get("VpcId") for att in attachments],
-                "tags": self._extract_tags(igw.get("Tags", [])),
-                "name": self._get_name_from_tags(igw.get("Tags", [])),
+                "tags": tags,
+                "name": name,
                 "region": self.region,
                 "resource_type": self.resource_type.value,
-                "raw": igw,
             }
+            if self.include_raw:
+                normalized_igw["raw"] = igw
             normalized_igws.append(normalized_igw)
 
         return normalized_igws
-
-    def _extract_tags(self, tags: List[Dict[str, str]]) -> Dict[str, str]:
-        """Extract tags into a dictionary."""
-        if not tags:
-            return {}
-        return {tag["Key"]: tag["Value"] for tag in tags}
-
-    def _get_name_from_tags(self, tags: List[Dict[str, str]]) -> str:
-        """Get the Name tag value."""
-        if not tags:
-            return ""
-        for tag in tags:
-            if tag.get("Key") == "Name":
-                return tag.get("Value", "")
-        return ""
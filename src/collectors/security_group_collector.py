@@ -2,7 +2,7 @@
 Security Group collector.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from src.collectors.base import BaseCollector
 from src.core.constants import ResourceType
@@ -22,6 +22,7 @@ class SecurityGroupCollector(BaseCollector):
         profile: Optional[str] = None,
         rate_limit: Optional[float] = None,
         vpc_id: Optional[str] = None,
+        include_raw: Optional[bool] = None,
     ):
         """
         Initialize Security Group collector.
@@ -31,8 +32,9 @@ class SecurityGroupCollector(BaseCollector):
             profile: AWS profile
             rate_limit: Rate limit in requests/second
             vpc_id: Optional VPC ID to filter security groups
+            include_raw: Keep the raw API response on each resource
         """
-        super().__init__(region, profile, rate_limit)
+        super().__init__(region, profile, rate_limit, include_raw)
         self.vpc_id = vpc_id
 
     @property
@@ -45,12 +47,15 @@ class SecurityGroupCollector(BaseCollector):
         """AWS service name."""
         return "ec2"
 
-    async def collect_resources(self) -> List[Dict[str, Any]]:
+    async def collect_resources(self) -> AsyncIterator[Dict[str, Any]]:
         """
         Collect Security Group resources.
 
-        Returns:
-            List of Security Group dictionaries with normalized structure
+        Security groups (and their rules) are normalized and yielded page
+        by page, so accounts with many rules can be streamed to a sink.
+
+        Yields:
+            Security Group dictionaries with normalized structure
 
         Raises:
             CollectorException: If collection fails
@@ -67,16 +72,15 @@ class SecurityGroupCollector(BaseCollector):
         if filters:
             kwargs["Filters"] = filters
 
-        security_groups = await self._paginated_call(
+        resource_type = self.resource_type.value
+
+        async for sg in self._paginated_iter(
             client=client,
             method_name="describe_security_groups",
             result_key="SecurityGroups",
             **kwargs,
-        )
-
-        # Normalize security group data
-        normalized_sgs = []
-        for sg in security_groups:
+        ):
+            # Normalize security group data
             normalized_sg = {
                 "id": sg["GroupId"],
                 "name": sg.get("GroupName"),
@@ -86,14 +90,13 @@ class SecurityGroupCollector(BaseCollector):
                 "egress_rules": self._normalize_rules(
                     sg.get("IpPermissionsEgress", [])
                 ),
-                "tags": self._extract_tags(sg.get("Tags", [])),
+                "tags": self._tags_and_name(sg.get("Tags"))[0],
                 "region": self.region,
-                "resource_type": self.resource_type.value,
-                "raw": sg,
+                "resource_type": resource_type,
             }
-            normalized_sgs.append(normalized_sg)
-
-        return normalized_sgs
+            if self.include_raw:
+                normalized_sg["raw"] = sg
+            yield normalized_sg
 
     def _normalize_rules(self, rules: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -141,9 +144,3 @@ class SecurityGroupCollector(BaseCollector):
             normalized_rules.append(normalized_rule)
 
         return normalized_rules
-
-    def _extract_tags(self, tags: List[Dict[str, str]]) -> Dict[str, str]:
-        """Extract tags into a dictionary."""
-        if not tags:
-            return {}
-        return {tag["Key"]: tag["Value"] for tag in tags}
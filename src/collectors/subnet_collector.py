@@ -22,6 +22,7 @@ class SubnetCollector(BaseCollector):
         profile: Optional[str] = None,
         rate_limit: Optional[float] = None,
         vpc_id: Optional[str] = None,
+        include_raw: Optional[bool] = None,
     ):
         """
         Initialize subnet collector.
@@ -31,8 +32,9 @@ class SubnetCollector(BaseCollector):
             profile: AWS profile
             rate_limit: Rate limit in requests/second
             vpc_id: Optional VPC ID to filter subnets
+            include_raw: Keep the raw API response on each resource
         """
-        super().__init__(region, profile, rate_limit)
+        super().__init__(region, profile, rate_limit, include_raw)
         self.vpc_id = vpc_id
 
     @property
@@ -77,6 +79,7 @@ class SubnetCollector(BaseCollector):
         # Normalize subnet data
         normalized_subnets = []
         for subnet in subnets:
+            tags, name = self._tags_and_name(subnet.get("Tags"))
             normalized_subnet = {
                 "id": subnet["SubnetId"],
                 "vpc_id": subnet["VpcId"],
@@ -87,23 +90,13 @@ class SubnetCollector(BaseCollector):
                 "state": subnet.get("State"),
                 "map_public_ip_on_launch": subnet.get("MapPublicIpOnLaunch", False),
                 "default_for_az": subnet.get("DefaultForAz", False),
-                "tags": self._extract_tags(subnet.get("Tags", [])),
-                "name": self._get_name_from_tags(subnet.get("Tags", [])),
+                "tags": tags,
+                "name": name,
                 "region": self.region,
                 "resource_type": self.resource_type.value,
-                "raw": subnet,
             }
+            if self.include_raw:
+                normalized_subnet["raw"] = subnet
             normalized_subnets.append(normalized_subnet)
 
         return normalized_subnets
-
-    def _extract_tags(self, tags: List[Dict[str, str]]) -> Dict[str, str]:
-        """Extract tags into a dictionary."""
-        return {tag["Key"]: tag["Value"] for tag in tags}
-
-    def _get_name_from_tags(self, tags: List[Dict[str, str]]) -> str:
-        """Get the Name tag value."""
-        for tag in tags:
-            if tag.get("Key") == "Name":
-                return tag.get("Value", "")
-        return ""
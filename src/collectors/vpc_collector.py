@@ -48,6 +48,7 @@ class VPCCollector(BaseCollector):
         # Normalize VPC data
         normalized_vpcs = []
         for vpc in vpcs:
+            tags, name = self._tags_and_name(vpc.get("Tags"))
             normalized_vpc = {
                 "id": vpc["VpcId"],
                 "cidr_block": vpc.get("CidrBlock"),
@@ -55,39 +56,13 @@ class VPCCollector(BaseCollector):
                 "is_default": vpc.get("IsDefault", False),
                 "dhcp_options_id": vpc.get("DhcpOptionsId"),
                 "instance_tenancy": vpc.get("InstanceTenancy"),
-                "tags": self._extract_tags(vpc.get("Tags", [])),
-                "name": self._get_name_from_tags(vpc.get("Tags", [])),
+                "tags": tags,
+                "name": name,
                 "region": self.region,
                 "resource_type": self.resource_type.value,
-                "raw": vpc,  # Keep raw data for advanced analysis
             }
+            if self.include_raw:
+                normalized_vpc["raw"] = vpc
             normalized_vpcs.append(normalized_vpc)
 
         return normalized_vpcs
-
-    def _extract_tags(self, tags: List[Dict[str, str]]) -> Dict[str, str]:
-        """
-        Extract tags into a dictionary.
-
-        Args:
-            tags: List of tag dictionaries
-
-        Returns:
-            Dictionary of tag key-value pairs
-        """
-        return {tag["Key"]: tag["Value"] for tag in tags}
-
-    def _get_name_from_tags(self, tags: List[Dict[str, str]]) -> str:
-        """
-        Get the Name tag value.
-
-        Args:
-            tags: List of tag dictionaries
-
-        Returns:
-            Name tag value or empty string
-        """
-        for tag in tags:
-            if tag.get("Key") == "Name":
-                return tag.get("Value", "")
-        return ""
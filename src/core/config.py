@@ -38,8 +38,20 @@ class Settings(BaseSettings):
     # Observability settings
     enable_xray: bool = Field(default=True, description="Enable AWS X-Ray tracing")
     enable_metrics: bool = Field(default=True, description="Enable CloudWatch metrics")
+    enable_metrics_atexit_flush: bool = Field(
+        default=False,
+        description="Flush buffered metrics when the interpreter exits (long-running CLI use)"
+    )
     enable_structured_logging: bool = Field(default=True, description="Enable structured JSON logging")
     log_level: str = Field(default="INFO", description="Logging level")
+    enable_profiling: bool = Field(
+        default=False,
+        description="Profile collection runs (Scalene when running under it, else cProfile)"
+    )
+    profile_output_dir: str = Field(
+        default="profiles",
+        description="Directory for cProfile stats files"
+    )
 
     # CloudWatch settings
     cloudwatch_namespace: str = Field(
@@ -64,6 +76,16 @@ class Settings(BaseSettings):
         le=300,
         description="AWS API call timeout in seconds"
     )
+    api_connect_timeout: int = Field(
+        default=5,
+        ge=1,
+        le=60,
+        description="AWS API connection timeout in seconds"
+    )
+    use_async_aws_clients: bool = Field(
+        default=False,
+        description="Use aioboto3 clients for collector API calls when installed"
+    )
     max_retry_attempts: int = Field(
         default=3,
         ge=0,
@@ -119,6 +141,13 @@ class Settings(BaseSettings):
         le=1.0,
         description="Temperature for AI analysis"
     )
+    bedrock_sync_workers: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=64,
+        description="Threads for async callers of the sync Bedrock client "
+        "(defaults to min(32, CPU count + 4))"
+    )
 
     # Visualization settings
     default_output_format: str = Field(
@@ -154,6 +183,10 @@ class Settings(BaseSettings):
     collect_load_balancers: bool = Field(default=True, description="Collect Load Balancers")
     collect_rds_instances: bool = Field(default=True, description="Collect RDS instances")
     collect_lambda_enis: bool = Field(default=True, description="Collect Lambda ENIs")
+    include_raw_resources: bool = Field(
+        default=False,
+        description="Keep the raw API response under 'raw' in each collected resource"
+    )
 
     # Security settings
     secrets_manager_enabled: bool = Field(
@@ -129,6 +129,9 @@ AWS_API_RATE_LIMITS = {
     "rds:DescribeDBInstances": 100,
 }
 
+# Starting rate for services not listed in AWS_API_RATE_LIMITS
+DEFAULT_SERVICE_RATE_LIMIT = 100
+
 # Maximum resources to collect per region (safety limits)
 MAX_RESOURCES_PER_TYPE = 10000
 
@@ -146,10 +149,35 @@ DEFAULT_RETRY_MAX_DELAY = 60.0
 DEFAULT_BATCH_SIZE = 100
 MAX_CONCURRENT_REQUESTS = 10
 
+# Regions discovered in parallel by the discovery Lambda (one thread each)
+MAX_DISCOVERY_REGION_WORKERS = 8
+
+# Connection pool size for shared collector clients
+AWS_CLIENT_MAX_POOL_CONNECTIONS = 50
+
 # AI Analysis
 BEDROCK_MAX_TOKENS = 4096
 BEDROCK_TEMPERATURE = 0.0
 
+# Claude model families on Bedrock that accept cache_control checkpoints,
+# matched against model IDs with any inference-profile prefix removed.
+# Other models reject requests that contain cache_control blocks.
+BEDROCK_PROMPT_CACHE_MODELS = (
+    "anthropic.claude-3-5-haiku",
+    "anthropic.claude-3-7-sonnet",
+    "anthropic.claude-sonnet-4",
+    "anthropic.claude-opus-4",
+    "anthropic.claude-haiku-4",
+)
+
+# In-process cache of Bedrock topology analyses
+BEDROCK_RESPONSE_CACHE_SIZE = 32
+BEDROCK_RESPONSE_CACHE_TTL = 24 * 60 * 60  # 24 hours
+
+# Topologies smaller than this are not worth a Bedrock call; the rule-based
+# checks already cover them
+MIN_AI_ANALYSIS_NODES = 3
+
 # Visualization
 DEFAULT_GRAPH_WIDTH = 1920
 DEFAULT_GRAPH_HEIGHT = 1080
@@ -66,6 +66,36 @@ class CollectorException(NetworkVisualizerException):
             details["resource_id"] = resource_id
         super().__init__(message, error_code="COLLECTOR_ERROR", details=details)
 
+    @classmethod
+    def from_client_error(
+        cls,
+        error: Exception,
+        api_name: str,
+        resource_type: Optional[str] = None,
+    ) -> "CollectorException":
+        """
+        Build a collector exception for a failed AWS API call.
+
+        Raise the result with `raise ... from error` so the botocore
+        ClientError stays available as __cause__.
+
+        Args:
+            error: botocore ClientError from the call
+            api_name: API name (e.g., 'ec2:describe_vpcs')
+            resource_type: Type of AWS resource being collected
+
+        Returns:
+            CollectorException with the API name and AWS error code
+        """
+        error_code = (
+            getattr(error, "response", {}).get("Error", {}).get("Code", "Unknown")
+        )
+        return cls(
+            f"AWS API call failed: {error}",
+            resource_type=resource_type,
+            details={"api_name": api_name, "error_code": error_code},
+        )
+
 
 class StorageException(NetworkVisualizerException):
     """Exception raised during storage operations."""
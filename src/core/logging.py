@@ -11,6 +11,7 @@ import uuid
 from contextvars import ContextVar
 from typing import Any, Dict, Optional
 
+import orjson
 from pythonjsonlogger import jsonlogger
 
 from src.core.config import get_settings
@@ -20,6 +21,26 @@ request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=Non
 trace_id_var: ContextVar[Optional[str]] = ContextVar("trace_id", default=None)
 
 
+def _orjson_serializer(obj: Any, default: Optional[Any] = None, **kwargs: Any) -> str:
+    """
+    Serialize a log record with orjson.
+
+    Drop-in for the json.dumps-compatible serializer python-json-logger
+    calls; its cls/indent/ensure_ascii arguments are ignored.
+
+    Args:
+        obj: Log record dictionary
+        default: Fallback for values orjson cannot encode natively
+        **kwargs: Remaining json.dumps arguments (ignored)
+
+    Returns:
+        JSON string
+    """
+    return orjson.dumps(
+        obj, default=default or str, option=orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
 class CustomJsonFormatter(jsonlogger.JsonFormatter):
     """
     Custom JSON formatter that includes request context and standardized fields.
@@ -113,6 +134,8 @@ def setup_logging(
         formatter = CustomJsonFormatter(
             "%(timestamp)s %(level)s %(name)s %(message)s",
             datefmt="%Y-%m-%dT%H:%M:%S.%fZ",
+            json_default=str,
+            json_serializer=_orjson_serializer,
         )
     else:
         # Use standard formatter for development
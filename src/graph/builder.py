@@ -6,10 +6,12 @@ establishing relationships and dependencies between network components.
 """
 
 import time
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Set, Tuple
 
 import networkx as nx
+import orjson
 
 from src.collectors.base import CollectorResult
 from src.core.constants import RelationshipType, ResourceType
@@ -78,7 +80,7 @@ class GraphBuilder:
             graph = nx.DiGraph()
 
             # Track resource counts
-            resource_counts = {}
+            resource_counts: Dict[str, int] = defaultdict(int)
 
             # Add nodes for each resource
             for region, results in results_by_region.items():
@@ -86,10 +88,7 @@ class GraphBuilder:
                     if not result.success:
                         continue
 
-                    resource_type = result.resource_type.value
-                    if resource_type not in resource_counts:
-                        resource_counts[resource_type] = 0
-                    resource_counts[resource_type] += len(result.resources)
+                    resource_counts[result.resource_type.value] += len(result.resources)
 
                     # Add nodes based on resource type
                     if result.resource_type == ResourceType.VPC:
@@ -110,7 +109,7 @@ class GraphBuilder:
             network_graph = NetworkGraph(
                 graph=graph,
                 build_time=time.time() - start_time,
-                resource_counts=resource_counts,
+                resource_counts=dict(resource_counts),
                 metadata={
                     "regions": list(results_by_region.keys()),
                     "build_timestamp": time.time(),
@@ -289,19 +288,23 @@ class GraphBuilder:
                             label="protects",
                         )
 
-    def export_to_dict(self, network_graph: NetworkGraph) -> Dict[str, Any]:
+    def export_to_dict_iter(
+        self, network_graph: NetworkGraph
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
         """
-        Export graph to dictionary format.
+        Lazily export graph nodes and edges.
+
+        Yields all nodes first, then all edges, so callers can stream the
+        export without holding every node/edge dictionary at once.
 
         Args:
             network_graph: NetworkGraph to export
 
-        Returns:
-            Dictionary representation of the graph
+        Yields:
+            ("node", node_dict) and ("edge", edge_dict) tuples
         """
         graph = network_graph.graph
 
-        nodes = []
         for node_id, node_data in graph.nodes(data=True):
             node_dict = {
                 "id": node_id,
@@ -313,18 +316,33 @@ class GraphBuilder:
             for key, value in node_data.items():
                 if key not in ["data", "tags"] and value is not None:
                     node_dict[key] = value
-            nodes.append(node_dict)
+            yield "node", node_dict
 
-        edges = []
         for source, target, edge_data in graph.edges(data=True):
-            edges.append(
-                {
-                    "source": source,
-                    "target": target,
-                    "relationship": edge_data.get("relationship"),
-                    "label": edge_data.get("label", ""),
-                }
-            )
+            yield "edge", {
+                "source": source,
+                "target": target,
+                "relationship": edge_data.get("relationship"),
+                "label": edge_data.get("label", ""),
+            }
+
+    def export_to_dict(self, network_graph: NetworkGraph) -> Dict[str, Any]:
+        """
+        Export graph to dictionary format.
+
+        Args:
+            network_graph: NetworkGraph to export
+
+        Returns:
+            Dictionary representation of the graph
+        """
+        nodes = []
+        edges = []
+        for kind, item in self.export_to_dict_iter(network_graph):
+            if kind == "node":
+                nodes.append(item)
+            else:
+                edges.append(item)
 
         return {
             "nodes": nodes,
@@ -334,3 +352,99 @@ class GraphBuilder:
             "edge_count": network_graph.edge_count,
             "resource_counts": network_graph.resource_counts,
         }
+
+    def from_dict(self, data: Dict[str, Any]) -> NetworkGraph:
+        """
+        Rebuild a graph from the output of ``export_to_dict``.
+
+        The export omits each node's raw ``data`` payload, so the exported
+        node attributes stand in for it; analysis that reads ``data`` (e.g.
+        security group ingress rules) keeps working on a restored graph.
+
+        Args:
+            data: Dictionary produced by ``export_to_dict``
+
+        Returns:
+            NetworkGraph equivalent to the exported one
+        """
+        start_time = time.time()
+
+        graph = nx.DiGraph()
+        graph.add_nodes_from(
+            (
+                node["id"],
+                {
+                    **{k: v for k, v in node.items() if k != "id"},
+                    "data": node,
+                },
+            )
+            for node in data.get("nodes", [])
+        )
+        graph.add_edges_from(
+            (
+                edge["source"],
+                edge["target"],
+                {
+                    "relationship": edge.get("relationship"),
+                    "label": edge.get("label", ""),
+                },
+            )
+            for edge in data.get("edges", [])
+        )
+
+        network_graph = NetworkGraph(
+            graph=graph,
+            build_time=time.time() - start_time,
+            resource_counts=dict(data.get("resource_counts", {})),
+            metadata=dict(data.get("metadata", {})),
+        )
+
+        logger.info(
+            f"Restored graph with {network_graph.node_count} nodes and {network_graph.edge_count} edges",
+            extra={
+                "nodes": network_graph.node_count,
+                "edges": network_graph.edge_count,
+                "duration": network_graph.build_time,
+            },
+        )
+
+        return network_graph
+
+    def write_json(self, network_graph: NetworkGraph, fp: BinaryIO) -> None:
+        """
+        Stream the graph export as JSON to a binary file object.
+
+        Produces the same document as ``export_to_dict`` but serializes each
+        node and edge as it is generated, keeping memory usage independent
+        of graph size.
+
+        Args:
+            network_graph: NetworkGraph to export
+            fp: File object opened in binary write mode
+        """
+        fp.write(b'{"nodes":[')
+        section = "node"
+        first = True
+
+        for kind, item in self.export_to_dict_iter(network_graph):
+            if kind != section:
+                fp.write(b'],"edges":[')
+                section = kind
+                first = True
+            if not first:
+                fp.write(b",")
+            fp.write(orjson.dumps(item, default=str, option=orjson.OPT_NON_STR_KEYS))
+            first = False
+
+        if section == "node":
+            fp.write(b'],"edges":[')
+
+        fp.write(b'],"metadata":')
+        fp.write(orjson.dumps(network_graph.metadata, default=str))
+        fp.write(b',"node_count":')
+        fp.write(orjson.dumps(network_graph.node_count))
+        fp.write(b',"edge_count":')
+        fp.write(orjson.dumps(network_graph.edge_count))
+        fp.write(b',"resource_counts":')
+        fp.write(orjson.dumps(network_graph.resource_counts))
+        fp.write(b"}")
@@ -7,13 +7,21 @@ This module provides comprehensive observability features including:
 - Performance monitoring
 """
 
-from src.observability.metrics import MetricsPublisher, get_metrics_publisher
+from src.observability.metrics import (
+    MetricsPublisher,
+    flush_metrics,
+    get_metrics_publisher,
+)
+from src.observability.profiling import profile, profile_block
 from src.observability.tracing import trace_function, trace_async_function, get_tracer
 
 __all__ = [
     "MetricsPublisher",
     "get_metrics_publisher",
+    "flush_metrics",
     "trace_function",
     "trace_async_function",
     "get_tracer",
+    "profile",
+    "profile_block",
 ]
@@ -5,9 +5,13 @@ This module provides a comprehensive metrics publishing system for tracking
 application performance, API usage, errors, and resource counts.
 """
 
+import atexit
+import threading
 import time
+from collections import Counter
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 import boto3
 from botocore.exceptions import ClientError
@@ -18,6 +22,9 @@ from src.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# CloudWatch limit on distinct Values in one MetricDatum
+MAX_VALUES_PER_DATUM = 150
+
 
 class MetricsPublisher:
     """
@@ -36,8 +43,15 @@ class MetricsPublisher:
         self.enabled = settings.enable_metrics
 
         self._client = None
+        # Datapoints for the same metric, unit and dimensions are coalesced
+        # into one datum's Values/Counts; _open_datums maps each key to the
+        # datum still accepting values
         self._metric_buffer: List[Dict[str, Any]] = []
-        self._buffer_size = 20  # CloudWatch max is 20 metrics per request
+        self._open_datums: Dict[Tuple, Dict[str, Any]] = {}
+        self._buffer_size = 1000  # CloudWatch max is 1000 metrics per request
+        self._flush_interval = 60.0  # CloudWatch's standard resolution
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
 
         if self.enabled:
             try:
@@ -60,7 +74,11 @@ class MetricsPublisher:
         timestamp: Optional[datetime] = None,
     ) -> None:
         """
-        Publish a single metric to CloudWatch.
+        Buffer a single metric for publishing to CloudWatch.
+
+        Repeated datapoints for the same metric and dimensions are
+        aggregated, and the buffer is sent once it fills a PutMetricData
+        request or the flush interval has passed.
 
         Args:
             metric_name: Metric name
@@ -72,22 +90,49 @@ class MetricsPublisher:
         if not self.enabled:
             return
 
-        metric_data = {
-            "MetricName": metric_name,
-            "Value": value,
-            "Unit": unit,
-            "Timestamp": timestamp or datetime.utcnow(),
-        }
-
-        if dimensions:
-            metric_data["Dimensions"] = [
-                {"Name": k, "Value": v} for k, v in dimensions.items()
-            ]
+        # Undated values are filed under the current minute (CloudWatch's
+        # standard resolution), so a value is never back-dated to an
+        # earlier datapoint's time
+        if timestamp is None:
+            timestamp = datetime.utcnow().replace(second=0, microsecond=0)
+
+        key = (
+            metric_name,
+            unit,
+            tuple(sorted(dimensions.items())) if dimensions else (),
+            timestamp,
+        )
 
-        self._metric_buffer.append(metric_data)
+        with self._lock:
+            metric_data = self._open_datums.get(key)
+            if metric_data is None:
+                metric_data = {
+                    "MetricName": metric_name,
+                    "Unit": unit,
+                    "Timestamp": timestamp,
+                    "Values": Counter(),
+                }
+                if dimensions:
+                    metric_data["Dimensions"] = [
+                        {"Name": k, "Value": v} for k, v in dimensions.items()
+                    ]
+                self._metric_buffer.append(metric_data)
+                self._open_datums[key] = metric_data
+
+            values = metric_data["Values"]
+            values[value] += 1
+
+            # A datum holds at most 150 distinct values
+            if len(values) >= MAX_VALUES_PER_DATUM:
+                del self._open_datums[key]
+
+            # Flush when a request is full or the interval has passed
+            flush_due = (
+                len(self._metric_buffer) >= self._buffer_size
+                or time.monotonic() - self._last_flush >= self._flush_interval
+            )
 
-        # Flush buffer if it reaches the size limit
-        if len(self._metric_buffer) >= self._buffer_size:
+        if flush_due:
             self.flush()
 
     def put_duration(
@@ -250,11 +295,30 @@ class MetricsPublisher:
             dimensions=dimensions,
         )
 
+    def record_anomaly_batch(self, counts: Mapping[Tuple[str, str], int]) -> None:
+        """
+        Record anomaly counts aggregated by type and severity.
+
+        Publishes one datapoint per (anomaly_type, severity) pair rather
+        than one per anomaly.
+
+        Args:
+            counts: Mapping of (anomaly_type, severity) to number detected
+        """
+        for (anomaly_type, severity), count in counts.items():
+            self.record_anomaly(
+                anomaly_type=anomaly_type,
+                severity=severity,
+                count=count,
+            )
+
     def record_bedrock_usage(
         self,
         model_id: str,
         input_tokens: int,
         output_tokens: int,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
     ) -> None:
         """
         Record Bedrock token usage.
@@ -263,6 +327,8 @@ class MetricsPublisher:
             model_id: Bedrock model ID
             input_tokens: Number of input tokens
             output_tokens: Number of output tokens
+            cache_read_tokens: Number of input tokens read from the prompt cache
+            cache_write_tokens: Number of input tokens written to the prompt cache
         """
         dimensions = {"ModelId": model_id, "TokenType": "Input"}
         self.put_count(
@@ -278,41 +344,68 @@ class MetricsPublisher:
             dimensions=dimensions,
         )
 
+        if cache_read_tokens:
+            dimensions["TokenType"] = "CacheRead"
+            self.put_count(
+                metric_name=MetricName.BEDROCK_TOKEN_USAGE,
+                count=cache_read_tokens,
+                dimensions=dimensions,
+            )
+
+        if cache_write_tokens:
+            dimensions["TokenType"] = "CacheWrite"
+            self.put_count(
+                metric_name=MetricName.BEDROCK_TOKEN_USAGE,
+                count=cache_write_tokens,
+                dimensions=dimensions,
+            )
+
     def flush(self) -> None:
         """
         Flush buffered metrics to CloudWatch.
         """
-        if not self.enabled or not self._metric_buffer:
+        if not self.enabled:
+            return
+
+        with self._lock:
+            buffer = self._metric_buffer
+            self._metric_buffer = []
+            self._open_datums.clear()
+            self._last_flush = time.monotonic()
+
+        if not buffer:
             return
 
         if not self._client:
             logger.warning("CloudWatch client not initialized, cannot flush metrics")
-            self._metric_buffer.clear()
             return
 
+        for metric_data in buffer:
+            values = metric_data.pop("Values")
+            metric_data["Values"] = list(values.keys())
+            metric_data["Counts"] = [float(count) for count in values.values()]
+
         try:
             # Split buffer into chunks of max size
-            for i in range(0, len(self._metric_buffer), self._buffer_size):
-                chunk = self._metric_buffer[i : i + self._buffer_size]
+            for i in range(0, len(buffer), self._buffer_size):
+                chunk = buffer[i : i + self._buffer_size]
 
                 self._client.put_metric_data(
                     Namespace=self.namespace,
                     MetricData=chunk,
                 )
 
-            logger.debug(f"Flushed {len(self._metric_buffer)} metrics to CloudWatch")
-            self._metric_buffer.clear()
+            logger.debug(f"Flushed {len(buffer)} metrics to CloudWatch")
 
         except ClientError as e:
             logger.error(f"Failed to publish metrics to CloudWatch: {e}")
-            self._metric_buffer.clear()
         except Exception as e:
             logger.error(f"Unexpected error publishing metrics: {e}")
-            self._metric_buffer.clear()
 
     def __del__(self):
         """Flush remaining metrics on deletion."""
-        self.flush()
+        if self._metric_buffer:
+            self.flush()
 
 
 class MetricsTimer:
@@ -346,13 +439,13 @@ class MetricsTimer:
 
     def __enter__(self):
         """Start the timer."""
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Stop the timer and publish the metric."""
         if self.start_time is not None:
-            duration = time.time() - self.start_time
+            duration = time.perf_counter() - self.start_time
             self.publisher.put_duration(
                 metric_name=self.metric_name,
                 duration_seconds=duration,
@@ -360,18 +453,43 @@ class MetricsTimer:
             )
 
 
-# Global metrics publisher instance
-_metrics_publisher: Optional[MetricsPublisher] = None
-
-
+@lru_cache()
 def get_metrics_publisher() -> MetricsPublisher:
     """
     Get the global metrics publisher instance.
 
+    Cached like get_settings, so every detector, builder and collector
+    shares one publisher (and one CloudWatch client and buffer). With
+    enable_metrics_atexit_flush set, anything still buffered is flushed
+    when the interpreter exits; otherwise callers use flush_metrics().
+
     Returns:
         MetricsPublisher instance
     """
-    global _metrics_publisher
-    if _metrics_publisher is None:
-        _metrics_publisher = MetricsPublisher()
-    return _metrics_publisher
+    publisher = MetricsPublisher()
+    if get_settings().enable_metrics_atexit_flush:
+        atexit.register(_flush_at_exit, publisher)
+    return publisher
+
+
+def _flush_at_exit(publisher: MetricsPublisher) -> None:
+    """
+    Flush a publisher at interpreter exit, if it has anything buffered.
+
+    Args:
+        publisher: Metrics publisher to flush
+    """
+    if publisher._metric_buffer:
+        publisher.flush()
+
+
+def flush_metrics() -> None:
+    """
+    Flush the global metrics publisher, if one has been created.
+
+    Exit-time flushing is off by default (and atexit does not run when
+    Lambda freezes or recycles a container), so handlers call this before
+    returning to publish the invocation's metrics.
+    """
+    if get_metrics_publisher.cache_info().currsize:
+        get_metrics_publisher().flush()
@@ -0,0 +1,84 @@
+"""
+Opt-in profiling for collection runs.
+
+This module provides a context manager for profiling whole operations and
+a line_profiler hook for marking hot paths. Both are no-ops unless enabled.
+"""
+
+import builtins
+import cProfile
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, TypeVar
+
+from src.core.config import get_settings
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Type variable for function signatures
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _identity(func: F) -> F:
+    """Return func unchanged (profile hook when kernprof is not running)."""
+    return func
+
+
+# kernprof (line_profiler) injects `profile` into builtins; outside it the
+# decorator does nothing. Run `kernprof -l -v network_visualizer.py ...` to
+# get line timings for decorated functions.
+profile: Callable[[F], F] = getattr(builtins, "profile", _identity)
+
+
+@contextmanager
+def profile_block(name: str) -> Iterator[None]:
+    """
+    Profile a block of code when profiling is enabled.
+
+    Under Scalene (`scalene --off network_visualizer.py ...`) the block is
+    profiled with Scalene, which attributes time in async code correctly.
+    Otherwise cProfile stats are written to <profile_output_dir>/<name>.prof
+    for snakeviz or pstats.
+
+    Args:
+        name: Name of the profiled operation
+
+    Example:
+        with profile_block("collect_all"):
+            results = await manager.collect_all()
+    """
+    settings = get_settings()
+    if not settings.enable_profiling:
+        yield
+        return
+
+    # Scalene is already loaded when the process runs under it
+    scalene_profiler = sys.modules.get("scalene.scalene_profiler")
+
+    if scalene_profiler is not None:
+        scalene_profiler.start()
+        try:
+            yield
+        finally:
+            scalene_profiler.stop()
+        return
+
+    output_dir = Path(settings.profile_output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / f"{name}.prof"
+
+    profiler = cProfile.Profile()
+    start_time = time.perf_counter()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(output_path)
+        logger.info(
+            f"Profiled {name} in {time.perf_counter() - start_time:.2f}s, stats written to {output_path}",
+            extra={"operation": name, "profile_path": str(output_path)},
+        )
@@ -6,7 +6,7 @@ network topology data using Amazon DynamoDB.
 """
 
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import boto3
 from botocore.exceptions import ClientError
@@ -79,19 +79,14 @@ class DynamoDBRepository:
         start_time = time.time()
 
         try:
-            timestamp = int(time.time())
-            ttl = timestamp + (ttl_days * 24 * 60 * 60)
-
-            item = {
-                "PK": f"{region}#{vpc_id}",
-                "SK": timestamp,
-                "region": region,
-                "vpc_id": vpc_id,
-                "topology_data": topology_data,
-                "metadata": metadata or {},
-                "ttl": ttl,
-                "created_at": timestamp,
-            }
+            item = self._build_item(
+                region=region,
+                vpc_id=vpc_id,
+                topology_data=topology_data,
+                metadata=metadata,
+                ttl_days=ttl_days,
+                timestamp=int(time.time()),
+            )
 
             self.table.put_item(Item=item)
 
@@ -123,6 +118,103 @@ class DynamoDBRepository:
                 storage_type="dynamodb",
             )
 
+    def save_topologies(
+        self,
+        vpcs: List[Tuple[str, str]],
+        topology_data: Dict[str, Any],
+        metadata: Optional[Dict[str, Any]] = None,
+        ttl_days: int = 30,
+        s3_key: Optional[str] = None,
+    ) -> None:
+        """
+        Save the same topology for many VPCs using batched writes.
+
+        Items are written through the table's batch writer, which groups
+        them into BatchWriteItem calls of up to 25 items and resubmits
+        unprocessed items.
+
+        Args:
+            vpcs: List of (region, vpc_id) pairs
+            topology_data: Topology data to store
+            metadata: Additional metadata
+            ttl_days: Time to live in days
+            s3_key: Optional S3 key of the archived topology
+
+        Raises:
+            StorageException: If save fails
+        """
+        if not vpcs:
+            return
+
+        start_time = time.time()
+        timestamp = int(time.time())
+
+        try:
+            with self.table.batch_writer(overwrite_by_pkeys=["PK", "SK"]) as batch:
+                for region, vpc_id in vpcs:
+                    batch.put_item(
+                        Item=self._build_item(
+                            region=region,
+                            vpc_id=vpc_id,
+                            topology_data=topology_data,
+                            metadata=metadata,
+                            ttl_days=ttl_days,
+                            timestamp=timestamp,
+                            s3_key=s3_key,
+                        )
+                    )
+
+            duration = time.time() - start_time
+            self.metrics.put_duration(
+                "DynamoDBWriteLatency",
+                duration,
+                {"Operation": "save_topologies"},
+            )
+
+            logger.info(
+                f"Saved topology for {len(vpcs)} VPCs",
+                extra={"count": len(vpcs), "duration": duration},
+            )
+
+        except ClientError as e:
+            logger.error(
+                f"Failed to save topologies: {e}",
+                extra={"count": len(vpcs)},
+            )
+            raise StorageException(
+                f"Failed to save topologies: {e}",
+                operation="write",
+                storage_type="dynamodb",
+            )
+
+    def _build_item(
+        self,
+        region: str,
+        vpc_id: str,
+        topology_data: Dict[str, Any],
+        metadata: Optional[Dict[str, Any]],
+        ttl_days: int,
+        timestamp: int,
+        s3_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Build a topology item for the given VPC."""
+        item = {
+            "PK": f"{region}#{vpc_id}",
+            "SK": timestamp,
+            "region": region,
+            "vpc_id": vpc_id,
+            "topology_data": topology_data,
+            "metadata": metadata or {},
+            # Top-level copies so history queries can project just the counts
+            "node_count": topology_data.get("node_count", 0),
+            "edge_count": topology_data.get("edge_count", 0),
+            "ttl": timestamp + (ttl_days * 24 * 60 * 60),
+            "created_at": timestamp,
+        }
+        if s3_key:
+            item["s3_key"] = s3_key
+        return item
+
     def get_latest_topology(
         self,
         region: str,
@@ -188,6 +280,7 @@ class DynamoDBRepository:
         region: str,
         vpc_id: str,
         limit: int = 10,
+        projection: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Get topology history for a VPC.
@@ -196,6 +289,8 @@ class DynamoDBRepository:
             region: AWS region
             vpc_id: VPC identifier
             limit: Maximum number of records to return
+            projection: Optional attribute paths to return (e.g. "SK" or
+                "topology_data.node_count"); all attributes if not set
 
         Returns:
             List of topology records
@@ -204,12 +299,28 @@ class DynamoDBRepository:
             StorageException: If retrieval fails
         """
         try:
-            response = self.table.query(
-                KeyConditionExpression="PK = :pk",
-                ExpressionAttributeValues={":pk": f"{region}#{vpc_id}"},
-                ScanIndexForward=False,
-                Limit=limit,
-            )
+            query_kwargs = {
+                "KeyConditionExpression": "PK = :pk",
+                "ExpressionAttributeValues": {":pk": f"{region}#{vpc_id}"},
+                "ScanIndexForward": False,
+                "Limit": limit,
+            }
+
+            if projection:
+                # Alias every path segment to avoid DynamoDB reserved words
+                names: Dict[str, str] = {}
+                paths = []
+                for path in projection:
+                    aliases = []
+                    for part in path.split("."):
+                        alias = f"#a{len(names)}"
+                        names[alias] = part
+                        aliases.append(alias)
+                    paths.append(".".join(aliases))
+                query_kwargs["ProjectionExpression"] = ", ".join(paths)
+                query_kwargs["ExpressionAttributeNames"] = names
+
+            response = self.table.query(**query_kwargs)
 
             items = response.get("Items", [])
             logger.info(
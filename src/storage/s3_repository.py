@@ -5,12 +5,13 @@ This module provides storage for large files like visualizations,
 topology archives, and analysis reports.
 """
 
-import json
 import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import boto3
+import orjson
+import zstandard
 from botocore.exceptions import ClientError
 
 from src.core.config import get_settings
@@ -27,8 +28,10 @@ class S3Repository:
 
     Bucket structure:
         /topologies/{region}/{vpc_id}/{timestamp}.json
+        /topologies/full/{run_id}/{timestamp}.json
         /visualizations/{region}/{vpc_id}/{timestamp}.png
         /analyses/{region}/{vpc_id}/{timestamp}.json
+        /analyses/{region}/{vpc_id}/latest.json
         /archives/{date}/{full_topology}.json.gz
     """
 
@@ -98,7 +101,9 @@ class S3Repository:
             self.client.put_object(
                 Bucket=self.bucket_name,
                 Key=key,
-                Body=json.dumps(topology_data, indent=2, default=str),
+                Body=orjson.dumps(
+                    topology_data, default=str, option=orjson.OPT_NON_STR_KEYS
+                ),
                 ContentType="application/json",
                 ServerSideEncryption="AES256",
             )
@@ -125,6 +130,69 @@ class S3Repository:
                 storage_type="s3",
             )
 
+    def upload_full_topology(
+        self,
+        run_id: str,
+        topology_data: Dict[str, Any],
+        timestamp: Optional[int] = None,
+    ) -> str:
+        """
+        Upload a multi-VPC topology snapshot to S3 once per discovery run.
+
+        Args:
+            run_id: Discovery run identifier (e.g. Lambda request ID)
+            topology_data: Topology data
+            timestamp: Optional timestamp (defaults to now)
+
+        Returns:
+            S3 object key
+
+        Raises:
+            StorageException: If upload fails
+        """
+        if not self.client:
+            raise StorageException(
+                "S3 client not initialized",
+                storage_type="s3",
+            )
+
+        start_time = time.time()
+        timestamp = timestamp or int(time.time())
+        key = f"topologies/full/{run_id}/{timestamp}.json"
+
+        try:
+            self.client.put_object(
+                Bucket=self.bucket_name,
+                Key=key,
+                Body=orjson.dumps(
+                    topology_data, default=str, option=orjson.OPT_NON_STR_KEYS
+                ),
+                ContentType="application/json",
+                ServerSideEncryption="AES256",
+            )
+
+            duration = time.time() - start_time
+            self.metrics.put_duration(
+                "S3UploadDuration",
+                duration,
+                {"Operation": "upload_full_topology"},
+            )
+
+            logger.info(
+                f"Uploaded topology to s3://{self.bucket_name}/{key}",
+                extra={"key": key, "duration": duration},
+            )
+
+            return key
+
+        except ClientError as e:
+            logger.error(f"Failed to upload topology: {e}")
+            raise StorageException(
+                f"Failed to upload topology: {e}",
+                operation="write",
+                storage_type="s3",
+            )
+
     def download_topology(
         self,
         key: str,
@@ -149,7 +217,7 @@ class S3Repository:
 
         try:
             response = self.client.get_object(Bucket=self.bucket_name, Key=key)
-            data = json.loads(response["Body"].read())
+            data = self._read_json_body(response)
 
             logger.info(
                 f"Downloaded topology from s3://{self.bucket_name}/{key}",
@@ -289,6 +357,81 @@ class S3Repository:
                 storage_type="s3",
             )
 
+    def get_latest_analysis(
+        self,
+        region: str,
+        vpc_id: str,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the latest analysis for a VPC.
+
+        Reads the ``latest.json`` pointer written by the analysis handler.
+        Falls back to listing the VPC's analysis prefix for analyses stored
+        before the pointer existed.
+
+        Args:
+            region: AWS region
+            vpc_id: VPC identifier
+
+        Returns:
+            Dictionary with "key", "data" and "last_modified", or None if
+            no analysis exists
+
+        Raises:
+            StorageException: If retrieval fails
+        """
+        if not self.client:
+            raise StorageException(
+                "S3 client not initialized",
+                storage_type="s3",
+            )
+
+        prefix = f"analyses/{region}/{vpc_id}/"
+        key = f"{prefix}latest.json"
+
+        try:
+            try:
+                response = self.client.get_object(Bucket=self.bucket_name, Key=key)
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") not in ("NoSuchKey", "404"):
+                    raise
+
+                response = None
+                paginator = self.client.get_paginator("list_objects_v2")
+                latest = None
+                for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+                    for obj in page.get("Contents", []):
+                        if (
+                            latest is None
+                            or obj["LastModified"] > latest["LastModified"]
+                        ):
+                            latest = obj
+
+                if latest is None:
+                    return None
+
+                key = latest["Key"]
+                response = self.client.get_object(Bucket=self.bucket_name, Key=key)
+
+            logger.info(
+                f"Downloaded analysis from s3://{self.bucket_name}/{key}",
+                extra={"key": key},
+            )
+
+            return {
+                "key": key,
+                "data": self._read_json_body(response),
+                "last_modified": response["LastModified"],
+            }
+
+        except ClientError as e:
+            logger.error(f"Failed to get latest analysis: {e}")
+            raise StorageException(
+                f"Failed to get latest analysis: {e}",
+                operation="read",
+                storage_type="s3",
+            )
+
     def delete_object(self, key: str) -> None:
         """
         Delete an object from S3.
@@ -366,3 +509,20 @@ class S3Repository:
                 operation="presign",
                 storage_type="s3",
             )
+
+    @staticmethod
+    def _read_json_body(response: Dict[str, Any]) -> Any:
+        """
+        Read and parse a JSON object body, decompressing zstd payloads.
+
+        Args:
+            response: S3 GetObject response
+
+        Returns:
+            Parsed JSON document
+        """
+        body = response["Body"].read()
+        encodings = response.get("ContentEncoding", "").split(",")
+        if "zstd" in (encoding.strip() for encoding in encodings):
+            body = zstandard.ZstdDecompressor().decompress(body)
+        return orjson.loads(body)
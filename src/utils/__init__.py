@@ -3,11 +3,26 @@ Utility functions and helpers for AWS Network Visualizer.
 """
 
 from src.utils.retry import retry_with_backoff, async_retry_with_backoff
-from src.utils.rate_limiter import RateLimiter, AsyncRateLimiter
+from src.utils.rate_limiter import (
+    RateLimiter,
+    AsyncRateLimiter,
+    AdaptiveRateLimiter,
+    get_service_rate_limiter,
+)
+from src.utils.async_clients import (
+    close_async_clients,
+    get_async_client,
+    get_async_session,
+)
 
 __all__ = [
     "retry_with_backoff",
     "async_retry_with_backoff",
     "RateLimiter",
     "AsyncRateLimiter",
+    "AdaptiveRateLimiter",
+    "get_service_rate_limiter",
+    "get_async_session",
+    "get_async_client",
+    "close_async_clients",
 ]
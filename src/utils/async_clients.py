@@ -0,0 +1,98 @@
+"""
+Shared aioboto3 sessions and clients.
+
+This module caches aioboto3 sessions per profile and region, and keeps one
+open async client per session, service and config for each event loop, so
+successive calls reuse the client's connection pool.
+"""
+
+import asyncio
+import weakref
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from botocore.config import Config
+
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Open clients per event loop; aiohttp connections are bound to the loop
+# that opened them, so clients are never shared across loops
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple, asyncio.Task]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@lru_cache(maxsize=None)
+def get_async_session(profile: Optional[str], region: str):
+    """
+    Get a shared aioboto3 session for a profile and region.
+
+    Args:
+        profile: AWS CLI profile name
+        region: AWS region
+
+    Returns:
+        aioboto3 session, or None if aioboto3 is not installed
+    """
+    try:
+        import aioboto3
+    except ImportError:
+        logger.warning("aioboto3 not installed, using threaded boto3 calls")
+        return None
+
+    return aioboto3.Session(profile_name=profile, region_name=region)
+
+
+async def get_async_client(session: Any, service: str, config: Config) -> Any:
+    """
+    Get the open async client for a service on the running event loop.
+
+    The first caller opens the client; concurrent callers wait for the same
+    client rather than opening their own.
+
+    Args:
+        session: aioboto3 session (from get_async_session)
+        service: Service name (e.g., 'ec2')
+        config: Botocore client config
+
+    Returns:
+        Open aioboto3 client
+
+    Raises:
+        Exception: If the client cannot be created
+    """
+    loop = asyncio.get_running_loop()
+    clients = _async_clients.setdefault(loop, {})
+    key = (session, service, config)
+
+    opening = clients.get(key)
+    if opening is None:
+        opening = loop.create_task(session.client(service, config=config).__aenter__())
+        clients[key] = opening
+
+    try:
+        return await opening
+    except Exception:
+        # Let the next caller retry instead of caching the failure
+        if clients.get(key) is opening:
+            del clients[key]
+        raise
+
+
+async def close_async_clients() -> None:
+    """
+    Close every async client opened on the running event loop.
+
+    Call before the loop is closed (e.g. at the end of asyncio.run) so the
+    clients' connections are released cleanly.
+    """
+    clients = _async_clients.pop(asyncio.get_running_loop(), {})
+    if not clients:
+        return
+
+    opened = await asyncio.gather(*clients.values(), return_exceptions=True)
+    for client in opened:
+        if not isinstance(client, BaseException):
+            await client.close()
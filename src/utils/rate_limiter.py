@@ -8,9 +8,12 @@ and implement graceful throttling.
 import asyncio
 import time
 from collections import deque
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional, Tuple
 
+from src.core.constants import AWS_API_RATE_LIMITS, DEFAULT_SERVICE_RATE_LIMIT
 from src.core.logging import get_logger
+from src.utils.retry import THROTTLING_ERROR_CODES
 
 logger = get_logger(__name__)
 
@@ -141,6 +144,206 @@ class AsyncRateLimiter:
         pass
 
 
+class AdaptiveRateLimiter(AsyncRateLimiter):
+    """
+    AIMD token bucket rate limiter for asynchronous operations.
+
+    The rate is halved whenever AWS throttles a request (additive-increase,
+    multiplicative-decrease) and grows again by a fixed step after a run of
+    successful requests, up to its ceiling. A Retry-After hint pauses all
+    acquisitions until it has passed.
+
+    Feedback comes from every request attempt a botocore client makes,
+    including its own retries (see observe_client), so the rate tracks
+    requests rather than whole API calls.
+
+    Instances are shared across event loops (see get_service_rate_limiter),
+    so acquire() does not hold an asyncio.Lock; bucket updates happen
+    between awaits and are atomic on a single event loop. Feedback may
+    arrive from worker threads; each update is a few plain assignments,
+    so a race can at most lose one success count.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        min_rate: float = 1.0,
+        increase: float = 1.0,
+        success_threshold: int = 10,
+    ):
+        """
+        Initialize adaptive rate limiter.
+
+        Args:
+            rate: Starting and maximum operations per second
+            min_rate: Lowest rate throttling can reduce to
+            increase: Operations per second added after each run of successes
+            success_threshold: Consecutive successes before the rate grows
+        """
+        super().__init__(rate=rate)
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.increase = increase
+        self.success_threshold = success_threshold
+        self._successes = 0
+        self._blocked_until = 0.0
+
+    async def acquire(self, tokens: int = 1, blocking: bool = True) -> bool:
+        """
+        Acquire tokens from the bucket asynchronously.
+
+        Args:
+            tokens: Number of tokens to acquire
+            blocking: If True, wait until tokens are available
+
+        Returns:
+            True if tokens were acquired, False otherwise
+        """
+        while True:
+            now = time.time()
+
+            if now < self._blocked_until:
+                if not blocking:
+                    return False
+                await asyncio.sleep(self._blocked_until - now)
+                continue
+
+            # Refill tokens based on elapsed time
+            elapsed = now - self.last_update
+            self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+            self.last_update = now
+
+            # Check if enough tokens available
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return True
+
+            if not blocking:
+                return False
+
+            # Wait for the deficit to refill at the current rate
+            await asyncio.sleep((tokens - self.tokens) / self.rate)
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        """
+        Reduce the rate after a throttled request.
+
+        Args:
+            retry_after: Seconds to pause before the next request, if AWS
+                sent a Retry-After hint
+        """
+        self._successes = 0
+        self.rate = max(self.min_rate, self.rate / 2)
+        self.tokens = 0.0
+
+        if retry_after:
+            self._blocked_until = max(self._blocked_until, time.time() + retry_after)
+
+        logger.warning(
+            f"Throttled, reducing rate to {self.rate:.1f} requests/second",
+            extra={"rate": self.rate, "retry_after": retry_after},
+        )
+
+    def on_success(self) -> None:
+        """
+        Record a successful request, growing the rate after enough in a row.
+        """
+        if self.rate >= self.max_rate:
+            return
+
+        self._successes += 1
+        if self._successes >= self.success_threshold:
+            self._successes = 0
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def observe_client(self, client: Any) -> None:
+        """
+        Feed the limiter from every request attempt a client makes.
+
+        Registers a needs-retry handler on the client's event system, which
+        botocore (and aiobotocore) emit after each HTTP attempt. Registering
+        the same client again has no effect.
+
+        Args:
+            client: Boto3 or aioboto3 client for the limited service
+        """
+        service_id = client.meta.service_model.service_id.hyphenize()
+        client.meta.events.register(
+            f"needs-retry.{service_id}",
+            self._on_attempt,
+            unique_id=f"adaptive-rate-limiter-{id(self)}",
+        )
+
+    def _on_attempt(
+        self,
+        response: Optional[Tuple[Any, dict]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Record the outcome of one request attempt (botocore needs-retry hook).
+
+        Args:
+            response: (HTTP response, parsed response), or None if the
+                attempt failed before a response was received
+            **kwargs: Remaining event arguments (ignored)
+
+        Returns:
+            None, so botocore's own retry decision is unchanged
+        """
+        if response is None:
+            return None
+
+        http_response, parsed = response
+        if parsed.get("Error", {}).get("Code") in THROTTLING_ERROR_CODES:
+            self.on_throttle(_retry_after(http_response.headers))
+        elif http_response.status_code < 400:
+            self.on_success()
+        return None
+
+
+def _retry_after(headers: Any) -> Optional[float]:
+    """
+    Read the Retry-After hint from a throttled response, if present.
+
+    Args:
+        headers: HTTP response headers
+
+    Returns:
+        Seconds to wait, or None if AWS sent no usable hint
+    """
+    try:
+        return float(headers["retry-after"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=None)
+def get_service_rate_limiter(region: str, service: str) -> AdaptiveRateLimiter:
+    """
+    Get the shared adaptive rate limiter for a service in a region.
+
+    AWS throttles per service and region, so every collector calling the
+    same service in a region shares one limiter. The starting rate is the
+    highest documented limit for the service in AWS_API_RATE_LIMITS.
+
+    Args:
+        region: AWS region
+        service: Service name (e.g., 'ec2')
+
+    Returns:
+        AdaptiveRateLimiter instance
+    """
+    rate = max(
+        (
+            limit
+            for api_name, limit in AWS_API_RATE_LIMITS.items()
+            if api_name.startswith(f"{service}:")
+        ),
+        default=DEFAULT_SERVICE_RATE_LIMIT,
+    )
+    return AdaptiveRateLimiter(rate=float(rate))
+
+
 class SlidingWindowRateLimiter:
     """
     Sliding window rate limiter that tracks requests in a time window.
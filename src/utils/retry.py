@@ -30,10 +30,22 @@ RETRIABLE_ERROR_CODES = {
     "ProvisionedThroughputExceededException",
     "RequestThrottledException",
     "ServiceUnavailable",
+    "ServiceUnavailableException",
+    "ModelNotReadyException",
+    "ModelStreamErrorException",
     "InternalError",
     "InternalFailure",
 }
 
+# Error codes AWS returns when a request is throttled
+THROTTLING_ERROR_CODES = {
+    "RequestLimitExceeded",
+    "Throttling",
+    "ThrottlingException",
+    "TooManyRequestsException",
+    "RequestThrottledException",
+}
+
 
 def is_retriable_error(error: Exception) -> bool:
     """
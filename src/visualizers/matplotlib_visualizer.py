@@ -3,6 +3,7 @@ Matplotlib-based visualizer for PNG and SVG output.
 """
 
 import time
+from collections import defaultdict
 from pathlib import Path
 from typing import Optional
 
@@ -218,13 +219,9 @@ class MatplotlibVisualizer(BaseVisualizer):
         }
 
         # Group nodes by level
-        nodes_by_level = {}
+        nodes_by_level = defaultdict(list)
         for node, data in self.graph.nodes(data=True):
-            resource_type = data.get("resource_type")
-            level = levels.get(resource_type, 1)
-
-            if level not in nodes_by_level:
-                nodes_by_level[level] = []
+            level = levels.get(data.get("resource_type"), 1)
             nodes_by_level[level].append(node)
 
         # Position nodes
@@ -0,0 +1,83 @@
+"""
+Unit tests for anomaly detection.
+"""
+
+import networkx as nx
+
+from src.ai_analysis.anomaly_detector import Anomaly, AnomalyDetector
+from src.graph.analyzer import GraphAnalyzer
+from src.graph.builder import NetworkGraph
+
+
+class TestAnomalyDetector:
+    """Test anomaly detector."""
+
+    def _detector(self):
+        network_graph = NetworkGraph(graph=nx.DiGraph())
+        return AnomalyDetector(
+            network_graph, GraphAnalyzer(network_graph), enable_ai=False
+        )
+
+    def test_generate_report_counts(self):
+        """Test report counts by severity and type."""
+        anomalies = [
+            Anomaly("orphaned_resource", "medium", "a", "desc a"),
+            Anomaly("orphaned_resource", "high", "b", "desc b"),
+            Anomaly("routing_anomaly", "medium", "c", "desc c"),
+            Anomaly("routing_anomaly", "unknown", "d", "desc d"),
+        ]
+
+        report = self._detector().generate_report(anomalies)
+
+        assert report["total_anomalies"] == 4
+        assert report["by_severity"] == {
+            "critical": 0,
+            "high": 1,
+            "medium": 2,
+            "low": 0,
+            "info": 0,
+        }
+        assert report["by_type"] == {"orphaned_resource": 2, "routing_anomaly": 2}
+        assert [a["title"] for a in report["anomalies"]] == ["a", "b", "c", "d"]
+
+    def test_generate_report_empty(self):
+        """Test report for no anomalies."""
+        report = self._detector().generate_report([])
+
+        assert report["total_anomalies"] == 0
+        assert set(report["by_severity"].values()) == {0}
+        assert report["by_type"] == {}
+        assert report["anomalies"] == []
+
+    def test_detect_all_anomalies_rule_based(self):
+        """Test rule-based detection results are combined in order."""
+        G = nx.DiGraph()
+        G.add_node("vpc-1", resource_type="vpc", name="Empty")
+        G.add_node(
+            "sg-1",
+            resource_type="security_group",
+            name="open",
+            data={
+                "ingress_rules": [
+                    {
+                        "ip_ranges": [{"cidr": "0.0.0.0/0"}],
+                        "from_port": 22,
+                        "to_port": 22,
+                        "ip_protocol": "tcp",
+                    }
+                ]
+            },
+        )
+        network_graph = NetworkGraph(graph=G)
+        detector = AnomalyDetector(
+            network_graph, GraphAnalyzer(network_graph), enable_ai=False
+        )
+
+        anomalies = detector.detect_all_anomalies()
+
+        assert [a.anomaly_type for a in anomalies] == [
+            "security_group_misconfiguration",
+            "orphaned_resource",
+            "orphaned_resource",
+            "network_segmentation_violation",
+        ]
@@ -0,0 +1,58 @@
+"""
+Unit tests for shared async AWS clients.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from src.utils.async_clients import close_async_clients, get_async_client
+
+
+def make_session() -> MagicMock:
+    """Create a fake aioboto3 session whose clients open asynchronously."""
+    session = MagicMock()
+
+    def client(service, config=None):
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(side_effect=lambda: MagicMock(close=AsyncMock()))
+        return context
+
+    session.client.side_effect = client
+    return session
+
+
+class TestAsyncClients:
+    """Test per-loop async client reuse."""
+
+    def test_client_is_reused_on_a_loop(self):
+        """Test concurrent and later callers on one loop share a client."""
+        session = make_session()
+        config = object()
+
+        async def run():
+            first, second = await asyncio.gather(
+                get_async_client(session, "ec2", config),
+                get_async_client(session, "ec2", config),
+            )
+            third = await get_async_client(session, "ec2", config)
+            await close_async_clients()
+            return first, second, third
+
+        first, second, third = asyncio.run(run())
+
+        assert first is second is third
+        assert session.client.call_count == 1
+        first.close.assert_awaited_once()
+
+    def test_each_loop_gets_its_own_client(self):
+        """Test clients are not shared across event loops."""
+        session = make_session()
+        config = object()
+
+        async def run():
+            client = await get_async_client(session, "ec2", config)
+            await close_async_clients()
+            return client
+
+        assert asyncio.run(run()) is not asyncio.run(run())
+        assert session.client.call_count == 2
@@ -0,0 +1,276 @@
+"""
+Unit tests for the Bedrock client.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.ai_analysis import bedrock_client
+from src.ai_analysis.bedrock_client import BedrockClient
+from src.utils.async_clients import close_async_clients
+
+
+def make_client() -> BedrockClient:
+    """Create a BedrockClient with mocked runtime client and metrics."""
+    with mock.patch.object(bedrock_client, "_get_runtime_client"), mock.patch.object(
+        bedrock_client, "get_metrics_publisher"
+    ):
+        return BedrockClient()
+
+
+class TestPromptCaching:
+    """Test prompt caching model detection."""
+
+    @pytest.mark.parametrize(
+        "model_id",
+        [
+            "anthropic.claude-3-7-sonnet-20250219-v1:0",
+            "us.anthropic.claude-3-7-sonnet-20250219-v1:0",
+            "global.anthropic.claude-sonnet-4-20250514-v1:0",
+            "anthropic.claude-3-5-haiku-20241022-v1:0",
+        ],
+    )
+    def test_supported_models(self, model_id):
+        """Test cache-capable models, with and without profile prefixes."""
+        assert bedrock_client.supports_prompt_caching(model_id)
+
+    @pytest.mark.parametrize(
+        "model_id",
+        [
+            "anthropic.claude-3-5-sonnet-20241022-v2:0",
+            "anthropic.claude-3-haiku-20240307-v1:0",
+            "amazon.titan-text-express-v1",
+        ],
+    )
+    def test_unsupported_models(self, model_id):
+        """Test models that must not receive cache checkpoints."""
+        assert not bedrock_client.supports_prompt_caching(model_id)
+
+
+class TestResponseCache:
+    """Test the in-process analysis cache."""
+
+    def _client(self):
+        client = make_client()
+        client.invoke_model = mock.Mock(return_value={"text": '[{"title": "x"}]'})
+        return client
+
+    def setup_method(self):
+        bedrock_client._response_cache.clear()
+        bedrock_client._inflight.clear()
+
+    def test_identical_topology_is_cached(self):
+        """Test a repeated analysis does not invoke the model again."""
+        client = self._client()
+
+        first = client.analyze_network_topology({"b": 1, "a": 2})
+        second = client.analyze_network_topology({"a": 2, "b": 1})
+
+        assert first["findings"] == [{"title": "x"}]
+        assert second == first
+        assert client.invoke_model.call_count == 1
+
+    def test_cached_result_is_not_shared(self):
+        """Test modifying a returned analysis does not change later cache hits."""
+        client = self._client()
+
+        first = client.analyze_network_topology({"a": 1})
+        first["findings"].append({"title": "added by caller"})
+        second = client.analyze_network_topology({"a": 1})
+
+        assert second["findings"] == [{"title": "x"}]
+        assert client.invoke_model.call_count == 1
+
+    def test_different_topology_is_not_cached(self):
+        """Test a changed topology invokes the model."""
+        client = self._client()
+
+        client.analyze_network_topology({"a": 1})
+        client.analyze_network_topology({"a": 2})
+
+        assert client.invoke_model.call_count == 2
+
+    def test_unparseable_response_is_not_cached(self):
+        """Test responses without valid JSON are retried."""
+        client = self._client()
+        client.invoke_model.return_value = {"text": "not json"}
+
+        client.analyze_network_topology({"a": 1})
+        client.analyze_network_topology({"a": 1})
+
+        assert client.invoke_model.call_count == 2
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            '[{"title": "x"}]',
+            'Findings:\n```json\n[{"title": "x"}]\n```\nDone.',
+            'Findings:\n```\n[{"title": "x"}]\n```',
+        ],
+    )
+    def test_fenced_json_is_extracted(self, text):
+        """Test findings are parsed with or without a markdown fence."""
+        client = self._client()
+        client.invoke_model.return_value = {"text": text}
+
+        result = client.analyze_network_topology({"a": 1})
+
+        assert result["findings"] == [{"title": "x"}]
+
+    def test_concurrent_identical_requests_are_coalesced(self):
+        """Test concurrent analyses of one topology share a model call."""
+        client = self._client()
+        release = threading.Event()
+
+        def slow_invoke(**kwargs):
+            release.wait(timeout=5)
+            return {"text": '[{"title": "x"}]'}
+
+        client.invoke_model.side_effect = slow_invoke
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [
+                pool.submit(client.analyze_network_topology, {"a": 1}) for _ in range(4)
+            ]
+            time.sleep(0.1)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert client.invoke_model.call_count == 1
+        assert all(result == results[0] for result in results)
+
+    def test_batched_analysis_is_split_by_type(self):
+        """Test an "all" analysis is split into per-type findings."""
+        client = self._client()
+        client.invoke_model.return_value = {
+            "text": '{"security": [{"title": "sg"}], "cost": [{"title": "idle"}]}'
+        }
+
+        result = client.analyze_network_topology({"a": 1}, analysis_type="all")
+
+        assert result["findings_by_type"] == {
+            "security": [{"title": "sg"}],
+            "cost": [{"title": "idle"}],
+            "compliance": [],
+        }
+        assert result["findings"] == [{"title": "sg"}, {"title": "idle"}]
+        assert client.invoke_model.call_args.kwargs["max_tokens"] == 8192
+
+    def test_trivial_topology_skips_model(self):
+        """Test topologies below the node threshold are not sent to Bedrock."""
+        client = self._client()
+
+        result = client.analyze_network_topology({"nodes": [{"id": "vpc-1"}]})
+
+        assert result["findings"] == []
+        assert result["short_circuit"] is True
+        client.invoke_model.assert_not_called()
+
+
+class TestInvokeModelStream:
+    """Test streamed model invocation."""
+
+    def _client(self, messages):
+        client = make_client()
+        client.client.invoke_model_with_response_stream.return_value = {
+            "body": [
+                {"chunk": {"bytes": json.dumps(message).encode()}}
+                for message in messages
+            ]
+        }
+        return client
+
+    def test_stream_yields_deltas_and_usage(self):
+        """Test text deltas are yielded and usage is collected."""
+        client = self._client(
+            [
+                {"type": "message_start", "message": {"usage": {"input_tokens": 10}}},
+                {"type": "content_block_delta", "delta": {"text": "Hello"}},
+                {"type": "content_block_delta", "delta": {"text": ", world"}},
+                {"type": "message_delta", "usage": {"output_tokens": 3}},
+                {"type": "message_stop"},
+            ]
+        )
+
+        assert list(client.invoke_model_stream("prompt")) == ["Hello", ", world"]
+
+        response = client.invoke_model("prompt")
+        assert response["text"] == "Hello, world"
+        assert response["input_tokens"] == 10
+        assert response["output_tokens"] == 3
+
+    def test_throttled_stream_is_retried(self):
+        """Test a throttled request is retried before streaming starts."""
+        client = self._client(
+            [{"type": "content_block_delta", "delta": {"text": "ok"}}]
+        )
+        stream_response = client.client.invoke_model_with_response_stream.return_value
+        throttled = ClientError(
+            {"Error": {"Code": "ThrottlingException", "Message": "slow down"}},
+            "InvokeModelWithResponseStream",
+        )
+        client.client.invoke_model_with_response_stream.side_effect = [
+            throttled,
+            stream_response,
+        ]
+
+        with mock.patch("src.utils.retry.time.sleep"):
+            response = client.invoke_model("prompt")
+
+        assert response["text"] == "ok"
+        assert client.client.invoke_model_with_response_stream.call_count == 2
+
+    def test_threaded_invoke_runs_off_the_event_loop(self):
+        """Test ainvoke_model_threaded runs invoke_model on the pool."""
+        client = self._client(
+            [{"type": "content_block_delta", "delta": {"text": "ok"}}]
+        )
+        threads = []
+        invoke_model = client.invoke_model
+
+        def record_thread(*args, **kwargs):
+            threads.append(threading.current_thread().name)
+            return invoke_model(*args, **kwargs)
+
+        client.invoke_model = record_thread
+
+        response = asyncio.run(client.ainvoke_model_threaded("prompt"))
+        client.close()
+
+        assert response["text"] == "ok"
+        assert threads[0].startswith("bedrock")
+
+    def test_async_invocations_share_a_client(self):
+        """Test ainvoke_model reuses one aioboto3 client on an event loop."""
+        client = make_client()
+        body = mock.Mock(
+            read=mock.AsyncMock(return_value=b'{"content": [{"text": "ok"}]}')
+        )
+        runtime = mock.MagicMock(close=mock.AsyncMock())
+        runtime.invoke_model = mock.AsyncMock(return_value={"body": body})
+        session = mock.MagicMock()
+        session.client.return_value.__aenter__ = mock.AsyncMock(return_value=runtime)
+
+        async def run():
+            responses = [
+                await client.ainvoke_model("prompt"),
+                await client.ainvoke_model("prompt"),
+            ]
+            await close_async_clients()
+            return responses
+
+        with mock.patch.object(
+            bedrock_client, "get_async_session", return_value=session
+        ):
+            responses = asyncio.run(run())
+
+        assert [response["text"] for response in responses] == ["ok", "ok"]
+        assert session.client.call_count == 1
+        assert runtime.invoke_model.await_count == 2
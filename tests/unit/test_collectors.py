@@ -8,6 +8,7 @@ from unittest.mock import Mock, patch, AsyncMock
 from src.collectors.vpc_collector import VPCCollector
 from src.collectors.subnet_collector import SubnetCollector
 from src.collectors.ec2_collector import EC2Collector
+from src.collectors.security_group_collector import SecurityGroupCollector
 from src.core.constants import ResourceType
 
 
@@ -90,3 +91,93 @@ class TestEC2Collector:
             assert resources[0]["id"] == "i-test789"
             assert resources[0]["instance_type"] == "t2.micro"
             assert resources[0]["state"] == "running"
+            assert "raw" not in resources[0]
+
+    @pytest.mark.asyncio
+    async def test_collect_resources_include_raw(self, mock_aws, mock_instance_data):
+        """Test the raw API response is kept only when requested."""
+        collector = EC2Collector(region="us-east-1", include_raw=True)
+
+        reservations = [{"Instances": [mock_instance_data]}]
+
+        with patch.object(collector, "_paginated_call", return_value=reservations):
+            resources = await collector.collect_resources()
+
+            assert resources[0]["raw"] is mock_instance_data
+
+
+class TestBaseCollector:
+    """Test shared collector functionality."""
+
+    def test_collectors_share_session_and_client(self, mock_aws):
+        """Test collectors for one profile and region reuse the session and client."""
+        vpc_collector = VPCCollector(region="us-east-1")
+        subnet_collector = SubnetCollector(region="us-east-1")
+
+        assert vpc_collector.session is subnet_collector.session
+        assert vpc_collector.get_client() is subnet_collector.get_client()
+        assert vpc_collector.get_client() is not VPCCollector(region="us-west-2").get_client()
+
+    @pytest.mark.asyncio
+    async def test_streaming_collector_with_sink(self, mock_aws):
+        """Test resources streamed to a sink are counted but not kept."""
+        collector = SecurityGroupCollector(region="us-east-1")
+        streamed = []
+
+        async def sink(resource):
+            streamed.append(resource)
+
+        result = await collector.collect(sink=sink)
+
+        assert result.success
+        assert result.count == len(streamed) > 0
+        assert result.resources == []
+        assert streamed[0]["resource_type"] == ResourceType.SECURITY_GROUP.value
+
+    @pytest.mark.asyncio
+    async def test_streaming_collector_without_sink(self, mock_aws):
+        """Test streamed resources are accumulated when no sink is given."""
+        collector = SecurityGroupCollector(region="us-east-1")
+
+        result = await collector.collect()
+
+        assert result.count == len(result.resources) > 0
+
+    def test_tags_and_name(self, mock_aws):
+        """Test tags are extracted and the Name tag found in one pass."""
+        collector = VPCCollector(region="us-east-1")
+
+        tags, name = collector._tags_and_name(
+            [{"Key": "Env", "Value": "prod"}, {"Key": "Name", "Value": "core"}]
+        )
+
+        assert tags == {"Env": "prod", "Name": "core"}
+        assert name == "core"
+        assert collector._tags_and_name(None) == ({}, "")
+
+    @pytest.mark.asyncio
+    async def test_paginated_call_flattens_every_page(self, mock_aws):
+        """Test resources from every page are returned in order."""
+        collector = VPCCollector(region="us-east-1")
+        pages = [
+            {"Vpcs": [{"VpcId": "vpc-1"}, {"VpcId": "vpc-2"}]},
+            {},
+            {"Vpcs": [{"VpcId": "vpc-3"}]},
+        ]
+        paginator = Mock()
+        paginator.paginate.return_value = iter(pages)
+
+        acquire = AsyncMock()
+
+        with patch(
+            "src.collectors.base._get_paginator", return_value=paginator
+        ), patch.object(collector.api_rate_limiter, "acquire", acquire):
+            vpcs = await collector._paginated_call(
+                client=collector.get_client(),
+                method_name="describe_vpcs",
+                result_key="Vpcs",
+            )
+
+        assert [vpc["VpcId"] for vpc in vpcs] == ["vpc-1", "vpc-2", "vpc-3"]
+        # The shared limiter is acquired before every page request
+        assert acquire.await_count >= len(pages)
@@ -3,6 +3,7 @@ Unit tests for exception module.
 """
 
 import pytest
+from botocore.exceptions import ClientError
 
 from src.core.exceptions import (
     NetworkVisualizerException,
@@ -45,6 +46,25 @@ class TestExceptions:
         assert "vpc" in exc.details["resource_type"]
         assert "vpc-123" in exc.details["resource_id"]
 
+    def test_collector_exception_from_client_error(self):
+        """Test collector exception built from a botocore ClientError."""
+        error = ClientError(
+            {"Error": {"Code": "UnauthorizedOperation", "Message": "denied"}},
+            "DescribeVpcs",
+        )
+
+        exc = CollectorException.from_client_error(
+            error, api_name="ec2:describe_vpcs", resource_type="vpc"
+        )
+
+        assert exc.error_code == "COLLECTOR_ERROR"
+        assert exc.details == {
+            "api_name": "ec2:describe_vpcs",
+            "error_code": "UnauthorizedOperation",
+            "resource_type": "vpc",
+        }
+        assert "denied" in str(exc)
+
     def test_storage_exception(self):
         """Test storage exception."""
         exc = StorageException(
@@ -2,6 +2,9 @@
 Unit tests for graph engine.
 """
 
+import io
+import json
+
 import pytest
 import networkx as nx
 
@@ -90,6 +93,59 @@ class TestGraphBuilder:
         assert graph.edge_count == 1
         assert graph.graph.has_edge("vpc-123", "subnet-456")
 
+    def test_write_json_matches_export_to_dict(self):
+        """Test streamed JSON export matches the dictionary export."""
+        builder = GraphBuilder()
+
+        G = nx.DiGraph()
+        G.add_node("vpc-1", resource_type="vpc", name="TestVPC", region="us-east-1")
+        G.add_node("subnet-1", resource_type="subnet", vpc_id="vpc-1")
+        G.add_node("vpc-2", resource_type="vpc")
+        G.add_edge("vpc-1", "subnet-1", relationship="contains", label="contains")
+
+        network_graph = NetworkGraph(graph=G, resource_counts={"vpc": 2, "subnet": 1})
+
+        buffer = io.BytesIO()
+        builder.write_json(network_graph, buffer)
+
+        assert json.loads(buffer.getvalue()) == builder.export_to_dict(network_graph)
+
+    def test_write_json_empty_graph(self):
+        """Test streamed JSON export of an empty graph."""
+        builder = GraphBuilder()
+        network_graph = NetworkGraph(graph=nx.DiGraph())
+
+        buffer = io.BytesIO()
+        builder.write_json(network_graph, buffer)
+
+        assert json.loads(buffer.getvalue()) == builder.export_to_dict(network_graph)
+
+    def test_from_dict_round_trip(self):
+        """Test rebuilding a graph from its dictionary export."""
+        builder = GraphBuilder()
+
+        G = nx.DiGraph()
+        G.add_node("vpc-1", resource_type="vpc", name="TestVPC", region="us-east-1")
+        G.add_node(
+            "sg-1",
+            resource_type="security_group",
+            ingress_rules=[{"ip_ranges": [{"cidr": "0.0.0.0/0"}], "from_port": 22}],
+        )
+        G.add_edge("vpc-1", "sg-1", relationship="contains", label="contains")
+
+        exported = builder.export_to_dict(
+            NetworkGraph(graph=G, resource_counts={"vpc": 1, "security_group": 1})
+        )
+        restored = builder.from_dict(exported)
+
+        assert restored.node_count == 2
+        assert restored.edge_count == 1
+        assert restored.resource_counts == {"vpc": 1, "security_group": 1}
+        assert builder.export_to_dict(restored) == exported
+
+        security = GraphAnalyzer(restored).analyze_security_posture()
+        assert security["issues_found"] == 1
+
 
 class TestGraphAnalyzer:
     """Test graph analyzer."""
@@ -109,6 +165,17 @@ class TestGraphAnalyzer:
 
         assert metrics["total_nodes"] == 2
         assert metrics["total_edges"] == 1
+        assert metrics["is_connected"] is True
+
+    def test_basic_metrics_empty_graph(self):
+        """Test basic metrics of an empty graph."""
+        analyzer = GraphAnalyzer(NetworkGraph(graph=nx.DiGraph()))
+
+        metrics = analyzer.get_basic_metrics()
+
+        assert metrics["total_nodes"] == 0
+        assert metrics["is_connected"] is False
+        assert analyzer.analyze_connectivity()["component_count"] == 0
 
     def test_find_isolated_resources(self):
         """Test finding isolated resources."""
@@ -156,3 +223,20 @@ class TestGraphAnalyzer:
             issue["issue_type"] == "overly_permissive_ingress"
             for issue in security["issues"]
         )
+
+    def test_centrality_metrics_match_networkx(self):
+        """Test centrality metrics match the NetworkX reference values."""
+        G = nx.gnp_random_graph(30, 0.08, directed=True, seed=42)
+        G = nx.relabel_nodes(G, {i: f"node-{i}" for i in G})
+
+        analyzer = GraphAnalyzer(NetworkGraph(graph=G))
+        centrality = analyzer.get_centrality_metrics()
+
+        expected = {
+            "degree_centrality": nx.degree_centrality(G),
+            "betweenness_centrality": nx.betweenness_centrality(G),
+            "closeness_centrality": nx.closeness_centrality(G),
+        }
+        for metric, values in expected.items():
+            for node_id, value in values.items():
+                assert centrality[metric][node_id] == pytest.approx(value)
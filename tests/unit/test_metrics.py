@@ -0,0 +1,100 @@
+"""
+Unit tests for CloudWatch metrics publishing.
+"""
+
+from datetime import datetime
+from unittest import mock
+
+from src.observability import metrics
+from src.observability.metrics import MetricsPublisher
+
+
+def make_publisher() -> MetricsPublisher:
+    """Create an enabled MetricsPublisher with a mocked CloudWatch client."""
+    with mock.patch.object(metrics, "boto3"):
+        publisher = MetricsPublisher()
+    publisher.enabled = True
+    publisher._client = mock.Mock()
+    return publisher
+
+
+class TestMetricsPublisher:
+    """Test metric buffering and aggregation."""
+
+    def test_repeated_datapoints_are_aggregated(self):
+        """Test identical metrics are sent as one datum with counts."""
+        publisher = make_publisher()
+
+        for _ in range(5):
+            publisher.increment("APICallCount", {"APIName": "ec2:DescribeVpcs"})
+        publisher.put_count("APICallCount", 3, {"APIName": "ec2:DescribeVpcs"})
+        publisher.increment("APICallCount", {"APIName": "ec2:DescribeSubnets"})
+        publisher.flush()
+
+        publisher._client.put_metric_data.assert_called_once()
+        data = publisher._client.put_metric_data.call_args.kwargs["MetricData"]
+        assert len(data) == 2
+        assert data[0]["Values"] == [1.0, 3.0]
+        assert data[0]["Counts"] == [5.0, 1.0]
+
+    def test_buffer_flushes_when_interval_elapses(self):
+        """Test the buffer is sent once the flush interval has passed."""
+        publisher = make_publisher()
+        publisher._flush_interval = 0.0
+
+        publisher.increment("ErrorCount")
+
+        publisher._client.put_metric_data.assert_called_once()
+
+    def test_undated_values_are_bucketed_by_minute(self):
+        """Test values recorded in a later minute are not back-dated."""
+        publisher = make_publisher()
+        times = [
+            datetime(2024, 1, 1, 12, 0, 5),
+            datetime(2024, 1, 1, 12, 0, 50),
+            datetime(2024, 1, 1, 12, 7, 30),
+        ]
+
+        with mock.patch.object(metrics, "datetime") as mock_datetime:
+            mock_datetime.utcnow.side_effect = times
+            for _ in times:
+                publisher.increment("ErrorCount")
+        publisher.flush()
+
+        data = publisher._client.put_metric_data.call_args.kwargs["MetricData"]
+        assert [d["Timestamp"] for d in data] == [
+            datetime(2024, 1, 1, 12, 0),
+            datetime(2024, 1, 1, 12, 7),
+        ]
+        assert [d["Counts"] for d in data] == [[2.0], [1.0]]
+
+    def test_flush_metrics_flushes_global_publisher(self):
+        """Test flush_metrics sends the shared publisher's buffer."""
+        publisher = make_publisher()
+        publisher.increment("ErrorCount")
+
+        with mock.patch.object(
+            metrics, "get_metrics_publisher", wraps=lambda: publisher
+        ) as mock_get:
+            mock_get.cache_info = mock.Mock(return_value=mock.Mock(currsize=1))
+            metrics.flush_metrics()
+
+        publisher._client.put_metric_data.assert_called_once()
+
+    def test_no_exit_flush_by_default(self):
+        """Test the shared publisher registers no atexit flush unless enabled."""
+        with mock.patch.object(metrics, "boto3"), mock.patch.object(
+            metrics.atexit, "register"
+        ) as register:
+            metrics.get_metrics_publisher.__wrapped__()
+
+        register.assert_not_called()
+
+    def test_exit_flush_skips_empty_buffer(self):
+        """Test the exit-time flush does nothing when the buffer is empty."""
+        publisher = make_publisher()
+
+        with mock.patch.object(publisher, "flush") as flush:
+            metrics._flush_at_exit(publisher)
+
+        flush.assert_not_called()
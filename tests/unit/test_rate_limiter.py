@@ -0,0 +1,104 @@
+"""
+Unit tests for rate limiters.
+"""
+
+import asyncio
+from unittest.mock import Mock
+
+import boto3
+
+from src.utils import AdaptiveRateLimiter, get_service_rate_limiter
+
+
+def make_attempt(status_code, error_code=None, headers=None):
+    """Create a botocore (HTTP response, parsed response) attempt result."""
+    http_response = Mock(status_code=status_code, headers=headers or {})
+    parsed = {"Error": {"Code": error_code}} if error_code else {}
+    return http_response, parsed
+
+
+class TestAdaptiveRateLimiter:
+    """Test AIMD rate adjustment."""
+
+    def test_throttle_halves_rate_down_to_minimum(self):
+        """Test each throttle halves the rate, never below min_rate."""
+        limiter = AdaptiveRateLimiter(rate=8.0, min_rate=2.0)
+
+        limiter.on_throttle()
+        assert limiter.rate == 4.0
+
+        limiter.on_throttle()
+        limiter.on_throttle()
+        assert limiter.rate == 2.0
+
+    def test_successes_grow_rate_up_to_ceiling(self):
+        """Test the rate grows after a run of successes, capped at the start rate."""
+        limiter = AdaptiveRateLimiter(rate=4.0, increase=1.0, success_threshold=3)
+        limiter.on_throttle()
+
+        for _ in range(3):
+            limiter.on_success()
+        assert limiter.rate == 3.0
+
+        for _ in range(30):
+            limiter.on_success()
+        assert limiter.rate == 4.0
+
+    def test_retry_after_blocks_acquire(self):
+        """Test a Retry-After hint pauses acquisition."""
+        limiter = AdaptiveRateLimiter(rate=100.0)
+
+        limiter.on_throttle(retry_after=60)
+
+        assert asyncio.run(limiter.acquire(blocking=False)) is False
+
+    def test_limiter_is_shared_per_service_and_region(self):
+        """Test collectors of one service and region share a limiter."""
+        ec2_east = get_service_rate_limiter("us-east-1", "ec2")
+        ec2_west = get_service_rate_limiter("us-west-2", "ec2")
+
+        assert get_service_rate_limiter("us-east-1", "ec2") is ec2_east
+        assert ec2_east is not ec2_west
+
+    def test_every_attempt_feeds_the_limiter(self):
+        """Test throttled attempts slow the limiter and successful ones grow it."""
+        limiter = AdaptiveRateLimiter(rate=4.0, increase=1.0, success_threshold=1)
+
+        limiter._on_attempt(response=make_attempt(400, "Throttling"))
+        assert limiter.rate == 2.0
+
+        limiter._on_attempt(response=make_attempt(200))
+        assert limiter.rate == 3.0
+
+        # Other errors and connection failures leave the rate unchanged
+        limiter._on_attempt(response=make_attempt(400, "InvalidParameterValue"))
+        limiter._on_attempt(response=None, caught_exception=ConnectionError())
+        assert limiter.rate == 3.0
+
+    def test_retry_after_header_is_honoured(self):
+        """Test a throttled attempt's Retry-After header pauses acquisition."""
+        limiter = AdaptiveRateLimiter(rate=100.0)
+
+        limiter._on_attempt(
+            response=make_attempt(429, "ThrottlingException", {"retry-after": "60"})
+        )
+
+        assert asyncio.run(limiter.acquire(blocking=False)) is False
+
+    def test_observe_client_hooks_each_attempt(self):
+        """Test the limiter sees attempts emitted by an observed client."""
+        limiter = AdaptiveRateLimiter(rate=4.0)
+        client = boto3.client("ec2", region_name="us-east-1")
+
+        limiter.observe_client(client)
+        limiter.observe_client(client)
+        client.meta.events.emit(
+            "needs-retry.ec2.DescribeVpcs",
+            response=make_attempt(400, "RequestLimitExceeded"),
+            attempts=1,
+            caught_exception=None,
+            request_dict={"context": {}},
+            operation=client.meta.service_model.operation_model("DescribeVpcs"),
+        )
+
+        assert limiter.rate == 2.0